@@ -0,0 +1,111 @@
+"""
+Benchmark dos backends de leitura Excel (extractor.leitor_excel).
+
+Gera um Rel_sem_tratar sintético, lê o arquivo com openpyxl e com calamine
+(leitura via DataFrame e leitura em streaming) e verifica que os objetos
+Pendencia gerados são os mesmos nos dois backends.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_backends_excel.py [linhas]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+from openpyxl import Workbook
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from extractor.cache_leitura import configurar_cache
+from extractor.leitor_excel import BACKENDS, configurar_backend, obter_backend
+from extractor.rel_sem_tratar_reader import (
+    extrair_novas_transacoes_rel_sem_tratar,
+    iterar_novas_transacoes_rel_sem_tratar
+)
+
+
+def gerar_rel_sem_tratar(caminho: str, linhas: int) -> None:
+    """
+    Grava um Rel_sem_tratar sintético (título na linha 1, header na linha 2).
+
+    Inclui números inteiros e decimais, datas sem hora, textos em numeração
+    americana e células vazias, que são os casos em que os backends diferem.
+    """
+    gerador = np.random.default_rng(0)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(['Relatório sem tratar'])
+    ws.append(['STATUS', 'UNIDADE_NEGOCIO', 'EMPRESA', 'NOME_BANCO', 'NOME_CONTA', 'DATA_EXTRATO',
+               'NUMERO_CONTA', 'INFORMACAO_ADICIONAL', 'NUMERO_EXTRATO', 'TIPO_TRANSACAO', 'VALOR'])
+    for indice in range(linhas):
+        data = datetime(2024, 1, 1) + timedelta(days=int(gerador.integers(0, 365)))
+        valor = round(float(gerador.uniform(-10000, 10000)), 2)
+        ws.append([
+            'Não Reconciliada',
+            'UN1',
+            'EMPRESA A' if indice % 2 else 'EMPRESA B',
+            'ITAU' if indice % 3 else 'BRADESCO',
+            f'CONTA {indice % 40}',
+            data.date() if indice % 5 else data.strftime('%d/%m/%Y'),
+            int(gerador.integers(10000, 99999)) if indice % 7 else None,
+            f'PIX {gerador.integers(0, 5000)}',
+            str(gerador.integers(1, 500)),
+            'Débito' if valor < 0 else 'Crédito',
+            f'{valor:,.2f}' if indice % 11 == 0 else (int(valor) if indice % 13 == 0 else valor)
+        ])
+    wb.save(caminho)
+
+
+def medir(funcao, *argumentos, repeticoes: int = 3):
+    """
+    Executa a função algumas vezes e devolve (melhor tempo em segundos, último resultado).
+    """
+    melhor = float('inf')
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao(*argumentos)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def ler_streaming(caminho: str) -> list:
+    """
+    Leitura em streaming materializada em lista.
+    """
+    return list(iterar_novas_transacoes_rel_sem_tratar(caminho))
+
+
+def main():
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    configurar_cache(ativo=False)
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, 'Rel_sem_tratar.xlsx')
+        gerar_rel_sem_tratar(caminho, linhas)
+
+        resultados = {}
+        print(f"Linhas: {linhas}")
+        for backend in BACKENDS:
+            configurar_backend(backend)
+            if obter_backend() != backend:
+                print(f"{backend}: não disponível")
+                continue
+
+            tempo_dataframe, via_dataframe = medir(extrair_novas_transacoes_rel_sem_tratar, caminho)
+            tempo_streaming, via_streaming = medir(ler_streaming, caminho)
+            resultados[backend] = [pendencia.to_dict() for pendencia in via_dataframe]
+
+            iguais = resultados[backend] == [pendencia.to_dict() for pendencia in via_streaming]
+            print(f"{backend}: DataFrame {tempo_dataframe:.3f}s, streaming {tempo_streaming:.3f}s "
+                  f"(streaming igual ao DataFrame: {iguais})")
+
+        if len(resultados) == len(BACKENDS):
+            print(f"Resultado igual entre backends: {resultados[BACKENDS[0]] == resultados[BACKENDS[1]]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark da chave de reconciliação (entities.pendencia).
+
+Compara a chave em texto original (Pendencia.get_chave_reconciliacao,
+VALOR + INFORMACAO_ADICIONAL + NOME_CONTA concatenados a cada chamada) com a
+chave em tupla calculada uma vez e guardada na pendência
+(Pendencia.chave_reconciliacao):
+
+- custo de montar o índice das pendências existentes e de buscar as novas
+  transações nele (três usos da chave por linha, como na conciliação);
+- falsas correspondências: pendências diferentes com a mesma chave.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_chave_reconciliacao.py [linhas]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from entities.pendencia import Pendencia
+
+
+def gerar_pendencias(linhas: int, semente: int) -> list:
+    """
+    Gera pendências sintéticas com contas e descrições repetidas.
+    """
+    gerador = np.random.default_rng(semente)
+    valores = np.round(gerador.uniform(1, 5000, linhas), 2).tolist()
+    informacoes = gerador.integers(0, 2000, linhas).tolist()
+    contas = gerador.integers(0, 40, linhas).tolist()
+    return [
+        Pendencia(VALOR=valor, INFORMACAO_ADICIONAL=f'PIX {informacao}', NOME_CONTA=f'CONTA {conta}')
+        for valor, informacao, conta in zip(valores, informacoes, contas)
+    ]
+
+
+def conciliar(existentes: list, novas: list, chave) -> int:
+    """
+    Monta o índice das existentes, busca as novas e conta as chaves distintas (três usos por linha).
+    """
+    indice = {}
+    for pendencia in existentes:
+        indice.setdefault(chave(pendencia), []).append(pendencia)
+
+    correspondencias = sum(1 for pendencia in novas if chave(pendencia) in indice)
+    distintas = len({chave(pendencia) for pendencia in existentes})
+    return correspondencias + distintas
+
+
+def medir(funcao, *argumentos) -> float:
+    """
+    Tempo de uma execução da função, em segundos.
+    """
+    inicio = time.perf_counter()
+    funcao(*argumentos)
+    return time.perf_counter() - inicio
+
+
+def falsas_correspondencias() -> None:
+    """
+    Pendências diferentes cujas chaves em texto coincidem.
+    """
+    pares = [
+        (Pendencia(VALOR=1.0, INFORMACAO_ADICIONAL='AB', NOME_CONTA='C'),
+         Pendencia(VALOR=1.0, INFORMACAO_ADICIONAL='A', NOME_CONTA='BC')),
+        (Pendencia(VALOR=1.0, INFORMACAO_ADICIONAL='5X', NOME_CONTA='C'),
+         Pendencia(VALOR=1.05, INFORMACAO_ADICIONAL='X', NOME_CONTA='C')),
+        (Pendencia(VALOR=1.0, INFORMACAO_ADICIONAL='23', NOME_CONTA='C'),
+         Pendencia(VALOR=1.02, INFORMACAO_ADICIONAL='3', NOME_CONTA='C'))
+    ]
+    texto = sum(1 for a, b in pares if a.get_chave_reconciliacao() == b.get_chave_reconciliacao())
+    tupla = sum(1 for a, b in pares if a.chave_reconciliacao == b.chave_reconciliacao)
+    print(f"Falsas correspondências em {len(pares)} pares distintos: texto {texto}, tupla {tupla}")
+
+
+def main():
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    existentes = gerar_pendencias(linhas, 0)
+    novas = gerar_pendencias(linhas, 1)
+
+    tempo_texto = medir(conciliar, existentes, novas, Pendencia.get_chave_reconciliacao)
+    # Primeira execução calcula e guarda as chaves; a segunda só as reutiliza
+    tempo_tupla = medir(conciliar, existentes, novas, lambda pendencia: pendencia.chave_reconciliacao)
+    tempo_tupla_cache = medir(conciliar, existentes, novas, lambda pendencia: pendencia.chave_reconciliacao)
+
+    print(f"Linhas: {linhas} existentes + {linhas} novas")
+    print(f"chave em texto: {tempo_texto:.3f}s")
+    print(f"chave em tupla (calculada na 1ª vez): {tempo_tupla:.3f}s")
+    print(f"chave em tupla (já calculada): {tempo_tupla_cache:.3f}s ({tempo_texto / tempo_tupla_cache:.1f}x)")
+    falsas_correspondencias()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark da consolidação paralela (ConciliacaoService.consolidar_pendencias_paralelo).
+
+Para cada motor e volume, mede a consolidação em série e a consolidação
+dividida por NOME_CONTA em 2 processos (sempre pelo pool, sem os limites
+de consolidar_pendencias_paralelo), e separa o tempo do pool em:
+
+- trabalho dos processos: desserializar a fatia, consolidá-la e serializar
+  o resultado (medido no próprio processo, fatia a fatia);
+- custo no processo principal: divisão das entradas, envio das fatias,
+  recebimento e reordenação dos resultados (tempo do pool - trabalho dos
+  processos, com um único núcleo).
+
+Com N núcleos o tempo estimado é custo no processo principal + trabalho
+dos processos / N. O número de processos a partir do qual a estimativa
+fica abaixo do tempo em série orienta PROCESSOS_MINIMOS_CONSOLIDACAO e
+LINHAS_MINIMAS_POR_PROCESSO (services.conciliacao_service).
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_consolidacao_paralela.py [transacoes ...]
+"""
+import os
+import pickle
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from entities.pendencia_tabela import PendenciaTabela
+from extractor.depara_reader import carregar_depara
+from services.calendario_dias_uteis import CalendarioDiasUteis
+from services.conciliacao_service import ConciliacaoService, MOTORES, MOTOR_OBJETOS, _consolidar_fatia
+
+
+# DePara do repositório: o enriquecimento faz parte do trabalho de cada processo
+CAMINHO_DEPARA = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'extractor',
+                              'depara', 'DePara-CashFlow.xlsx')
+
+
+def gerar_tabela(linhas: int, semente: int, depara) -> PendenciaTabela:
+    """
+    Gera pendências sintéticas de 40 contas, com chaves repetidas entre existentes e novas.
+
+    Metade das linhas usa banco, informação adicional e tipo de um responsável do DePara.
+    """
+    gerador = np.random.default_rng(semente)
+    datas = [datetime(2024, 1, 1) + timedelta(days=int(dia)) for dia in gerador.integers(0, 365, linhas)]
+    responsaveis = [depara.responsaveis[indice] for indice in gerador.integers(0, len(depara.responsaveis), linhas)]
+    do_depara = gerador.random(linhas) < 0.5
+    return PendenciaTabela(pd.DataFrame({
+        'STATUS': 'Não Reconciliada',
+        'EMPRESA': gerador.choice(['EMPRESA A', 'EMPRESA B'], linhas),
+        'NOME_BANCO': [
+            responsavel.NOME_BANCO if usar else banco
+            for responsavel, usar, banco in zip(responsaveis, do_depara, gerador.choice(['ITAU', 'BRADESCO'], linhas))
+        ],
+        'NOME_CONTA': gerador.choice([f'CONTA {numero}' for numero in range(40)], linhas),
+        'DATA_EXTRATO': datas,
+        'NUMERO_CONTA': gerador.integers(10000, 99999, linhas),
+        'INFORMACAO_ADICIONAL': [
+            responsavel.INFORMACAO_ADICIONAL if usar else f'PIX {numero}'
+            for responsavel, usar, numero in zip(responsaveis, do_depara, gerador.integers(0, 5000, linhas))
+        ],
+        'TIPO_TRANSACAO': [
+            responsavel.TIPO_TRANSACAO if usar else tipo
+            for responsavel, usar, tipo in zip(responsaveis, do_depara, gerador.choice(['Debito', 'Credito'], linhas))
+        ],
+        'VALOR': np.round(gerador.integers(1, 200, linhas) * 10.0, 2)
+    }))
+
+
+def medir(funcao, *argumentos):
+    """
+    Executa a função uma vez e devolve (tempo em segundos, resultado).
+    """
+    inicio = time.perf_counter()
+    resultado = funcao(*argumentos)
+    return time.perf_counter() - inicio, resultado
+
+
+def trabalho_processos(existentes: PendenciaTabela, novas: PendenciaTabela, parametros: tuple) -> float:
+    """
+    Tempo do trabalho feito dentro dos processos do pool, com as mesmas 2 fatias por NOME_CONTA.
+    """
+    fatias_novas, fatias_existentes = ConciliacaoService._distribuir_contas(
+        novas.textos_chave('NOME_CONTA'), existentes.textos_chave('NOME_CONTA'), 2
+    )
+
+    tempo = 0.0
+    for fatia in range(2):
+        dados = pickle.dumps((existentes.linhas(np.flatnonzero(fatias_existentes == fatia)),
+                              novas.linhas(np.flatnonzero(fatias_novas == fatia))))
+        inicio = time.perf_counter()
+        existentes_fatia, novas_fatia = pickle.loads(dados)
+        resultado = _consolidar_fatia(existentes_fatia, novas_fatia, *parametros)
+        pickle.dumps(resultado)
+        tempo += time.perf_counter() - inicio
+    return tempo
+
+
+def main():
+    volumes = [int(argumento) for argumento in sys.argv[1:]] or [20_000, 50_000, 100_000, 200_000]
+    nucleos = os.cpu_count() or 1
+    calendario = CalendarioDiasUteis()
+    depara = carregar_depara(CAMINHO_DEPARA)
+    print(f"Núcleos disponíveis: {nucleos}")
+
+    for motor in MOTORES:
+        for linhas in volumes:
+            existentes, novas = gerar_tabela(linhas, 1, depara), gerar_tabela(linhas, 2, depara)
+            parametros = (depara.responsaveis_dict, depara.departamentos_dict, motor, calendario,
+                          depara.regras_responsaveis)
+            entradas = (existentes, novas)
+            if motor == MOTOR_OBJETOS:
+                entradas = (existentes.para_pendencias(), novas.para_pendencias())
+
+            tempo_serie, _ = medir(_consolidar_fatia, *entradas, *parametros)
+            tempo_pool, _ = medir(ConciliacaoService._consolidar_em_processos, *entradas, 2, *parametros)
+
+            print(f"\n{motor}, {linhas} transações + {linhas} pendências existentes")
+            print(f"  série: {tempo_serie:.3f}s   2 processos: {tempo_pool:.3f}s")
+            if nucleos > 1:
+                print(f"  aceleração: {tempo_serie / tempo_pool:.2f}x")
+                continue
+
+            trabalho = trabalho_processos(existentes, novas, parametros)
+            principal = tempo_pool - trabalho
+            estimativas = ', '.join(
+                f"{processos} núcleos ~{principal + trabalho / processos:.3f}s" for processos in (2, 4, 8)
+            )
+            # principal + trabalho / N < série
+            if principal < tempo_serie:
+                compensa = f"a partir de {int(trabalho / (tempo_serie - principal)) + 1} processos"
+            else:
+                compensa = "nunca (o custo no processo principal já supera a série)"
+            print(f"  processo principal: {principal:.3f}s   trabalho dos processos: {trabalho:.3f}s")
+            print(f"  estimativa: {estimativas}")
+            print(f"  compensa: {compensa}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark da conversão DataFrame -> List[Pendencia] (extractor.excel_reader).
+
+Compara a conversão original (iterrows + busca do nome da coluna célula a
+célula) com a conversão por colunas atual, sobre um DataFrame sintético no
+formato da aba de pendências, e verifica que o resultado é o mesmo.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_conversao_pendencias.py [linhas]
+"""
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from entities.pendencia import Pendencia
+from extractor.excel_reader import _dataframe_para_pendencias
+
+
+def gerar_dataframe(linhas: int) -> pd.DataFrame:
+    """
+    Gera uma aba de pendências sintética, com células vazias e nomes de coluna alternativos.
+    """
+    gerador = np.random.default_rng(0)
+    datas = [datetime(2024, 1, 1) + timedelta(days=int(dia)) for dia in gerador.integers(0, 365, linhas)]
+    df = pd.DataFrame({
+        'STATUS': 'Não Reconciliada',
+        'UNIDADE_NEGOCIO': gerador.choice(['UN1', 'UN2', 'UN3'], linhas),
+        'EMPRESA': gerador.choice(['EMPRESA A', 'EMPRESA B'], linhas),
+        'NOME_BANCO': gerador.choice(['BANCO DO BRASIL', 'ITAU', 'BRADESCO'], linhas),
+        'NOME_CONTA': gerador.choice([f'CONTA {numero}' for numero in range(40)], linhas),
+        'DATA_EXTRATO': datas,
+        'NUMERO_CONTA': gerador.integers(10000, 99999, linhas),
+        'INFORMACAO_ADICIONAL': [f'PIX {numero}' for numero in gerador.integers(0, 5000, linhas)],
+        'NUMERO_EXTRATO': gerador.integers(1, 500, linhas),
+        'TIPO_TRANSACAO': gerador.choice(['Débito', 'Crédito'], linhas),
+        'VALOR': np.round(gerador.uniform(-10000, 10000, linhas), 2),
+        'Responsável': gerador.choice(['ANA', None], linhas),
+        'Observação': None,
+        'Departamento': gerador.choice(['FINANCEIRO', None], linhas),
+        'Vencimento': gerador.choice(['D1', '>D+1'], linhas)
+    })
+    return df
+
+
+def _valor_coluna(linha, nomes_coluna):
+    """
+    Conversão original: procura o nome da coluna em cada célula e troca NaN/NaT por None.
+    """
+    if isinstance(nomes_coluna, str):
+        nomes_coluna = [nomes_coluna]
+    for nome in nomes_coluna:
+        if nome in linha.index:
+            valor = linha[nome]
+            if pd.isna(valor):
+                return None
+            return valor
+    return None
+
+
+def converter_iterrows(df: pd.DataFrame) -> list:
+    """
+    Conversão original (antes da conversão por colunas), linha a linha com iterrows().
+    """
+    pendencias = []
+    for _, linha in df.iterrows():
+        pendencias.append(Pendencia(
+            STATUS=_valor_coluna(linha, 'STATUS'),
+            UNIDADE_NEGOCIO=_valor_coluna(linha, 'UNIDADE_NEGOCIO'),
+            EMPRESA=_valor_coluna(linha, 'EMPRESA'),
+            NOME_BANCO=_valor_coluna(linha, 'NOME_BANCO'),
+            NOME_CONTA=_valor_coluna(linha, 'NOME_CONTA'),
+            DATA_EXTRATO=_valor_coluna(linha, 'DATA_EXTRATO'),
+            NUMERO_CONTA=_valor_coluna(linha, 'NUMERO_CONTA'),
+            INFORMACAO_ADICIONAL=_valor_coluna(linha, 'INFORMACAO_ADICIONAL'),
+            NUMERO_EXTRATO=_valor_coluna(linha, 'NUMERO_EXTRATO'),
+            TIPO_TRANSACAO=_valor_coluna(linha, 'TIPO_TRANSACAO'),
+            VALOR=_valor_coluna(linha, 'VALOR'),
+            RESPONSAVEL=_valor_coluna(linha, ['Responsável', 'RESPONSAVEL']),
+            OBSERVACAO=_valor_coluna(linha, ['Observação', 'OBSERVACAO']),
+            DEPARTAMENTO=_valor_coluna(linha, ['Departamento', 'DEPARTAMENTO']),
+            VENCIMENTO=_valor_coluna(linha, ['Vencimento', 'VENCIMENTO'])
+        ))
+    return pendencias
+
+
+def medir(funcao, *argumentos, repeticoes: int = 3):
+    """
+    Executa a função algumas vezes e devolve (melhor tempo em segundos, último resultado).
+    """
+    melhor = float('inf')
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao(*argumentos)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def main():
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    df = gerar_dataframe(linhas)
+
+    tempo_original, original = medir(converter_iterrows, df, repeticoes=1)
+    tempo_atual, atual = medir(_dataframe_para_pendencias, df)
+
+    iguais = [pendencia.to_dict() for pendencia in original] == [pendencia.to_dict() for pendencia in atual]
+    print(f"Linhas: {linhas}")
+    print(f"iterrows (original): {tempo_original:.3f}s")
+    print(f"por colunas (atual): {tempo_atual:.3f}s ({tempo_original / tempo_atual:.1f}x)")
+    print(f"Resultado igual: {iguais}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Medição de memória das entidades com __slots__ (entities.pendencia, responsavel, departamento).
+
+Cria as mesmas instâncias com as classes atuais (dataclasses com slots) e
+com cópias sem slots (dataclasses comuns, com __dict__ por instância, como
+eram antes) e mede com tracemalloc os bytes alocados por linha. Os valores
+dos campos são criados antes da medição, de forma que apenas os objetos
+(e a lista que os guarda) entram na conta.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_memoria_entidades.py [linhas]
+"""
+import os
+import sys
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from entities.pendencia import Pendencia
+from entities.responsavel import Responsavel
+from entities.departamento import Departamento
+
+
+def sem_slots(classe):
+    """
+    Cópia da entidade como dataclass comum (sem slots), com os mesmos campos de dados.
+    """
+    campos = [(campo.name, campo.type, None) for campo in fields(classe)]
+    return make_dataclass(f'{classe.__name__}SemSlots', campos)
+
+
+def bytes_por_linha(classe, valores: list) -> float:
+    """
+    Bytes alocados por instância ao criar uma instância para cada dicionário de valores.
+    """
+    tracemalloc.start()
+    antes = tracemalloc.take_snapshot()
+    objetos = [classe(**campos) for campos in valores]
+    depois = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    total = sum(diferenca.size_diff for diferenca in depois.compare_to(antes, 'filename'))
+    del objetos
+    return total / len(valores)
+
+
+def gerar_valores(linhas: int) -> dict:
+    """
+    Valores de campos por entidade, no formato típico das planilhas (8 campos preenchidos na Pendencia).
+    """
+    data = datetime(2024, 1, 1)
+    return {
+        Pendencia: [
+            dict(STATUS='Não Reconciliada', EMPRESA='EMPRESA A', NOME_BANCO='ITAU', NOME_CONTA='CONTA 1',
+                 DATA_EXTRATO=data, INFORMACAO_ADICIONAL=f'PIX {indice % 5000}', TIPO_TRANSACAO='Débito',
+                 VALOR=float(indice))
+            for indice in range(linhas)
+        ],
+        Responsavel: [
+            dict(NOME_BANCO='ITAU', INFORMACAO_ADICIONAL=f'PIX {indice}', TIPO_TRANSACAO='Débito',
+                 RESPONSAVEL='ANA', OBSERVACAO=None)
+            for indice in range(linhas)
+        ],
+        Departamento: [
+            dict(RESPONSAVEL=f'RESPONSAVEL {indice}', AREA='FINANCEIRO')
+            for indice in range(linhas)
+        ]
+    }
+
+
+def main():
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    valores = gerar_valores(linhas)
+
+    print(f"Linhas: {linhas} (bytes por linha, sem contar os valores dos campos)")
+    for classe, valores_classe in valores.items():
+        antes = bytes_por_linha(sem_slots(classe), valores_classe)
+        depois = bytes_por_linha(classe, valores_classe)
+        print(f"{classe.__name__}: sem slots {antes:.0f} -> com slots {depois:.0f} "
+              f"({(1 - depois / antes) * 100:.0f}% menor)")
+
+
+if __name__ == '__main__':
+    main()
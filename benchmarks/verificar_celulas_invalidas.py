@@ -0,0 +1,121 @@
+"""
+Verificação da leitura de um Rel_sem_tratar com células inválidas.
+
+Gera um Rel_sem_tratar com uma DATA_EXTRATO ('N/D') e um VALOR ('abc') que
+não podem ser convertidos, e verifica que:
+
+- a leitura via DataFrame e a leitura em streaming não são interrompidas,
+  deixam as duas células vazias (VALOR vazio vira 0) e reportam as mesmas
+  células inválidas;
+- gerar_relatorio_consolidado gera o relatório (leitura única e em lotes),
+  com a transação sem data em ">D+1" e as células nas estatísticas do
+  arquivo e nos avisos.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/verificar_celulas_invalidas.py
+"""
+import os
+import sys
+import tempfile
+from datetime import date
+
+import pandas as pd
+from openpyxl import Workbook
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from extractor.main import gerar_relatorio_consolidado
+from extractor.rel_sem_tratar_reader import (
+    extrair_novas_transacoes_rel_sem_tratar,
+    iterar_novas_transacoes_rel_sem_tratar
+)
+from services.calendario_dias_uteis import VENCIMENTO_VENCIDO
+
+
+COLUNAS = ['STATUS', 'UNIDADE_NEGOCIO', 'EMPRESA', 'NOME_BANCO', 'NOME_CONTA', 'DATA_EXTRATO',
+           'NUMERO_CONTA', 'INFORMACAO_ADICIONAL', 'NUMERO_EXTRATO', 'TIPO_TRANSACAO', 'VALOR']
+
+# (DATA_EXTRATO, VALOR) de cada transação: a 2ª tem data inválida, a 3ª VALOR inválido
+LINHAS = [
+    (date(2025, 3, 7), 10.0),
+    ('N/D', '1,500.00'),
+    ('07/03/2025', 'abc'),
+]
+
+# Células inválidas esperadas: (linha de dados, coluna)
+ESPERADAS = [(1, 'DATA_EXTRATO'), (2, 'VALOR')]
+
+
+def gerar_arquivos(diretorio: str):
+    """
+    Grava o Rel_sem_tratar com células inválidas e uma planilha de pendências vazia.
+    """
+    caminho_rel = os.path.join(diretorio, 'Rel_sem_tratar.xlsx')
+    wb = Workbook()
+    ws = wb.active
+    ws.append(['Relatório sem tratar'])
+    ws.append(COLUNAS)
+    for indice, (data_extrato, valor) in enumerate(LINHAS):
+        ws.append(['Não Reconciliada', 'UN1', 'EMPRESA A', 'ITAU', 'CONTA 1', data_extrato,
+                   12345, f'PIX {indice}', indice + 1, 'Débito', valor])
+    wb.save(caminho_rel)
+
+    caminho_pendencias = os.path.join(diretorio, 'Pendencias.xlsx')
+    wb = Workbook()
+    wb.active.title = 'Pendências'
+    wb.active.append(COLUNAS)
+    wb.save(caminho_pendencias)
+    return caminho_rel, caminho_pendencias
+
+
+def verificar(modo: str, condicoes: dict) -> list:
+    """
+    Exibe o resultado de um modo e devolve as condições que falharam.
+    """
+    problemas = [descricao for descricao, ok in condicoes.items() if not ok]
+    print(f"{modo:<24} {'ok' if not problemas else 'FALHOU'}")
+    for problema in problemas:
+        print(f"    - {problema}")
+    return problemas
+
+
+def main():
+    problemas = []
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_rel, caminho_pendencias = gerar_arquivos(diretorio)
+
+        transacoes, celulas = extrair_novas_transacoes_rel_sem_tratar(caminho_rel, com_celulas_invalidas=True)
+        problemas += verificar('leitura DataFrame', {
+            'células inválidas reportadas': [(c.linha, c.coluna) for c in celulas] == ESPERADAS,
+            'todas as linhas lidas': len(transacoes) == len(LINHAS),
+            'data inválida vazia': transacoes[1].DATA_EXTRATO is None,
+            'VALOR com milhares convertido': transacoes[1].VALOR == 1500.0,
+            'VALOR inválido igual a 0': transacoes[2].VALOR == 0.0,
+        })
+
+        celulas_streaming = []
+        transacoes_streaming = list(iterar_novas_transacoes_rel_sem_tratar(caminho_rel, celulas_streaming))
+        problemas += verificar('leitura em streaming', {
+            'células inválidas reportadas': [(c.linha, c.coluna) for c in celulas_streaming] == ESPERADAS,
+            'mesmas transações da leitura DataFrame': transacoes_streaming == transacoes,
+        })
+
+        for modo, opcoes in (('relatório', {}), ('relatório em lotes', {'tamanho_lote': 2})):
+            saida = os.path.join(diretorio, 'saida.xlsx')
+            estatisticas = gerar_relatorio_consolidado(caminho_rel, caminho_pendencias, saida, paralelo=False,
+                                                       data_execucao=date(2025, 3, 10), **opcoes)
+            relatorio = pd.read_excel(saida, sheet_name='Pendências')
+            celulas_arquivo = estatisticas['arquivos_rel_sem_tratar'][0]['celulas_invalidas']
+            problemas += verificar(modo, {
+                'todas as transações no relatório': len(relatorio) == len(LINHAS),
+                'transação sem data em >D+1': relatorio['Vencimento'].iloc[1] == VENCIMENTO_VENCIDO,
+                'células nas estatísticas do arquivo': [(c.linha, c.coluna) for c in celulas_arquivo] == ESPERADAS,
+                'aviso das células inválidas': any('inválida' in aviso for aviso in estatisticas['avisos']),
+            })
+
+    if problemas:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
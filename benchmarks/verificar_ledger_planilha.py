@@ -0,0 +1,136 @@
+"""
+Verificação do ledger de pendências quando a planilha de pendências muda.
+
+Gera um Rel_sem_tratar com duas transações e uma planilha de pendências com
+uma pendência para a primeira, e executa gerar_relatorio_consolidado com o
+ledger (caminho_ledger), verificando que:
+
+- na segunda execução com a mesma planilha, sem alterações, o ledger é usado
+  (a planilha está sincronizada com o ledger);
+- após editar a planilha (uma Observação na pendência da segunda transação),
+  o ledger é recarregado e a edição aparece no relatório;
+- o relatório gerado, informado como planilha de pendências, é reconhecido
+  como sincronizado e gera o mesmo relatório.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/verificar_ledger_planilha.py
+"""
+import os
+import sys
+import tempfile
+from datetime import date
+
+import pandas as pd
+from openpyxl import Workbook
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from extractor.cache_leitura import hash_arquivo
+from extractor.main import gerar_relatorio_consolidado
+from services.ledger_pendencias import LedgerPendencias
+
+
+COLUNAS = ['STATUS', 'UNIDADE_NEGOCIO', 'EMPRESA', 'NOME_BANCO', 'NOME_CONTA', 'DATA_EXTRATO',
+           'NUMERO_CONTA', 'INFORMACAO_ADICIONAL', 'NUMERO_EXTRATO', 'TIPO_TRANSACAO', 'VALOR']
+
+# (INFORMACAO_ADICIONAL, VALOR) das novas transações
+TRANSACOES = [('PIX 1', 10.0), ('PIX 2', 20.0)]
+
+OBSERVACAO_EDITADA = 'Editada na planilha'
+
+
+def linha(informacao_adicional: str, valor: float) -> list:
+    """
+    Monta uma linha com as colunas do Rel_sem_tratar.
+    """
+    return ['Não Reconciliada', 'UN1', 'EMPRESA A', 'ITAU', 'CONTA 1', date(2025, 3, 7),
+            12345, informacao_adicional, 1, 'Débito', valor]
+
+
+def gravar_pendencias(caminho: str, pendencias: list) -> None:
+    """
+    Grava a planilha de pendências: linhas (informação adicional, valor, observação).
+    """
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'Pendências'
+    ws.append(COLUNAS + ['Observação'])
+    for informacao_adicional, valor, observacao in pendencias:
+        ws.append(linha(informacao_adicional, valor) + [observacao])
+    wb.save(caminho)
+
+
+def gerar(caminho_rel: str, caminho_pendencias: str, caminho_ledger: str, saida: str) -> pd.DataFrame:
+    """
+    Executa o relatório com o ledger e devolve a aba de pendências gerada.
+    """
+    gerar_relatorio_consolidado(caminho_rel, caminho_pendencias, saida, caminho_ledger=caminho_ledger,
+                                data_execucao=date(2025, 3, 10))
+    return pd.read_excel(saida, sheet_name='Pendências')
+
+
+def sincronizada(caminho_ledger: str, caminho_pendencias: str) -> bool:
+    """
+    Indica se o ledger considera a planilha em dia (não será importada).
+    """
+    with LedgerPendencias(caminho_ledger) as ledger:
+        return ledger.planilha_sincronizada(hash_arquivo(caminho_pendencias))
+
+
+def verificar(modo: str, condicoes: dict) -> list:
+    """
+    Exibe o resultado de um modo e devolve as condições que falharam.
+    """
+    problemas = [descricao for descricao, ok in condicoes.items() if not ok]
+    print(f"{modo:<24} {'ok' if not problemas else 'FALHOU'}")
+    for problema in problemas:
+        print(f"    - {problema}")
+    return problemas
+
+
+def main():
+    problemas = []
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_rel = os.path.join(diretorio, 'Rel_sem_tratar.xlsx')
+        wb = Workbook()
+        wb.active.append(['Relatório sem tratar'])
+        wb.active.append(COLUNAS)
+        for informacao_adicional, valor in TRANSACOES:
+            wb.active.append(linha(informacao_adicional, valor))
+        wb.save(caminho_rel)
+
+        caminho_pendencias = os.path.join(diretorio, 'Pendencias.xlsx')
+        caminho_ledger = os.path.join(diretorio, 'pendencias.db')
+        gravar_pendencias(caminho_pendencias, [('PIX 1', 10.0, None)])
+
+        relatorio = gerar(caminho_rel, caminho_pendencias, caminho_ledger, os.path.join(diretorio, 'saida1.xlsx'))
+        problemas += verificar('primeira execução', {
+            'transações no relatório': len(relatorio) == len(TRANSACOES),
+            'planilha sincronizada após a importação': sincronizada(caminho_ledger, caminho_pendencias),
+        })
+
+        # Planilha editada: a pendência da segunda transação ganha uma observação
+        gravar_pendencias(caminho_pendencias, [('PIX 1', 10.0, None), ('PIX 2', 20.0, OBSERVACAO_EDITADA)])
+        editada_sincronizada = sincronizada(caminho_ledger, caminho_pendencias)
+        relatorio = gerar(caminho_rel, caminho_pendencias, caminho_ledger, os.path.join(diretorio, 'saida2.xlsx'))
+        problemas += verificar('planilha editada', {
+            'planilha editada não sincronizada': not editada_sincronizada,
+            'edição no relatório': relatorio['Observação'].iloc[1] == OBSERVACAO_EDITADA,
+            'planilha sincronizada após recarregar': sincronizada(caminho_ledger, caminho_pendencias),
+        })
+
+        # O relatório gerado como planilha de pendências da próxima execução
+        caminho_saida2 = os.path.join(diretorio, 'saida2.xlsx')
+        saida_sincronizada = sincronizada(caminho_ledger, caminho_saida2)
+        relatorio_seguinte = gerar(caminho_rel, caminho_saida2, caminho_ledger, os.path.join(diretorio, 'saida3.xlsx'))
+        problemas += verificar('relatório como planilha', {
+            'relatório sincronizado': saida_sincronizada,
+            'mesmo relatório': relatorio_seguinte.equals(relatorio),
+        })
+
+    if problemas:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
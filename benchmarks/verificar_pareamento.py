@@ -0,0 +1,208 @@
+"""
+Verificação do pareamento um a um em todos os modos de consolidação (services.conciliacao_service).
+
+Gera pendências existentes e novas transações com muitas chaves de
+reconciliação repetidas (tarifas iguais na mesma conta), VALORES a um
+centavo de distância e textos que diferem só em maiúsculas/espaços, e
+consolida com cada modo:
+
+- objetos, vetorizado: ConciliacaoService.conciliar
+- lotes: ConciliacaoService.consolidar_pendencias_em_lotes
+- paralelo: ConciliacaoService.consolidar_pendencias_paralelo, e a divisão em
+  processos forçada com os dois motores (pool)
+- ledger: ConciliacaoService.consolidar_com_ledger (duas execuções seguidas)
+- tolerante: ConciliacaoService.consolidar_pendencias_tolerante
+
+Cada linha de entrada leva uma marca única em OBSERVACAO. Em todos os modos
+é verificado que nenhuma pendência existente ou transação aparece mais de
+uma vez no resultado (nem no ledger gravado), que o resultado tem uma
+pendência por transação e, nos modos exatos, que cada chave usa
+min(existentes, novas) pendências existentes.
+
+Nos modos exatos também é verificado que as estatísticas coletadas durante
+a consolidação (ResultadoConciliacao.estatisticas) são as de
+ConciliacaoService.obter_estatisticas_consolidacao, e que as estatísticas
+de dois intervalos de transações (estatisticas_intervalo) somam os totais.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/verificar_pareamento.py [linhas]
+"""
+import os
+import sys
+import tempfile
+from collections import Counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from entities.pendencia import Pendencia
+from services.calendario_dias_uteis import CalendarioDiasUteis
+from services.conciliacao_service import ConciliacaoService, MOTORES, MOTOR_VETORIZADO
+from services.ledger_pendencias import LedgerPendencias
+from services.resultado_conciliacao import ResultadoConciliacao
+
+
+# VALORES e INFORMACAO_ADICIONAL das pendências existentes
+VALORES_EXISTENTES = [15.9, 32.5, 120.0, 120.01]
+INFORMACOES_EXISTENTES = ['TARIFA', 'Tarifa', 'PIX 10']
+
+# As novas transações também têm chaves sem pendência exata, próximas das existentes
+VALORES_NOVOS = VALORES_EXISTENTES + [15.91, 15.89, 32.51]
+INFORMACOES_NOVAS = INFORMACOES_EXISTENTES + ['tarifa ', 'PIX 11']
+
+
+def gerar_pendencias(linhas: int, semente: int, prefixo: str,
+                     valores: list = VALORES_NOVOS, informacoes: list = INFORMACOES_NOVAS) -> list:
+    """
+    Gera pendências com poucas chaves distintas, marcadas em OBSERVACAO (prefixo + posição).
+    """
+    gerador = np.random.default_rng(semente)
+    valores = gerador.choice(valores, linhas).tolist()
+    informacoes = gerador.choice(informacoes, linhas).tolist()
+    contas = gerador.choice([f'CONTA {numero}' for numero in range(6)], linhas).tolist()
+    return [
+        Pendencia(STATUS='Não Reconciliada', NOME_BANCO='BANCO', TIPO_TRANSACAO='Débito',
+                  VALOR=valor, INFORMACAO_ADICIONAL=informacao, NOME_CONTA=conta,
+                  OBSERVACAO=f'{prefixo}{posicao}')
+        for posicao, (valor, informacao, conta) in enumerate(zip(valores, informacoes, contas))
+    ]
+
+
+def verificar(modo: str, existentes: list, novas: list, consolidadas, exato: bool = True) -> list:
+    """
+    Verifica o resultado de um modo e devolve a lista de problemas encontrados.
+    """
+    problemas = []
+    consolidadas = list(consolidadas)
+    if len(consolidadas) != len(novas):
+        problemas.append(f'{len(consolidadas)} pendências consolidadas para {len(novas)} transações')
+
+    marcas = Counter(pendencia.OBSERVACAO for pendencia in consolidadas)
+    repetidas = [marca for marca, quantidade in marcas.items() if quantidade > 1]
+    if repetidas:
+        problemas.append(f'{len(repetidas)} pendências emitidas mais de uma vez (ex.: {repetidas[:3]})')
+
+    # Nos modos por objetos o resultado é formado pelos próprios objetos de entrada
+    objetos = Counter(id(pendencia) for pendencia in consolidadas)
+    if any(quantidade > 1 for quantidade in objetos.values()):
+        problemas.append('o mesmo objeto Pendencia aparece em mais de uma posição')
+
+    if exato:
+        marcas_existentes = {pendencia.OBSERVACAO for pendencia in existentes}
+        usadas = Counter(
+            pendencia.chave_reconciliacao for pendencia in consolidadas
+            if pendencia.OBSERVACAO in marcas_existentes
+        )
+        quantidade_existentes = Counter(pendencia.chave_reconciliacao for pendencia in existentes)
+        quantidade_novas = Counter(pendencia.chave_reconciliacao for pendencia in novas)
+        erradas = [
+            chave for chave in quantidade_novas
+            if usadas[chave] != min(quantidade_existentes[chave], quantidade_novas[chave])
+        ]
+        if erradas:
+            problemas.append(f'{len(erradas)} chaves com quantidade de pendências pareadas incorreta')
+
+    print(f"{modo:<24} {'ok' if not problemas else 'FALHOU'}")
+    for problema in problemas:
+        print(f"    - {problema}")
+    return problemas
+
+
+def verificar_estatisticas(modo: str, existentes: list, novas: list, resultado: ResultadoConciliacao) -> list:
+    """
+    Compara as estatísticas de um resultado com as recalculadas sobre as entradas.
+    """
+    problemas = []
+    estatisticas = resultado.estatisticas()
+    esperadas = ConciliacaoService.obter_estatisticas_consolidacao(existentes, novas, resultado.pendencias)
+    diferentes = [
+        f'{nome}={estatisticas[nome]} (esperado {valor})'
+        for nome, valor in esperadas.items() if estatisticas[nome] != valor
+    ]
+    if diferentes:
+        problemas.append(f'estatísticas diferentes: {", ".join(diferentes)}')
+
+    # Intervalos: cada chave conta no intervalo da sua primeira ocorrência
+    meio = len(novas) // 3
+    intervalos = [resultado.estatisticas_intervalo(0, meio), resultado.estatisticas_intervalo(meio, len(novas))]
+    for nome, valor in intervalos[0].items():
+        if valor + intervalos[1][nome] != estatisticas[nome]:
+            problemas.append(f'{nome} dos intervalos não soma o total ({valor} + {intervalos[1][nome]})')
+
+    print(f"{modo + ' (estat.)':<24} {'ok' if not problemas else 'FALHOU'}")
+    for problema in problemas:
+        print(f"    - {problema}")
+    return problemas
+
+
+def main():
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+
+    def entradas():
+        # Objetos novos a cada modo: o motor por objetos altera as pendências recebidas
+        existentes = gerar_pendencias(linhas, 1, 'E', VALORES_EXISTENTES, INFORMACOES_EXISTENTES)
+        return existentes, gerar_pendencias(linhas + linhas // 4, 2, 'N')
+
+    problemas = []
+
+    existentes, novas = entradas()
+    resultado = ConciliacaoService.conciliar(existentes, novas)
+    problemas += verificar('objetos', existentes, novas, resultado.pendencias)
+    problemas += verificar_estatisticas('objetos', existentes, novas, resultado)
+
+    existentes, novas = entradas()
+    resultado = ConciliacaoService.conciliar(existentes, novas, motor=MOTOR_VETORIZADO)
+    problemas += verificar('vetorizado', existentes, novas, resultado.pendencias)
+    problemas += verificar_estatisticas('vetorizado', existentes, novas, resultado)
+
+    existentes, novas = entradas()
+    lotes = [novas[inicio:inicio + 700] for inicio in range(0, len(novas), 700)]
+    resultados = list(ConciliacaoService.conciliar_em_lotes(existentes, lotes))
+    resultado = ResultadoConciliacao.combinar(
+        resultados, [pendencia for resultado_lote in resultados for pendencia in resultado_lote.pendencias]
+    )
+    problemas += verificar('lotes', existentes, novas, resultado.pendencias)
+    problemas += verificar_estatisticas('lotes', existentes, novas, resultado)
+
+    existentes, novas = entradas()
+    resultado = ConciliacaoService.consolidar_pendencias_paralelo(existentes, novas, processos=2)
+    problemas += verificar('paralelo', existentes, novas, resultado.pendencias)
+    problemas += verificar_estatisticas('paralelo', existentes, novas, resultado)
+
+    # Divisão em processos forçada (sem os limites de volume e de núcleos)
+    for motor in MOTORES:
+        existentes, novas = entradas()
+        resultado = ConciliacaoService._consolidar_em_processos(
+            existentes, novas, 2, {}, {}, motor, CalendarioDiasUteis(), None
+        )
+        problemas += verificar(f'pool {motor}', existentes, novas, resultado.pendencias)
+        problemas += verificar_estatisticas(f'pool {motor}', existentes, novas, resultado)
+
+    existentes, novas = entradas()
+    with tempfile.TemporaryDirectory() as diretorio:
+        with LedgerPendencias(os.path.join(diretorio, 'pendencias.db')) as ledger:
+            ledger.importar(existentes)
+            resultado = ConciliacaoService.consolidar_com_ledger(ledger, novas)
+            problemas += verificar('ledger', existentes, novas, resultado.pendencias)
+            problemas += verificar_estatisticas('ledger', existentes, novas, resultado)
+            problemas += verificar('ledger (db)', existentes, novas, ledger.para_tabela())
+
+            # Segunda execução: o ledger gravado é a planilha de pendências do dia seguinte
+            existentes = ledger.para_tabela().para_pendencias()
+            novas = gerar_pendencias(linhas, 3, 'M')
+            resultado = ConciliacaoService.consolidar_com_ledger(ledger, novas)
+            problemas += verificar('ledger dia 2', existentes, novas, resultado.pendencias)
+            problemas += verificar_estatisticas('ledger dia 2', existentes, novas, resultado)
+            problemas += verificar('ledger (db)', existentes, novas, ledger.para_tabela())
+
+    existentes, novas = entradas()
+    resultado, _ = ConciliacaoService.consolidar_pendencias_tolerante(existentes, novas, tolerancia_centavos=1)
+    problemas += verificar('tolerante', existentes, novas, resultado.pendencias, exato=False)
+
+    if problemas:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
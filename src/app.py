@@ -4,6 +4,11 @@ import os
 import sys
 from pathlib import Path
 
+# As entidades usam dataclasses com slots (Python 3.10+): falhar com uma mensagem clara
+if sys.version_info < (3, 10):
+    sys.exit("❌ Python 3.10 ou superior é necessário (versão atual: "
+             f"{sys.version_info.major}.{sys.version_info.minor})")
+
 # Imports da nova arquitetura modular
 from extractor.main import gerar_relatorio_consolidado
 
@@ -19,6 +24,8 @@ class CashFlowApp:
         self.arquivo_rel_sem_tratar = tk.StringVar()
         self.arquivo_pendencias_antigas = tk.StringVar()
         self.sheet_pendencias = tk.StringVar(value="Pendências")
+        self.leitura_paralela = tk.BooleanVar(value=False)
+        self.usar_cache = tk.BooleanVar(value=False)
         
         self.criar_interface()
         
@@ -84,6 +91,14 @@ class CashFlowApp:
                                     font=("Arial", 10), width=25)
         pendencias_entry.grid(row=0, column=1, sticky=tk.W, padx=(15, 0))
         
+        # Leitura paralela (opcional): cada arquivo é lido em um processo separado
+        ttk.Checkbutton(section3_frame, text="Ler os arquivos em paralelo (processos separados)",
+                        variable=self.leitura_paralela).grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+        
+        # Cache de leitura (opcional): arquivos já lidos são reabertos sem o parser do Excel
+        ttk.Checkbutton(section3_frame, text="Usar cache de leitura (reabre mais rápido arquivos já processados)",
+                        variable=self.usar_cache).grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        
         # Seção 4: Ações
         action_frame = ttk.Frame(main_frame)
         action_frame.grid(row=5, column=0, columnspan=3, pady=20)
@@ -157,6 +172,8 @@ class CashFlowApp:
         self.arquivo_rel_sem_tratar.set("")
         self.arquivo_pendencias_antigas.set("")
         self.sheet_pendencias.set("Pendências")
+        self.leitura_paralela.set(False)
+        self.usar_cache.set(False)
         self.log_text.delete(1.0, tk.END)
         self.log("🧹 Campos limpos. Pronto para novo processamento!")
         
@@ -230,10 +247,14 @@ class CashFlowApp:
                 self.arquivo_rel_sem_tratar.get(),
                 self.arquivo_pendencias_antigas.get(),
                 arquivo_saida,
-                self.sheet_pendencias.get().strip()
+                self.sheet_pendencias.get().strip(),
+                paralelo=self.leitura_paralela.get(),
+                usar_cache=self.usar_cache.get()
             )
             
             self.log("✅ PROCESSAMENTO CONCLUÍDO COM SUCESSO!")
+            for aviso in resultado['avisos']:
+                self.log(f"⚠️ Aviso: {aviso}")
             self.log(f"📊 Total de linhas consolidadas: {resultado['total_consolidadas']}")
             self.log(f"📈 Pendências preservadas: {resultado['pendencias_preservadas']}")
             self.log(f"📈 Novas pendências adicionadas: {resultado['novas_pendencias_adicionadas']}")
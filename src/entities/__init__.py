@@ -3,5 +3,6 @@
 from .pendencia import Pendencia
 from .responsavel import Responsavel
 from .departamento import Departamento
+from .pendencia_tabela import PendenciaTabela
 
-__all__ = ['Pendencia', 'Responsavel', 'Departamento'] 
\ No newline at end of file
+__all__ = ['Pendencia', 'Responsavel', 'Departamento', 'PendenciaTabela'] 
\ No newline at end of file
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Departamento:
     """
     Entidade que representa um registro da sheet 'departamento' do arquivo DePara-CashFlow.
@@ -34,4 +34,24 @@ class Departamento:
             str: Chave única para identificar o registro de departamento
         """
         responsavel_str = str(self.RESPONSAVEL) if self.RESPONSAVEL is not None else ""
-        return responsavel_str 
\ No newline at end of file
+        return responsavel_str
+
+
+def criar_dicionario_departamentos(departamentos: Iterable[Departamento]) -> Dict[str, Departamento]:
+    """
+    Cria um dicionário de departamentos indexado pelo responsável.
+    
+    Args:
+        departamentos: Lista de departamentos
+        
+    Returns:
+        Dict[str, Departamento]: Dicionário responsável -> departamento
+    """
+    departamentos_dict = {}
+    
+    for departamento in departamentos:
+        responsavel = departamento.RESPONSAVEL
+        if responsavel and responsavel not in departamentos_dict:
+            departamentos_dict[responsavel] = departamento
+    
+    return departamentos_dict 
\ No newline at end of file
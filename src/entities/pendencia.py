@@ -1,10 +1,24 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple, Union
 from datetime import datetime
 
 
-@dataclass
-class Pendencia:
+# Chave de reconciliação: (VALOR em centavos, INFORMACAO_ADICIONAL, NOME_CONTA)
+ChaveReconciliacao = Tuple[Union[int, str, None], str, str]
+
+
+class _ChaveEmCache:
+    """
+    Base da Pendencia com o slot da chave de reconciliação calculada.
+    
+    O slot fica fora dos campos da dataclass: não aparece em fields(),
+    asdict(), __repr__ nem __eq__.
+    """
+    __slots__ = ('_chave_reconciliacao',)
+
+
+@dataclass(slots=True)
+class Pendencia(_ChaveEmCache):
     """
     Entidade que representa uma pendência financeira.
     
@@ -12,6 +26,9 @@ class Pendencia:
     - VALOR: valor da transação
     - INFORMACAO_ADICIONAL: informação adicional da transação
     - NOME_CONTA: nome da conta
+    
+    A classe usa __slots__ (sem __dict__ por instância), o que reduz a memória
+    ocupada quando há centenas de milhares de pendências.
     """
     STATUS: Optional[str] = None
     UNIDADE_NEGOCIO: Optional[str] = None
@@ -28,10 +45,58 @@ class Pendencia:
     OBSERVACAO: Optional[str] = None
     DEPARTAMENTO: Optional[str] = None
     VENCIMENTO: Optional[str] = None
+    
+    def __post_init__(self) -> None:
+        # Chave de reconciliação ainda não calculada
+        self._chave_reconciliacao = None
+
+    @property
+    def chave_reconciliacao(self) -> ChaveReconciliacao:
+        """
+        Chave de reconciliação baseada em VALOR, INFORMACAO_ADICIONAL e NOME_CONTA.
+        
+        VALOR entra na chave como inteiro em centavos, de forma que 1500,
+        1500.0 e 1500.00000001 correspondem à mesma pendência.
+        
+        A chave é uma tupla, calculada uma única vez por pendência e reutilizada
+        nos índices e estatísticas da conciliação. Por ser uma tupla, valores
+        diferentes não colidem (o que acontecia com a concatenação de textos,
+        ex.: 'AB' + 'C' e 'A' + 'BC').
+        
+        Quem alterar VALOR, INFORMACAO_ADICIONAL ou NOME_CONTA depois do
+        primeiro acesso deve chamar descartar_chave_reconciliacao(), para que a
+        chave seja montada novamente no próximo acesso.
+        
+        Returns:
+            ChaveReconciliacao: Tupla (VALOR em centavos, INFORMACAO_ADICIONAL, NOME_CONTA)
+        """
+        if self._chave_reconciliacao is None:
+            self._chave_reconciliacao = montar_chave_reconciliacao(
+                self.VALOR, self.INFORMACAO_ADICIONAL, self.NOME_CONTA
+            )
+        return self._chave_reconciliacao
+
+    def descartar_chave_reconciliacao(self) -> None:
+        """
+        Descarta a chave de reconciliação calculada (após alterar um campo da chave).
+        """
+        self._chave_reconciliacao = None
+
+    @property
+    def valor_centavos(self) -> Union[int, str, None]:
+        """
+        VALOR em centavos (inteiro), usado na comparação de valores.
+        
+        Returns:
+            int, ou None se VALOR estiver vazio (texto se VALOR não for numérico)
+        """
+        return valor_em_centavos(self.VALOR)
 
     def get_chave_reconciliacao(self) -> str:
         """
-        Gera a chave de reconciliação baseada em VALOR + INFORMACAO_ADICIONAL + NOME_CONTA.
+        Gera a chave de reconciliação em texto, VALOR + INFORMACAO_ADICIONAL + NOME_CONTA.
+        
+        Mantida para compatibilidade; a conciliação usa `chave_reconciliacao`.
         
         Returns:
             str: Chave única para identificar a pendência
@@ -65,4 +130,65 @@ class Pendencia:
             'Observação': self.OBSERVACAO,   # Mantém nome original da coluna
             'Departamento': self.DEPARTAMENTO,
             'Vencimento': self.VENCIMENTO
-        } 
\ No newline at end of file
+        }
+
+
+def valor_em_centavos(valor) -> Union[int, str, None]:
+    """
+    Converte um VALOR monetário para inteiro em centavos.
+    
+    Args:
+        valor: Valor da pendência (número ou texto numérico)
+        
+    Returns:
+        int: Valor em centavos, arredondado
+        None: Se o valor estiver vazio
+        str: O próprio valor como texto, se não for numérico
+    """
+    if valor is None:
+        return None
+    try:
+        return int(round(float(valor) * 100))
+    except (TypeError, ValueError, OverflowError):
+        return str(valor)
+
+
+def montar_chave_reconciliacao(valor, informacao_adicional, nome_conta,
+                               centavos: bool = False) -> ChaveReconciliacao:
+    """
+    Monta a chave de reconciliação a partir dos valores dos campos.
+    
+    Args:
+        valor: VALOR da pendência
+        informacao_adicional: INFORMACAO_ADICIONAL da pendência
+        nome_conta: NOME_CONTA da pendência
+        centavos: Se True, `valor` já está convertido para centavos
+        
+    Returns:
+        ChaveReconciliacao: Tupla com VALOR em centavos e os demais campos como texto ("" para vazio)
+    """
+    return (
+        valor if centavos else valor_em_centavos(valor),
+        texto_chave(informacao_adicional),
+        texto_chave(nome_conta)
+    )
+
+
+def texto_chave(valor) -> str:
+    """
+    Converte um campo de texto da chave de reconciliação.
+    
+    Números inteiros lidos como float (ex.: 7.0 em uma coluna do Excel com
+    células vazias) geram o mesmo texto do inteiro ('7').
+    
+    Args:
+        valor: INFORMACAO_ADICIONAL ou NOME_CONTA
+        
+    Returns:
+        str: Valor como texto ("" para vazio)
+    """
+    if valor is None:
+        return ""
+    if isinstance(valor, float) and valor.is_integer():
+        return str(int(valor))
+    return str(valor)
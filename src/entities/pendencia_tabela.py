@@ -0,0 +1,305 @@
+import numpy as np
+import pandas as pd
+from dataclasses import fields
+from typing import Iterable, Iterator, List, Union
+from entities.pendencia import Pendencia, ChaveReconciliacao, montar_chave_reconciliacao, valor_em_centavos, texto_chave
+
+
+# Atributos da Pendencia, na ordem das colunas do relatório
+CAMPOS_PENDENCIA = tuple(campo.name for campo in fields(Pendencia))
+
+# Atributos com poucos valores distintos, armazenados como colunas categóricas:
+# cada valor distinto é guardado uma única vez e compartilhado pelas linhas
+CAMPOS_CATEGORICOS = (
+    'STATUS', 'UNIDADE_NEGOCIO', 'EMPRESA', 'NOME_BANCO',
+    'NOME_CONTA', 'TIPO_TRANSACAO', 'DEPARTAMENTO'
+)
+
+# Nome de cada atributo na exportação para Excel (mesmos nomes de Pendencia.to_dict)
+COLUNAS_EXPORTACAO = {
+    'STATUS': 'STATUS',
+    'UNIDADE_NEGOCIO': 'UNIDADE_NEGOCIO',
+    'EMPRESA': 'EMPRESA',
+    'NOME_BANCO': 'NOME_BANCO',
+    'NOME_CONTA': 'NOME_CONTA',
+    'DATA_EXTRATO': 'DATA_EXTRATO',
+    'NUMERO_CONTA': 'NUMERO_CONTA',
+    'INFORMACAO_ADICIONAL': 'INFORMACAO_ADICIONAL',
+    'NUMERO_EXTRATO': 'NUMERO_EXTRATO',
+    'TIPO_TRANSACAO': 'TIPO_TRANSACAO',
+    'VALOR': 'VALOR',
+    'RESPONSAVEL': 'Responsável',  # Mantém nome original da coluna
+    'OBSERVACAO': 'Observação',    # Mantém nome original da coluna
+    'DEPARTAMENTO': 'Departamento',
+    'VENCIMENTO': 'Vencimento'
+}
+
+
+class PendenciaTabela:
+    """
+    Conjunto de pendências armazenado por colunas (uma coluna pandas por atributo).
+
+    É a alternativa à List[Pendencia] para volumes grandes: os extratores
+    montam a tabela diretamente a partir do DataFrame lido, e o ExcelWriter
+    a exporta sem criar um objeto e um dicionário por linha.
+
+    Para compatibilidade, a tabela também se comporta como uma sequência de
+    Pendencia: iteração e acesso por índice entregam objetos Pendencia
+    montados sob demanda. Esses objetos são cópias; alterá-los não altera
+    a tabela. No acesso por índice as colunas são convertidas para listas
+    Python no primeiro acesso e reaproveitadas nos seguintes (a tabela não
+    é alterada depois de criada): cada acesso monta apenas a Pendencia da linha.
+
+    As colunas de CAMPOS_CATEGORICOS usam o tipo categórico do pandas, de
+    forma que os objetos Pendencia montados compartilham a mesma string para
+    cada valor distinto (ex.: um único 'Não Reconciliada' para todas as linhas).
+
+    Uso:
+        tabela = PendenciaTabela.de_pendencias(pendencias)
+        for pendencia in tabela:
+            ...
+        df = tabela.para_dataframe()
+    """
+
+    def __init__(self, df: pd.DataFrame = None):
+        """
+        Args:
+            df: DataFrame com colunas nomeadas pelos atributos da Pendencia
+                (colunas ausentes ficam vazias e colunas extras são descartadas)
+        """
+        if df is None:
+            df = pd.DataFrame()
+        df = df.reindex(columns=list(CAMPOS_PENDENCIA)).reset_index(drop=True)
+
+        categoricas = {
+            campo: df[campo].astype('category')
+            for campo in CAMPOS_CATEGORICOS
+            if not isinstance(df[campo].dtype, pd.CategoricalDtype)
+        }
+        self._df = df.assign(**categoricas) if categoricas else df
+        # Colunas como listas Python, montadas no primeiro acesso por índice
+        self._colunas_linhas = None
+
+    @classmethod
+    def de_pendencias(cls, pendencias: Iterable[Pendencia]) -> 'PendenciaTabela':
+        """
+        Monta a tabela a partir de objetos Pendencia, coluna a coluna.
+
+        As colunas são montadas com tipo object, de forma que cada valor mantém
+        o tipo que tinha no objeto (ex.: um int em coluna com vazios não vira float).
+
+        Args:
+            pendencias: Pendências a serem armazenadas
+
+        Returns:
+            PendenciaTabela: Tabela com as pendências, na mesma ordem
+        """
+        if isinstance(pendencias, PendenciaTabela):
+            return pendencias
+
+        pendencias = list(pendencias)
+        return cls(pd.DataFrame({
+            campo: pd.Series([getattr(pendencia, campo) for pendencia in pendencias], dtype=object)
+            for campo in CAMPOS_PENDENCIA
+        }))
+
+    @classmethod
+    def concatenar(cls, tabelas: Iterable['PendenciaTabela']) -> 'PendenciaTabela':
+        """
+        Junta várias tabelas em uma só, na ordem recebida.
+
+        Args:
+            tabelas: Tabelas a serem concatenadas
+
+        Returns:
+            PendenciaTabela: Tabela com todas as linhas
+        """
+        dataframes = [tabela._df for tabela in tabelas if len(tabela) > 0]
+        if not dataframes:
+            return cls()
+        return cls(pd.concat(dataframes, ignore_index=True))
+
+    def linhas(self, posicoes) -> 'PendenciaTabela':
+        """
+        Seleciona linhas pela posição (com repetição, se houver).
+
+        Args:
+            posicoes: Posições das linhas, na ordem desejada
+
+        Returns:
+            PendenciaTabela: Nova tabela com as linhas selecionadas
+        """
+        return PendenciaTabela(self._df.take(posicoes))
+
+    def com_colunas(self, **colunas) -> 'PendenciaTabela':
+        """
+        Gera uma nova tabela substituindo colunas (a tabela atual não é alterada).
+
+        Args:
+            **colunas: Atributo -> novos valores (mesmo tamanho da tabela)
+
+        Returns:
+            PendenciaTabela: Nova tabela com as colunas substituídas
+        """
+        return PendenciaTabela(self._df.assign(**colunas))
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    def __iter__(self) -> Iterator[Pendencia]:
+        colunas = [self.valores(campo) for campo in CAMPOS_PENDENCIA]
+        for valores, chave in zip(zip(*colunas), self.chaves_reconciliacao()):
+            pendencia = Pendencia(*valores)
+            # A chave já foi montada para a tabela inteira
+            pendencia._chave_reconciliacao = chave
+            yield pendencia
+
+    def __getitem__(self, indice: Union[int, slice]) -> Union[Pendencia, 'PendenciaTabela']:
+        if isinstance(indice, slice):
+            return PendenciaTabela(self._df.iloc[indice])
+
+        # Valores convertidos como na iteração, uma única vez para a tabela inteira
+        if self._colunas_linhas is None:
+            self._colunas_linhas = [self.valores(campo) for campo in CAMPOS_PENDENCIA]
+        return Pendencia(*[coluna[indice] for coluna in self._colunas_linhas])
+
+    def coluna(self, campo: str) -> pd.Series:
+        """
+        Obtém a coluna de um atributo (sem cópia).
+
+        Args:
+            campo: Nome do atributo da Pendencia
+
+        Returns:
+            pd.Series: Coluna do atributo
+        """
+        return self._df[campo]
+
+    def valores(self, campo: str) -> list:
+        """
+        Obtém os valores de uma coluna como objetos Python, com None para nulos.
+
+        Args:
+            campo: Nome do atributo da Pendencia
+
+        Returns:
+            list: Valores da coluna (None para NaN/NaT)
+        """
+        serie = self._df[campo]
+        return serie.astype(object).where(serie.notna(), None).tolist()
+
+    def textos(self, campo: str) -> pd.Series:
+        """
+        Obtém uma coluna convertida para texto, com "" para nulos.
+
+        Mesma conversão usada na montagem das chaves de busca (str(valor)).
+
+        Args:
+            campo: Nome do atributo da Pendencia
+
+        Returns:
+            pd.Series: Coluna como texto
+        """
+        serie = self._df[campo]
+        if serie.dtype == object:
+            # Tipos misturados: conversão valor a valor
+            textos = serie.map(str, na_action='ignore')
+        else:
+            textos = serie.astype(str).astype(object)
+        return textos.where(serie.notna(), "")
+
+    def colunas_chave(self) -> pd.DataFrame:
+        """
+        Partes da chave de reconciliação em colunas, para junções entre tabelas.
+
+        Cada linha do DataFrame corresponde à tupla de Pendencia.chave_reconciliacao
+        (os textos seguem as regras de texto_chave).
+
+        Returns:
+            pd.DataFrame: Colunas VALOR (centavos), INFORMACAO_ADICIONAL e NOME_CONTA
+        """
+        return pd.DataFrame({
+            'VALOR': pd.Series(self.valores_centavos(), dtype=object),
+            'INFORMACAO_ADICIONAL': self.textos_chave('INFORMACAO_ADICIONAL'),
+            'NOME_CONTA': self.textos_chave('NOME_CONTA')
+        })
+
+    def textos_chave(self, campo: str) -> pd.Series:
+        """
+        Obtém uma coluna da chave convertida para texto, com as regras de texto_chave.
+
+        Args:
+            campo: INFORMACAO_ADICIONAL ou NOME_CONTA
+
+        Returns:
+            pd.Series: Coluna como texto ("" para nulos)
+        """
+        serie = self._df[campo]
+        if pd.api.types.is_string_dtype(serie) and not isinstance(serie.dtype, pd.CategoricalDtype):
+            textos = serie.astype(object)
+        else:
+            # Colunas categóricas convertem apenas os valores distintos
+            textos = serie.map(texto_chave, na_action='ignore').astype(object)
+        return textos.where(serie.notna(), "")
+
+    def chaves_reconciliacao(self) -> List[ChaveReconciliacao]:
+        """
+        Gera as chaves de reconciliação de todas as linhas.
+
+        Equivalente a Pendencia.chave_reconciliacao de cada linha, sem criar
+        os objetos Pendencia.
+
+        Returns:
+            List[ChaveReconciliacao]: Chaves de reconciliação, na ordem das linhas
+        """
+        return [
+            montar_chave_reconciliacao(centavos, informacao_adicional, nome_conta, centavos=True)
+            for centavos, informacao_adicional, nome_conta in zip(
+                self.valores_centavos(),
+                self.valores('INFORMACAO_ADICIONAL'),
+                self.valores('NOME_CONTA')
+            )
+        ]
+
+    def valores_centavos(self) -> list:
+        """
+        Obtém a coluna VALOR convertida para inteiros em centavos.
+
+        Colunas numéricas são convertidas de forma vetorizada; as demais valor
+        a valor, com as mesmas regras de Pendencia.valor_centavos.
+
+        Returns:
+            list: Valores em centavos (None para vazio)
+        """
+        serie = self._df['VALOR']
+        if not (pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie)):
+            return [valor_em_centavos(valor) for valor in self.valores('VALOR')]
+
+        centavos = np.rint(serie.to_numpy(dtype=float) * 100)
+        validos = np.isfinite(centavos)
+        if validos.all():
+            return centavos.astype(np.int64).tolist()
+
+        # Vazios (NaN) e infinitos seguem a regra valor a valor
+        return [
+            int(valor) if valido else valor_em_centavos(original)
+            for valor, valido, original in zip(centavos.tolist(), validos.tolist(), self.valores('VALOR'))
+        ]
+
+    def para_pendencias(self) -> List[Pendencia]:
+        """
+        Converte a tabela para lista de objetos Pendencia.
+
+        Returns:
+            List[Pendencia]: Pendências, na ordem das linhas
+        """
+        return list(self)
+
+    def para_dataframe(self) -> pd.DataFrame:
+        """
+        Gera o DataFrame de exportação, com os nomes e a ordem das colunas do relatório.
+
+        Returns:
+            pd.DataFrame: DataFrame com as colunas de Pendencia.to_dict
+        """
+        return self._df.rename(columns=COLUNAS_EXPORTACAO)
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Responsavel:
     """
     Entidade que representa um registro da sheet 'responsaveis' do arquivo DePara-CashFlow.
@@ -46,4 +46,26 @@ class Responsavel:
         info_str = str(self.INFORMACAO_ADICIONAL) if self.INFORMACAO_ADICIONAL is not None else ""
         tipo_str = str(self.TIPO_TRANSACAO) if self.TIPO_TRANSACAO is not None else ""
         
-        return f"{banco_str}{info_str}{tipo_str}" 
\ No newline at end of file
+        return f"{banco_str}{info_str}{tipo_str}"
+
+
+def criar_dicionario_responsaveis(responsaveis: Iterable[Responsavel]) -> Dict[str, Responsavel]:
+    """
+    Cria um dicionário de responsáveis indexado pela chave de identificação.
+    Chave: NOME_BANCO + INFORMACAO_ADICIONAL + TIPO_TRANSACAO
+    
+    Args:
+        responsaveis: Lista de responsáveis
+        
+    Returns:
+        Dict[str, Responsavel]: Dicionário chave -> responsável
+    """
+    responsaveis_dict = {}
+    
+    for responsavel in responsaveis:
+        chave = responsavel.get_chave_identificacao()
+        # Se houver chaves duplicadas, manter a primeira
+        if chave not in responsaveis_dict:
+            responsaveis_dict[chave] = responsavel
+    
+    return responsaveis_dict 
\ No newline at end of file
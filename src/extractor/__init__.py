@@ -1,12 +1,34 @@
 # Pacote de extração de dados
 
-from .excel_reader import extrair_pendencias, extrair_transacoes, extrair_resumo
-from .depara_reader import extrair_responsaveis, extrair_departamentos
+from .excel_reader import extrair_pendencias, extrair_transacoes, extrair_resumo, extrair_pendencias_e_resumo
+from .depara_reader import extrair_responsaveis, extrair_departamentos, carregar_depara, DeParaCompilado
+from .rel_sem_tratar_reader import (
+    extrair_novas_transacoes_rel_sem_tratar,
+    iterar_novas_transacoes_rel_sem_tratar,
+    iterar_lotes_rel_sem_tratar,
+    descrever_celulas_invalidas
+)
+from .leitor_excel import configurar_backend
+from .normalizacao import normalizar_transacoes, CelulaInvalida
+from .cache_leitura import configurar_cache
+from .sessao_planilha import SessaoPlanilha
 
 __all__ = [
     'extrair_pendencias', 
     'extrair_transacoes', 
     'extrair_resumo',
+    'extrair_pendencias_e_resumo',
     'extrair_responsaveis',
-    'extrair_departamentos'
+    'extrair_departamentos',
+    'carregar_depara',
+    'DeParaCompilado',
+    'extrair_novas_transacoes_rel_sem_tratar',
+    'iterar_novas_transacoes_rel_sem_tratar',
+    'iterar_lotes_rel_sem_tratar',
+    'descrever_celulas_invalidas',
+    'configurar_backend',
+    'normalizar_transacoes',
+    'CelulaInvalida',
+    'configurar_cache',
+    'SessaoPlanilha'
 ] 
\ No newline at end of file
@@ -0,0 +1,313 @@
+import os
+import stat
+import hashlib
+import importlib.util
+import pandas as pd
+from typing import Callable, Dict, Tuple, Optional
+from extractor.leitor_excel import obter_backend
+
+
+# Versão do formato dos dados lidos. Deve ser incrementada sempre que a forma
+# de leitura das planilhas mudar, para invalidar os caches gravados.
+VERSAO_LEITOR = 3
+
+# Configuração do cache (alterável via configurar_cache). Desligado por padrão:
+# precisa ser ativado explicitamente, pois grava os DataFrames lidos em disco.
+# O diretório é criado acessível apenas ao usuário atual.
+_config = {
+    'ativo': False,
+    'diretorio': os.path.join(os.path.expanduser('~'), '.cache', 'cash-flow-report'),
+    'tamanho_maximo': 512 * 1024 * 1024  # 512 MB
+}
+
+_EXTENSAO = '.parquet'
+
+# Erros de leitura de um arquivo de cache corrompido ou gravado por outra versão
+# (os erros do pyarrow derivam de OSError, ValueError ou TypeError)
+_ERROS_LEITURA_CACHE = (OSError, ValueError, TypeError)
+
+# Erros de gravação de um DataFrame que o Parquet não representa (ex.: coluna
+# com textos e números misturados, nomes de coluna não textuais)
+_ERROS_CONVERSAO_CACHE = (ValueError, TypeError)
+
+# Hash de conteúdo já calculado no processo: caminho -> ((mtime, tamanho), hash)
+_hashes_calculados: Dict[str, Tuple[Tuple[float, int], str]] = {}
+
+
+def configurar_cache(ativo: Optional[bool] = None,
+                     diretorio: Optional[str] = None,
+                     tamanho_maximo: Optional[int] = None) -> None:
+    """
+    Altera a configuração do cache em disco das planilhas lidas.
+
+    O cache vem desligado; use configurar_cache(ativo=True) para ativá-lo.
+    Os DataFrames são gravados em Parquet, o que requer o pyarrow: sem ele o
+    cache permanece desligado.
+
+    Args:
+        ativo: Liga/desliga o cache
+        diretorio: Diretório onde os arquivos de cache são gravados
+        tamanho_maximo: Tamanho total máximo do cache em bytes (LRU acima disso)
+    """
+    if ativo is not None:
+        if ativo and not _parquet_disponivel():
+            print("⚠️ Aviso: pyarrow não está instalado; o cache de leitura permanece desligado.")
+        _config['ativo'] = ativo
+    if diretorio is not None:
+        _config['diretorio'] = diretorio
+    if tamanho_maximo is not None:
+        _config['tamanho_maximo'] = tamanho_maximo
+
+
+def obter_configuracao_cache() -> Dict[str, object]:
+    """
+    Obtém a configuração atual do cache (argumentos de configurar_cache).
+
+    Usada para repassar a mesma configuração a outros processos, que não
+    herdam o estado deste módulo quando são criados por spawn (padrão no
+    Windows e no macOS).
+
+    Returns:
+        Dict[str, object]: Cópia da configuração (ativo, diretorio, tamanho_maximo)
+    """
+    return dict(_config)
+
+
+def ler_com_cache(caminho: str, aba, identificador: str,
+                  leitor: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    """
+    Lê uma planilha usando o cache em disco quando possível.
+
+    Se o cache estiver desligado (padrão), apenas executa o `leitor`.
+
+    O cache é indexado pelo hash do conteúdo do arquivo, pelo nome da aba,
+    pelo identificador do leitor, pelo backend de leitura em uso (os backends
+    entregam tipos diferentes para as mesmas células) e por VERSAO_LEITOR.
+    Em caso de acerto o DataFrame é carregado de um arquivo Parquet (formato
+    colunar), sem passar pelo parser do Excel. Em caso de falha o `leitor` é
+    executado e o resultado é gravado para as próximas execuções; um arquivo
+    de cache que não pode ser carregado gera um aviso. DataFrames que o
+    Parquet não reproduz exatamente (ex.: colunas com tipos misturados) não
+    são gravados, e sem o pyarrow o cache não é usado.
+    
+    Os arquivos de cache só são lidos de um diretório que pertence ao usuário
+    atual e não pode ser alterado por outros usuários.
+
+    Args:
+        caminho: Caminho para o arquivo Excel
+        aba: Nome da aba/sheet lida (ou None para a aba ativa)
+        identificador: Nome do leitor (diferencia leituras do mesmo arquivo)
+        leitor: Função que efetivamente lê a planilha
+
+    Returns:
+        pd.DataFrame: DataFrame lido (do cache ou do arquivo)
+
+    Raises:
+        FileNotFoundError: Se o arquivo não for encontrado
+    """
+    if not _config['ativo'] or not _parquet_disponivel() or not _preparar_diretorio():
+        return leitor()
+
+    caminho_cache = _caminho_cache(caminho, aba, identificador)
+
+    if os.path.exists(caminho_cache):
+        try:
+            df = pd.read_parquet(caminho_cache)
+            # Atualizar data de uso para a política LRU
+            os.utime(caminho_cache, None)
+            return df
+        except _ERROS_LEITURA_CACHE as e:
+            # Cache corrompido ou incompatível: ler novamente do Excel
+            print(f"⚠️ Aviso: Cache de '{caminho}' ignorado, não foi possível carregá-lo ({e}). Relendo a planilha.")
+
+    df = leitor()
+    _gravar_cache(caminho_cache, df)
+    return df
+
+
+def limpar_cache() -> None:
+    """
+    Remove todos os arquivos do cache em disco.
+    """
+    for caminho, _, _ in _listar_arquivos_cache():
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+    _hashes_calculados.clear()
+
+
+def _parquet_disponivel() -> bool:
+    """
+    Verifica se o pyarrow (usado para gravar e ler Parquet) está instalado.
+
+    Returns:
+        bool: True se disponível
+    """
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def _preparar_diretorio() -> bool:
+    """
+    Cria o diretório do cache (acessível apenas ao usuário atual) e verifica se é privado.
+
+    Um diretório de outro usuário, ou que outros usuários podem alterar, não é
+    usado: os arquivos nele poderiam ter sido trocados. Um diretório próprio
+    com permissões abertas tem as permissões restringidas.
+
+    Returns:
+        bool: True se o diretório pode ser usado
+    """
+    diretorio = _config['diretorio']
+    try:
+        os.makedirs(diretorio, mode=0o700, exist_ok=True)
+        info = os.stat(diretorio)
+        # Sem dono/permissões POSIX (Windows): o diretório no perfil do usuário já é privado
+        if not hasattr(os, 'getuid'):
+            return True
+        if info.st_uid != os.getuid():
+            print(f"⚠️ Aviso: O diretório de cache '{diretorio}' pertence a outro usuário; cache não usado.")
+            return False
+        if stat.S_IMODE(info.st_mode) & 0o077:
+            os.chmod(diretorio, 0o700)
+        return True
+    except OSError as e:
+        print(f"⚠️ Aviso: Não foi possível usar o diretório de cache '{diretorio}' ({e}).")
+        return False
+
+
+def _caminho_cache(caminho: str, aba, identificador: str) -> str:
+    """
+    Monta o caminho do arquivo de cache de uma leitura.
+
+    Args:
+        caminho: Caminho para o arquivo Excel
+        aba: Nome da aba/sheet lida
+        identificador: Nome do leitor
+
+    Returns:
+        str: Caminho do arquivo de cache
+    """
+    chave = f"{hash_arquivo(caminho)}|{aba}|{identificador}|{obter_backend()}|{VERSAO_LEITOR}"
+    nome = hashlib.sha256(chave.encode('utf-8')).hexdigest()
+    return os.path.join(_config['diretorio'], nome + _EXTENSAO)
+
+
+def hash_arquivo(caminho: str) -> str:
+    """
+    Calcula o hash SHA-256 do conteúdo do arquivo.
+
+    O hash é memorizado no processo enquanto a data de modificação e o
+    tamanho do arquivo não mudarem. Identifica o conteúdo do arquivo, e não
+    o caminho: uma cópia sem alterações tem o mesmo hash.
+
+    Args:
+        caminho: Caminho para o arquivo
+
+    Returns:
+        str: Hash hexadecimal do conteúdo
+    """
+    caminho_absoluto = os.path.abspath(caminho)
+    stat = os.stat(caminho_absoluto)
+    assinatura = (stat.st_mtime, stat.st_size)
+
+    em_cache = _hashes_calculados.get(caminho_absoluto)
+    if em_cache is not None and em_cache[0] == assinatura:
+        return em_cache[1]
+
+    sha = hashlib.sha256()
+    with open(caminho_absoluto, 'rb') as f:
+        for bloco in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(bloco)
+
+    valor_hash = sha.hexdigest()
+    _hashes_calculados[caminho_absoluto] = (assinatura, valor_hash)
+    return valor_hash
+
+
+def _gravar_cache(caminho_cache: str, df: pd.DataFrame) -> None:
+    """
+    Grava o DataFrame no cache e aplica a política de remoção LRU.
+
+    O arquivo gravado é relido e comparado com o DataFrame: se o Parquet não
+    o reproduzir exatamente (tipos das colunas ou valores), ele é descartado e
+    a planilha continua sendo lida do Excel. Falhas de escrita apenas geram um
+    aviso: o cache é só uma otimização.
+
+    Args:
+        caminho_cache: Caminho do arquivo de cache
+        df: DataFrame a ser gravado
+    """
+    temporario = f"{caminho_cache}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(temporario)
+        if not pd.read_parquet(temporario).equals(df):
+            os.remove(temporario)
+            return
+        os.replace(temporario, caminho_cache)
+    except _ERROS_CONVERSAO_CACHE:
+        # DataFrame não representável em Parquet: não é gravado
+        _remover_temporario(temporario)
+        return
+    except OSError as e:
+        _remover_temporario(temporario)
+        print(f"⚠️ Aviso: Não foi possível gravar o cache em '{_config['diretorio']}' ({e}).")
+        return
+
+    _remover_excedentes()
+
+
+def _remover_temporario(temporario: str) -> None:
+    """
+    Remove o arquivo temporário de uma gravação que não foi concluída.
+
+    Args:
+        temporario: Caminho do arquivo temporário
+    """
+    try:
+        os.remove(temporario)
+    except OSError:
+        pass
+
+
+def _remover_excedentes() -> None:
+    """
+    Remove os arquivos menos usados recentemente até o cache caber no tamanho máximo.
+    """
+    arquivos = _listar_arquivos_cache()
+    total = sum(tamanho for _, tamanho, _ in arquivos)
+
+    # Mais antigos (menos usados recentemente) primeiro
+    for caminho, tamanho, _ in sorted(arquivos, key=lambda arquivo: arquivo[2]):
+        if total <= _config['tamanho_maximo']:
+            break
+        try:
+            os.remove(caminho)
+            total -= tamanho
+        except OSError:
+            pass
+
+
+def _listar_arquivos_cache():
+    """
+    Lista os arquivos do cache.
+
+    Returns:
+        list: Tuplas (caminho, tamanho, data de último uso)
+    """
+    diretorio = _config['diretorio']
+    if not os.path.isdir(diretorio):
+        return []
+
+    arquivos = []
+    for nome in os.listdir(diretorio):
+        if not nome.endswith(_EXTENSAO):
+            continue
+        caminho = os.path.join(diretorio, nome)
+        try:
+            stat = os.stat(caminho)
+        except OSError:
+            continue
+        arquivos.append((caminho, stat.st_size, stat.st_mtime))
+
+    return arquivos
@@ -1,7 +1,171 @@
+import os
 import pandas as pd
-from typing import List
-from entities.responsavel import Responsavel
-from entities.departamento import Departamento
+from dataclasses import dataclass
+from typing import List, Dict, Tuple, Optional
+from entities.responsavel import Responsavel, criar_dicionario_responsaveis
+from entities.departamento import Departamento, criar_dicionario_departamentos
+from services.regras_responsaveis import RegrasResponsaveis
+from extractor.leitor_excel import ler_planilha, projecao_colunas
+
+
+@dataclass
+class DeParaCompilado:
+    """
+    Conteúdo do arquivo DePara-CashFlow já convertido e indexado.
+    
+    Contém as listas lidas das sheets 'responsaveis' e 'departamentos', os
+    dicionários de lookup usados pelo ConciliacaoService e as regras de
+    responsável com curinga ('*') já compiladas.
+    """
+    responsaveis: List[Responsavel]
+    departamentos: List[Departamento]
+    responsaveis_dict: Dict[str, Responsavel]  # chave de identificação -> responsável
+    departamentos_dict: Dict[str, Departamento]  # responsável -> departamento
+    regras_responsaveis: RegrasResponsaveis  # regras com curinga em INFORMACAO_ADICIONAL
+
+
+# Mapeamento atributo -> nomes possíveis da coluna na sheet 'responsaveis'
+MAPEAMENTO_COLUNAS_RESPONSAVEL = {
+    'NOME_BANCO': 'NOME_BANCO',
+    'INFORMACAO_ADICIONAL': 'INFORMACAO_ADICIONAL',
+    'TIPO_TRANSACAO': 'TIPO_TRANSACAO',
+    'RESPONSAVEL': ['RESPONSAVEL ', 'RESPONSAVEL'],  # Com e sem espaço
+    'OBSERVACAO': ['OBSERVAÇÃO', 'OBSERVACAO']
+}
+
+# Mapeamento atributo -> nomes possíveis da coluna na sheet 'departamentos'
+MAPEAMENTO_COLUNAS_DEPARTAMENTO = {
+    'RESPONSAVEL': ['Responsável', 'RESPONSAVEL'],
+    'AREA': ['Área', 'AREA']
+}
+
+# Projeção de colunas: apenas as colunas dos esquemas são lidas
+_COLUNAS_RESPONSAVEL = projecao_colunas(MAPEAMENTO_COLUNAS_RESPONSAVEL)
+_COLUNAS_DEPARTAMENTO = projecao_colunas(MAPEAMENTO_COLUNAS_DEPARTAMENTO)
+_COLUNAS_DEPARA = projecao_colunas(MAPEAMENTO_COLUNAS_RESPONSAVEL, MAPEAMENTO_COLUNAS_DEPARTAMENTO)
+
+
+# Cache em nível de processo: (caminho absoluto, abas) -> ((mtime, tamanho), DePara compilado)
+_cache_depara: Dict[Tuple[str, str, str], Tuple[Tuple[float, int], DeParaCompilado]] = {}
+
+
+def carregar_depara(caminho: str,
+                    aba_responsaveis: str = 'responsaveis',
+                    aba_departamentos: str = 'departamentos') -> DeParaCompilado:
+    """
+    Carrega as sheets de responsáveis e departamentos do DePara-CashFlow.
+    
+    As duas sheets são lidas em uma única abertura do arquivo e os dicionários
+    de lookup são montados uma vez. O resultado fica em cache no processo e só
+    é recarregado quando a data de modificação ou o tamanho do arquivo mudam.
+    
+    Args:
+        caminho: Caminho para o arquivo Excel DePara-CashFlow
+        aba_responsaveis: Nome da aba de responsáveis (padrão: 'responsaveis')
+        aba_departamentos: Nome da aba de departamentos (padrão: 'departamentos')
+        
+    Returns:
+        DeParaCompilado: Listas e dicionários de lookup do DePara
+        
+    Raises:
+        FileNotFoundError: Se o arquivo não for encontrado
+        ValueError: Se alguma aba não existir ou houver erro de formato
+    """
+    em_cache = obter_depara_em_cache(caminho, aba_responsaveis, aba_departamentos)
+    if em_cache is not None:
+        return em_cache
+    
+    try:
+        abas = ler_planilha(caminho, [aba_responsaveis, aba_departamentos], usecols=_COLUNAS_DEPARA)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo DePara não encontrado: {caminho}")
+    except ValueError as e:
+        if "Worksheet" in str(e):
+            raise ValueError(f"Aba não encontrada no arquivo DePara: {str(e)}")
+        raise ValueError(f"Erro ao processar dados do arquivo DePara: {str(e)}")
+    
+    responsaveis = _dataframe_para_responsaveis(abas[aba_responsaveis])
+    departamentos = _dataframe_para_departamentos(abas[aba_departamentos])
+    
+    depara = DeParaCompilado(
+        responsaveis=responsaveis,
+        departamentos=departamentos,
+        responsaveis_dict=criar_dicionario_responsaveis(responsaveis),
+        departamentos_dict=criar_dicionario_departamentos(departamentos),
+        regras_responsaveis=RegrasResponsaveis(responsaveis)
+    )
+    
+    registrar_depara_em_cache(caminho, depara, aba_responsaveis, aba_departamentos)
+    return depara
+
+
+def obter_depara_em_cache(caminho: str,
+                          aba_responsaveis: str = 'responsaveis',
+                          aba_departamentos: str = 'departamentos') -> Optional[DeParaCompilado]:
+    """
+    Obtém o DePara do cache do processo, se ainda válido.
+    
+    Args:
+        caminho: Caminho para o arquivo Excel DePara-CashFlow
+        aba_responsaveis: Nome da aba de responsáveis
+        aba_departamentos: Nome da aba de departamentos
+        
+    Returns:
+        Optional[DeParaCompilado]: DePara em cache ou None se ausente/desatualizado
+        
+    Raises:
+        FileNotFoundError: Se o arquivo não for encontrado
+    """
+    caminho_absoluto = os.path.abspath(caminho)
+    em_cache = _cache_depara.get((caminho_absoluto, aba_responsaveis, aba_departamentos))
+    
+    if em_cache is not None and em_cache[0] == _assinatura_arquivo(caminho_absoluto):
+        return em_cache[1]
+    return None
+
+
+def registrar_depara_em_cache(caminho: str, depara: DeParaCompilado,
+                              aba_responsaveis: str = 'responsaveis',
+                              aba_departamentos: str = 'departamentos') -> None:
+    """
+    Registra no cache do processo um DePara carregado (ex.: em outro processo).
+    
+    Args:
+        caminho: Caminho para o arquivo Excel DePara-CashFlow
+        depara: DePara já carregado
+        aba_responsaveis: Nome da aba de responsáveis
+        aba_departamentos: Nome da aba de departamentos
+    """
+    caminho_absoluto = os.path.abspath(caminho)
+    chave_cache = (caminho_absoluto, aba_responsaveis, aba_departamentos)
+    _cache_depara[chave_cache] = (_assinatura_arquivo(caminho_absoluto), depara)
+
+
+def _assinatura_arquivo(caminho: str) -> Tuple[float, int]:
+    """
+    Obtém a assinatura (mtime, tamanho) usada para invalidar o cache.
+    
+    Args:
+        caminho: Caminho para o arquivo
+        
+    Returns:
+        Tuple[float, int]: Data de modificação e tamanho do arquivo
+        
+    Raises:
+        FileNotFoundError: Se o arquivo não for encontrado
+    """
+    try:
+        stat = os.stat(caminho)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo DePara não encontrado: {caminho}")
+    return (stat.st_mtime, stat.st_size)
+
+
+def limpar_cache_depara() -> None:
+    """
+    Descarta todos os DePara mantidos em cache no processo.
+    """
+    _cache_depara.clear()
 
 
 def extrair_responsaveis(caminho: str, aba: str = 'responsaveis') -> List[Responsavel]:
@@ -20,7 +184,7 @@ def extrair_responsaveis(caminho: str, aba: str = 'responsaveis') -> List[Respon
         ValueError: Se a aba não existir ou houver erro de formato
     """
     try:
-        df = pd.read_excel(caminho, sheet_name=aba, engine='openpyxl')
+        df = ler_planilha(caminho, aba, usecols=_COLUNAS_RESPONSAVEL)
         return _dataframe_para_responsaveis(df)
     except FileNotFoundError:
         raise FileNotFoundError(f"Arquivo DePara não encontrado: {caminho}")
@@ -46,7 +210,7 @@ def extrair_departamentos(caminho: str, aba: str = 'departamentos') -> List[Depa
         ValueError: Se a aba não existir ou houver erro de formato
     """
     try:
-        df = pd.read_excel(caminho, sheet_name=aba, engine='openpyxl')
+        df = ler_planilha(caminho, aba, usecols=_COLUNAS_DEPARTAMENTO)
         return _dataframe_para_departamentos(df)
     except FileNotFoundError:
         raise FileNotFoundError(f"Arquivo DePara não encontrado: {caminho}")
@@ -69,13 +233,10 @@ def _dataframe_para_responsaveis(df: pd.DataFrame) -> List[Responsavel]:
     responsaveis = []
     
     for _, row in df.iterrows():
-        responsavel = Responsavel(
-            NOME_BANCO=_get_valor_coluna(row, 'NOME_BANCO'),
-            INFORMACAO_ADICIONAL=_get_valor_coluna(row, 'INFORMACAO_ADICIONAL'),
-            TIPO_TRANSACAO=_get_valor_coluna(row, 'TIPO_TRANSACAO'),
-            RESPONSAVEL=_get_valor_coluna(row, ['RESPONSAVEL ', 'RESPONSAVEL']),  # Com e sem espaço
-            OBSERVACAO=_get_valor_coluna(row, ['OBSERVAÇÃO', 'OBSERVACAO'])
-        )
+        responsavel = Responsavel(**{
+            atributo: _get_valor_coluna(row, nomes_coluna)
+            for atributo, nomes_coluna in MAPEAMENTO_COLUNAS_RESPONSAVEL.items()
+        })
         
         responsaveis.append(responsavel)
     
@@ -95,10 +256,10 @@ def _dataframe_para_departamentos(df: pd.DataFrame) -> List[Departamento]:
     departamentos = []
     
     for _, row in df.iterrows():
-        departamento = Departamento(
-            RESPONSAVEL=_get_valor_coluna(row, ['Responsável', 'RESPONSAVEL']),
-            AREA=_get_valor_coluna(row, ['Área', 'AREA'])
-        )
+        departamento = Departamento(**{
+            atributo: _get_valor_coluna(row, nomes_coluna)
+            for atributo, nomes_coluna in MAPEAMENTO_COLUNAS_DEPARTAMENTO.items()
+        })
         
         departamentos.append(departamento)
     
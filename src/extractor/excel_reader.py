@@ -1,26 +1,64 @@
 import pandas as pd
-from typing import List
+from typing import List, Optional, Tuple, Union
 from entities.pendencia import Pendencia
+from entities.pendencia_tabela import PendenciaTabela
+from extractor.cache_leitura import ler_com_cache
+from extractor.leitor_excel import ler_planilha, projecao_colunas
+from extractor.sessao_planilha import SessaoPlanilha
 
 
-def extrair_pendencias(caminho: str, aba: str) -> List[Pendencia]:
+# Mapeamento atributo da Pendencia -> nomes possíveis da coluna no Excel
+# Lidar com possíveis diferenças nos nomes das colunas
+MAPEAMENTO_COLUNAS_PENDENCIA = {
+    'STATUS': 'STATUS',
+    'UNIDADE_NEGOCIO': 'UNIDADE_NEGOCIO',
+    'EMPRESA': 'EMPRESA',
+    'NOME_BANCO': 'NOME_BANCO',
+    'NOME_CONTA': 'NOME_CONTA',
+    'DATA_EXTRATO': 'DATA_EXTRATO',
+    'NUMERO_CONTA': 'NUMERO_CONTA',
+    'INFORMACAO_ADICIONAL': 'INFORMACAO_ADICIONAL',
+    'NUMERO_EXTRATO': 'NUMERO_EXTRATO',
+    'TIPO_TRANSACAO': 'TIPO_TRANSACAO',
+    'VALOR': 'VALOR',
+    'RESPONSAVEL': ['Responsável', 'RESPONSAVEL'],
+    'OBSERVACAO': ['Observação', 'OBSERVACAO'],
+    'DEPARTAMENTO': ['Departamento', 'DEPARTAMENTO'],
+    'VENCIMENTO': ['Vencimento', 'VENCIMENTO']
+}
+
+# Projeção de colunas: apenas as colunas do esquema da Pendencia são lidas
+_COLUNAS_PENDENCIA = projecao_colunas(MAPEAMENTO_COLUNAS_PENDENCIA)
+
+
+def extrair_pendencias(caminho: str, aba: str,
+                       sessao: Optional[SessaoPlanilha] = None,
+                       como_tabela: bool = False) -> Union[List[Pendencia], PendenciaTabela]:
     """
     Extrai pendências existentes de uma planilha Excel.
     
     Args:
         caminho: Caminho para o arquivo Excel
         aba: Nome da aba/sheet a ser lida
+        sessao: Sessão já aberta do mesmo arquivo (opcional, evita reabri-lo)
+        como_tabela: Se True, retorna PendenciaTabela (colunar) em vez de lista de objetos
         
     Returns:
-        List[Pendencia]: Lista de objetos Pendencia
+        List[Pendencia] ou PendenciaTabela: Pendências extraídas
         
     Raises:
         FileNotFoundError: Se o arquivo não for encontrado
         ValueError: Se a aba não existir ou houver erro de formato
     """
     try:
-        df = pd.read_excel(caminho, sheet_name=aba, engine='openpyxl')
-        return _dataframe_para_pendencias(df)
+        if sessao is not None:
+            leitor = lambda: sessao.ler_aba(aba, usecols=_COLUNAS_PENDENCIA)
+        else:
+            leitor = lambda: ler_planilha(caminho, aba, usecols=_COLUNAS_PENDENCIA)
+        
+        df = ler_com_cache(caminho, aba, 'planilha', leitor)
+        tabela = _dataframe_para_tabela(df)
+        return tabela if como_tabela else tabela.para_pendencias()
     except FileNotFoundError:
         raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
     except ValueError as e:
@@ -45,7 +83,8 @@ def extrair_transacoes(caminho: str, aba: str) -> List[Pendencia]:
         ValueError: Se a aba não existir ou houver erro de formato
     """
     try:
-        df = pd.read_excel(caminho, sheet_name=aba, engine='openpyxl')
+        df = ler_com_cache(caminho, aba, 'planilha',
+                           lambda: ler_planilha(caminho, aba, usecols=_COLUNAS_PENDENCIA))
         return _dataframe_para_pendencias(df)
     except FileNotFoundError:
         raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
@@ -55,27 +94,62 @@ def extrair_transacoes(caminho: str, aba: str) -> List[Pendencia]:
         raise ValueError(f"Erro ao processar dados da aba '{aba}': {str(e)}")
 
 
-def extrair_resumo(caminho: str) -> pd.DataFrame:
+def extrair_resumo(caminho: str, sessao: Optional[SessaoPlanilha] = None) -> pd.DataFrame:
     """
     Extrai a planilha de resumo para preservação no arquivo de saída.
     
     Args:
         caminho: Caminho para o arquivo Excel
+        sessao: Sessão já aberta do mesmo arquivo (opcional, evita reabri-lo)
         
     Returns:
-        pd.DataFrame: DataFrame com os dados do resumo
+        pd.DataFrame: DataFrame com os dados do resumo (vazio se a aba 'Resumo' não existir)
         
     Raises:
         FileNotFoundError: Se o arquivo não for encontrado
-        ValueError: Se a aba 'Resumo' não existir
+        ValueError: Se houver erro de formato na aba 'Resumo'
     """
     try:
-        return pd.read_excel(caminho, sheet_name='Resumo', engine='openpyxl')
+        if sessao is not None:
+            # Verifica a aba sem ler o conteúdo do arquivo
+            if not sessao.possui_aba('Resumo'):
+                return pd.DataFrame()
+            leitor = lambda: sessao.ler_aba('Resumo')
+        else:
+            leitor = lambda: ler_planilha(caminho, 'Resumo')
+        
+        return ler_com_cache(caminho, 'Resumo', 'planilha', leitor)
     except FileNotFoundError:
         raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
-    except ValueError:
+    except ValueError as e:
         # Se não existe aba Resumo, retorna DataFrame vazio
-        return pd.DataFrame()
+        if "Worksheet" in str(e):
+            return pd.DataFrame()
+        raise ValueError(f"Erro ao processar dados da aba 'Resumo': {str(e)}")
+
+
+def extrair_pendencias_e_resumo(caminho: str, aba: str,
+                                como_tabela: bool = False) -> Tuple[Union[List[Pendencia], PendenciaTabela], pd.DataFrame]:
+    """
+    Extrai as pendências existentes e a aba 'Resumo' abrindo o arquivo uma única vez.
+    
+    Args:
+        caminho: Caminho para o arquivo Excel de pendências
+        aba: Nome da aba/sheet de pendências
+        como_tabela: Se True, as pendências são retornadas como PendenciaTabela
+        
+    Returns:
+        Tuple: Pendências e resumo (vazio se não houver aba 'Resumo')
+        
+    Raises:
+        FileNotFoundError: Se o arquivo não for encontrado
+        ValueError: Se a aba de pendências não existir ou houver erro de formato
+    """
+    with SessaoPlanilha(caminho) as sessao:
+        pendencias = extrair_pendencias(caminho, aba, sessao, como_tabela)
+        df_resumo = extrair_resumo(caminho, sessao)
+    
+    return pendencias, df_resumo
 
 
 def _dataframe_para_pendencias(df: pd.DataFrame) -> List[Pendencia]:
@@ -88,54 +162,48 @@ def _dataframe_para_pendencias(df: pd.DataFrame) -> List[Pendencia]:
     Returns:
         List[Pendencia]: Lista de objetos Pendencia
     """
-    pendencias = []
+    return _dataframe_para_tabela(df).para_pendencias()
+
+
+def _dataframe_para_tabela(df: pd.DataFrame) -> PendenciaTabela:
+    """
+    Converte um DataFrame pandas para PendenciaTabela.
     
-    for _, row in df.iterrows():
-        # Mapear colunas do DataFrame para atributos da Pendencia
-        # Lidar com possíveis diferenças nos nomes das colunas
-        pendencia = Pendencia(
-            STATUS=_get_valor_coluna(row, 'STATUS'),
-            UNIDADE_NEGOCIO=_get_valor_coluna(row, 'UNIDADE_NEGOCIO'),
-            EMPRESA=_get_valor_coluna(row, 'EMPRESA'),
-            NOME_BANCO=_get_valor_coluna(row, 'NOME_BANCO'),
-            NOME_CONTA=_get_valor_coluna(row, 'NOME_CONTA'),
-            DATA_EXTRATO=_get_valor_coluna(row, 'DATA_EXTRATO'),
-            NUMERO_CONTA=_get_valor_coluna(row, 'NUMERO_CONTA'),
-            INFORMACAO_ADICIONAL=_get_valor_coluna(row, 'INFORMACAO_ADICIONAL'),
-            NUMERO_EXTRATO=_get_valor_coluna(row, 'NUMERO_EXTRATO'),
-            TIPO_TRANSACAO=_get_valor_coluna(row, 'TIPO_TRANSACAO'),
-            VALOR=_get_valor_coluna(row, 'VALOR'),
-            RESPONSAVEL=_get_valor_coluna(row, ['Responsável', 'RESPONSAVEL']),
-            OBSERVACAO=_get_valor_coluna(row, ['Observação', 'OBSERVACAO']),
-            DEPARTAMENTO=_get_valor_coluna(row, ['Departamento', 'DEPARTAMENTO']),
-            VENCIMENTO=_get_valor_coluna(row, ['Vencimento', 'VENCIMENTO'])
-        )
+    Os nomes alternativos de cada atributo são resolvidos uma única vez por
+    arquivo e as colunas são apenas renomeadas, sem cópia linha a linha.
+    Atributos sem coluna correspondente ficam vazios.
+    
+    Args:
+        df: DataFrame com os dados
         
-        pendencias.append(pendencia)
+    Returns:
+        PendenciaTabela: Pendências em formato colunar
+    """
+    renomear = {}
+    for atributo, nomes_coluna in MAPEAMENTO_COLUNAS_PENDENCIA.items():
+        nome = _resolver_nome_coluna(df.columns, nomes_coluna)
+        if nome is not None:
+            renomear[nome] = atributo
     
-    return pendencias
+    return PendenciaTabela(df[list(renomear)].rename(columns=renomear))
 
 
-def _get_valor_coluna(row, nomes_coluna):
+def _resolver_nome_coluna(colunas, nomes_coluna):
     """
-    Obtém o valor de uma coluna, testando diferentes nomes possíveis.
+    Resolve qual dos nomes possíveis existe nas colunas do DataFrame.
     
     Args:
-        row: Linha do DataFrame
+        colunas: Colunas do DataFrame
         nomes_coluna: Nome da coluna ou lista de nomes possíveis
         
     Returns:
-        Valor da coluna ou None se não encontrada
+        Nome da coluna encontrada ou None se nenhuma existir
     """
     if isinstance(nomes_coluna, str):
         nomes_coluna = [nomes_coluna]
     
     for nome in nomes_coluna:
-        if nome in row.index:
-            valor = row[nome]
-            # Retornar None para valores NaN/NaT
-            if pd.isna(valor):
-                return None
-            return valor
+        if nome in colunas:
+            return nome
     
-    return None 
\ No newline at end of file
+    return None
@@ -0,0 +1,202 @@
+import importlib.util
+import pandas as pd
+from datetime import date, datetime
+from typing import Iterator, Optional, Callable, Dict, Union, List
+from openpyxl import load_workbook
+
+
+# Backends de leitura suportados, do mais rápido para o mais lento
+BACKEND_CALAMINE = 'calamine'
+BACKEND_OPENPYXL = 'openpyxl'
+BACKENDS = (BACKEND_CALAMINE, BACKEND_OPENPYXL)
+
+# Configuração do backend (alterável via configurar_backend). O padrão é o
+# openpyxl, usado originalmente; o calamine precisa ser escolhido explicitamente.
+_config = {
+    'backend': BACKEND_OPENPYXL
+}
+
+
+def configurar_backend(backend: str) -> None:
+    """
+    Seleciona o backend usado para ler as planilhas Excel.
+
+    Se o backend escolhido não estiver instalado, a leitura usa openpyxl.
+
+    Tipos entregues pelo calamine: na leitura via DataFrame (pd.read_excel) são
+    os mesmos do openpyxl. Na leitura linha a linha o calamine entrega todo
+    número como float e datas como date; iterar_linhas converte essas células
+    para os tipos do openpyxl. A comparação de tempo e de resultado entre os
+    backends está em benchmarks/bench_backends_excel.py.
+
+    Args:
+        backend: 'calamine' (parser nativo, rápido) ou 'openpyxl'
+
+    Raises:
+        ValueError: Se o backend não for suportado
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend de leitura inválido: '{backend}'. Opções: {', '.join(BACKENDS)}")
+    _config['backend'] = backend
+
+
+def obter_backend() -> str:
+    """
+    Obtém o backend efetivamente usado na leitura.
+
+    Returns:
+        str: Backend configurado, ou 'openpyxl' se o configurado não estiver disponível
+    """
+    backend = _config['backend']
+    if backend == BACKEND_CALAMINE and not _calamine_disponivel():
+        return BACKEND_OPENPYXL
+    return backend
+
+
+def ler_planilha(caminho: str, aba=0, **kwargs):
+    """
+    Lê uma ou mais abas de um arquivo Excel para DataFrame com o backend configurado.
+
+    Args:
+        caminho: Caminho para o arquivo Excel
+        aba: Nome/índice da aba ou lista de abas (mesma semântica de sheet_name do pandas)
+        **kwargs: Demais parâmetros repassados para pd.read_excel
+
+    Returns:
+        pd.DataFrame ou dict de DataFrames (quando `aba` é uma lista)
+
+    Raises:
+        FileNotFoundError: Se o arquivo não for encontrado
+        ValueError: Se a aba não existir ou houver erro de formato
+    """
+    return pd.read_excel(caminho, sheet_name=aba, engine=obter_backend(), **kwargs)
+
+
+def projecao_colunas(*mapeamentos: Dict[str, Union[str, List[str]]],
+                     limpar_nome: Optional[Callable[[str], str]] = None) -> Callable[[object], bool]:
+    """
+    Monta o filtro de colunas (usecols do pandas) a partir dos esquemas das entidades.
+
+    Apenas as colunas cujo nome aparece como nome possível em algum dos
+    mapeamentos atributo -> nome(s) de coluna são lidas; as demais (ex.:
+    colunas de texto livre não utilizadas) são descartadas na leitura.
+
+    Args:
+        *mapeamentos: Dicionários atributo -> nome da coluna ou lista de nomes possíveis
+        limpar_nome: Função aplicada ao nome da coluna antes da comparação (opcional)
+
+    Returns:
+        Callable[[object], bool]: Função que indica se a coluna deve ser lida
+    """
+    nomes = set()
+    for mapeamento in mapeamentos:
+        for nomes_coluna in mapeamento.values():
+            if isinstance(nomes_coluna, str):
+                nomes.add(nomes_coluna)
+            else:
+                nomes.update(nomes_coluna)
+
+    def usar_coluna(nome) -> bool:
+        nome = str(nome)
+        if limpar_nome is not None:
+            nome = limpar_nome(nome)
+        return nome in nomes
+
+    return usar_coluna
+
+
+def iterar_linhas(caminho: str, aba: Optional[str] = None) -> Iterator[tuple]:
+    """
+    Percorre as linhas de uma aba sem carregar a planilha inteira em memória.
+
+    Os valores são normalizados para o formato entregue pelo openpyxl:
+    células vazias são None e datas são datetime.
+
+    Args:
+        caminho: Caminho para o arquivo Excel
+        aba: Nome da aba (padrão: primeira aba)
+
+    Yields:
+        tuple: Valores de cada linha
+
+    Raises:
+        FileNotFoundError: Se o arquivo não for encontrado
+        ValueError: Se a aba não existir
+    """
+    if obter_backend() == BACKEND_CALAMINE:
+        yield from _iterar_linhas_calamine(caminho, aba)
+    else:
+        yield from _iterar_linhas_openpyxl(caminho, aba)
+
+
+def _iterar_linhas_openpyxl(caminho: str, aba: Optional[str]) -> Iterator[tuple]:
+    """
+    Percorre as linhas com openpyxl em modo somente leitura.
+    """
+    wb = load_workbook(caminho, read_only=True, data_only=True)
+    try:
+        if aba is None:
+            ws = wb.worksheets[0]
+        elif aba in wb.sheetnames:
+            ws = wb[aba]
+        else:
+            raise ValueError(f"Worksheet named '{aba}' not found")
+
+        yield from ws.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _iterar_linhas_calamine(caminho: str, aba: Optional[str]) -> Iterator[tuple]:
+    """
+    Percorre as linhas com o parser nativo calamine.
+    """
+    from python_calamine import CalamineWorkbook
+
+    wb = CalamineWorkbook.from_path(caminho)
+    if aba is None:
+        ws = wb.get_sheet_by_index(0)
+    elif aba in wb.sheet_names:
+        ws = wb.get_sheet_by_name(aba)
+    else:
+        raise ValueError(f"Worksheet named '{aba}' not found")
+
+    for linha in ws.iter_rows():
+        yield tuple(_normalizar_celula_calamine(valor) for valor in linha)
+
+
+def _normalizar_celula_calamine(valor):
+    """
+    Converte uma célula lida pelo calamine para o tipo entregue pelo openpyxl.
+
+    Args:
+        valor: Valor lido pelo calamine
+
+    Returns:
+        Valor normalizado (None para vazio, datetime para datas, int para números inteiros)
+    """
+    if valor == '':
+        return None
+    if isinstance(valor, float) and valor.is_integer():
+        return int(valor)
+    if isinstance(valor, date) and not isinstance(valor, datetime):
+        return datetime(valor.year, valor.month, valor.day)
+    return valor
+
+
+def _calamine_disponivel() -> bool:
+    """
+    Verifica se o parser calamine pode ser usado (python-calamine instalado e pandas >= 2.2).
+
+    Returns:
+        bool: True se disponível
+    """
+    if importlib.util.find_spec('python_calamine') is None:
+        return False
+
+    try:
+        versao_pandas = tuple(int(parte) for parte in pd.__version__.split('.')[:2])
+    except ValueError:
+        return False
+
+    return versao_pandas >= (2, 2)
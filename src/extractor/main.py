@@ -1,73 +1,296 @@
 import os
-from typing import Dict, Any
-from extractor.excel_reader import extrair_pendencias, extrair_resumo
-from extractor.rel_sem_tratar_reader import extrair_novas_transacoes_rel_sem_tratar
-from extractor.depara_reader import extrair_responsaveis, extrair_departamentos
-from services.conciliacao_service import ConciliacaoService
+import glob
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Callable, Tuple, Optional, List, Union
+from extractor.excel_reader import extrair_pendencias_e_resumo, extrair_resumo
+from extractor.rel_sem_tratar_reader import (
+    extrair_novas_transacoes_rel_sem_tratar, iterar_lotes_rel_sem_tratar, descrever_celulas_invalidas
+)
+from extractor.depara_reader import carregar_depara, obter_depara_em_cache, registrar_depara_em_cache
+from extractor.leitor_excel import configurar_backend, obter_backend
+from extractor.cache_leitura import configurar_cache, obter_configuracao_cache, hash_arquivo
+from entities.pendencia_tabela import PendenciaTabela
+from services.conciliacao_service import ConciliacaoService, MOTOR_OBJETOS
+from services.ledger_pendencias import LedgerPendencias
+from services.calendario_dias_uteis import CalendarioDiasUteis
+from services.resultado_conciliacao import ResultadoConciliacao
 from services.resumo_service import ResumoService
 from output.excel_writer import ExcelWriter
 
 
-def gerar_relatorio_consolidado(caminho_rel_sem_tratar: str,
+def gerar_relatorio_consolidado(caminho_rel_sem_tratar: Union[str, List[str]],
                                caminho_pendencias_antigas: str,
                                caminho_arquivo_saida: str,
-                               sheet_pendencias: str = 'Pendências') -> Dict[str, Any]:
+                               sheet_pendencias: str = 'Pendências',
+                               paralelo: bool = False,
+                               tamanho_lote: Optional[int] = None,
+                               motor: str = MOTOR_OBJETOS,
+                               caminho_ledger: Optional[str] = None,
+                               data_execucao: Optional[date] = None,
+                               tolerancia_centavos: Optional[int] = None,
+                               processos_consolidacao: Optional[int] = None,
+                               usar_cache: Optional[bool] = None) -> Dict[str, Any]:
     """
     Função principal que orquestra o processo de geração do relatório consolidado.
     
     Args:
-        caminho_rel_sem_tratar: Caminho para o arquivo Rel_sem_tratar.xlsx (novas transações)
+        caminho_rel_sem_tratar: Caminho para o arquivo Rel_sem_tratar.xlsx (novas transações).
+            Aceita também um padrão glob (ex.: 'extratos/Rel_sem_tratar_*.xlsx') ou uma
+            lista de caminhos/padrões: os arquivos são lidos (em paralelo com paralelo=True)
+            e consolidados juntos, na ordem informada, em um único relatório
         caminho_pendencias_antigas: Caminho para o arquivo com pendências antigas
         caminho_arquivo_saida: Caminho completo para salvar o arquivo gerado (.xlsx)
         sheet_pendencias: Nome da aba com as pendências existentes (padrão: 'Pendências')
+        paralelo: Se True, lê os arquivos de entrada simultaneamente em processos
+            separados, que recebem o backend de leitura e a configuração do cache
+            deste processo; se False, lê um após o outro (padrão: False)
+        tamanho_lote: Se informado, as novas transações são lidas e consolidadas em
+            lotes deste tamanho (modo para exportações muito grandes), sem manter a
+            lista completa de transações em memória (padrão: None, leitura única)
+        motor: Motor de consolidação da leitura única, 'objetos' ou 'vetorizado'
+            (junções por coluna, indicado para volumes grandes). O modo em lotes
+            usa sempre o motor por objetos (padrão: 'objetos')
+        caminho_ledger: Se informado, as pendências existentes ficam em um ledger SQLite
+            neste caminho (LedgerPendencias). Na primeira execução o ledger é carregado
+            com a aba de pendências; nas seguintes a aba não é relida: apenas as chaves
+            das novas transações são buscadas no ledger e o resultado o substitui
+            (pendências sem correspondência saem do ledger). A aba só deixa de ser
+            relida enquanto o arquivo de pendências for o importado ou o último
+            relatório gerado com o ledger, sem alterações (comparados pelo hash do
+            conteúdo); um arquivo editado ou diferente é importado de novo, substituindo
+            o conteúdo do ledger (padrão: None, pendências lidas da planilha a cada execução)
+        data_execucao: Data considerada como a da execução para o VENCIMENTO e o "Dia útil"
+            do Resumo; permite reprocessar um dia passado com o mesmo resultado
+            (padrão: None, data atual)
+        tolerancia_centavos: Se informado, transações sem correspondência exata são
+            associadas a pendências com INFORMACAO_ADICIONAL/NOME_CONTA iguais após
+            normalização (maiúsculas, acentos e espaços) e VALOR dentro desta diferença,
+            em centavos (ConciliacaoService.consolidar_pendencias_tolerante). Disponível
+            apenas na leitura única com o motor por objetos (padrão: None, só chave exata)
+        processos_consolidacao: Se informado, a consolidação da leitura única é dividida por
+            NOME_CONTA e executada em até este número de processos
+            (ConciliacaoService.consolidar_pendencias_paralelo), com o mesmo resultado.
+            Os processos só são usados quando compensam: com o motor vetorizado, a partir
+            de PROCESSOS_MINIMOS_CONSOLIDACAO (4) processos, limitados aos núcleos disponíveis
+            e a um processo a cada LINHAS_MINIMAS_POR_PROCESSO (50 mil) linhas de transações
+            + pendências existentes (ex.: 4 processos a partir de 200 mil linhas). Com o motor
+            por objetos, ou abaixo desses limites, a consolidação é feita em série
+            (padrão: None, consolidação em um único processo)
+        usar_cache: Se informado, liga ou desliga o cache em disco das planilhas lidas
+            (configurar_cache) antes da leitura: arquivos já lidos, sem alterações,
+            são carregados do cache em Parquet em vez de passar pelo parser do Excel
+            (padrão: None, mantém a configuração atual do cache)
         
     Returns:
         Dict[str, Any]: Dicionário com estatísticas do processamento
         
     Raises:
         FileNotFoundError: Se algum arquivo não for encontrado
-        ValueError: Se as abas especificadas não existirem
+        ValueError: Se as abas especificadas não existirem, ou se o ledger, a
+            conciliação tolerante ou a consolidação paralela forem combinados com
+            modos não suportados
         PermissionError: Se não conseguir salvar o arquivo de saída
         Exception: Outros erros durante o processamento
     """
     
-    # 1. EXTRAÇÃO: Ler dados dos arquivos Excel
-    # 1.1. Extrair novas transações do Rel_sem_tratar.xlsx
-    novas_transacoes = extrair_novas_transacoes_rel_sem_tratar(caminho_rel_sem_tratar)
-    
-    # 1.2. Extrair pendências antigas do arquivo separado
-    pendencias_existentes = extrair_pendencias(caminho_pendencias_antigas, sheet_pendencias)
+    if caminho_ledger is not None and tamanho_lote is not None:
+        raise ValueError("O ledger de pendências não pode ser combinado com o modo em lotes (tamanho_lote)")
+    if tolerancia_centavos is not None and (tamanho_lote is not None or caminho_ledger is not None
+                                            or motor != MOTOR_OBJETOS):
+        raise ValueError("A conciliação tolerante está disponível apenas na leitura única, "
+                         "sem ledger e com o motor por objetos")
+    if processos_consolidacao is not None and (tamanho_lote is not None or caminho_ledger is not None
+                                               or tolerancia_centavos is not None):
+        raise ValueError("A consolidação paralela está disponível apenas na leitura única, "
+                         "sem ledger e sem conciliação tolerante")
     
-    # 1.3. Tentar extrair resumo do arquivo de pendências antigas (opcional)
-    try:
-        df_resumo = extrair_resumo(caminho_pendencias_antigas)
-    except:
-        # Se não conseguir extrair resumo, usar DataFrame vazio
-        import pandas as pd
-        df_resumo = pd.DataFrame()
+    if usar_cache is not None:
+        configurar_cache(ativo=usar_cache)
     
-    # 1.1. EXTRAÇÃO: Ler dados do DePara (caminho fixo)
-    responsaveis = []
-    departamentos = []
+    # Calendário de dias úteis e data de referência, resolvidos uma única vez para toda a execução
+    calendario = CalendarioDiasUteis(data_execucao)
     
+    # 1. EXTRAÇÃO: Ler dados dos arquivos Excel
     # Definir caminho fixo para o arquivo DePara
     diretorio_atual = os.path.dirname(os.path.abspath(__file__))
     caminho_depara = os.path.join(diretorio_atual, "depara", "DePara-CashFlow.xlsx")
     
+    # Um ou mais arquivos Rel_sem_tratar (lista e/ou padrões glob)
+    arquivos_rel_sem_tratar = _resolver_arquivos_rel_sem_tratar(caminho_rel_sem_tratar)
+    
+    # As leituras são independentes: Rel_sem_tratar, pendências antigas (+ resumo) e DePara
+    # Pendências e resumo vêm do mesmo arquivo, que é aberto uma única vez.
+    # As pendências trafegam em formato colunar (PendenciaTabela) até a consolidação
+    # Com o ledger em dia com o arquivo de pendências (o importado ou o último relatório
+    # gerado, sem alterações), do arquivo só é lido o resumo
+    ledger_sincronizado = False
+    if caminho_ledger is not None:
+        assinatura_pendencias = hash_arquivo(caminho_pendencias_antigas)
+        with LedgerPendencias(caminho_ledger) as ledger:
+            ledger_sincronizado = ledger.planilha_sincronizada(assinatura_pendencias)
+            ledger_vazio = len(ledger) == 0
+    
+    if ledger_sincronizado:
+        tarefas = {'resumo': (extrair_resumo, (caminho_pendencias_antigas,))}
+    else:
+        tarefas = {
+            'pendencias_existentes': (extrair_pendencias_e_resumo, (caminho_pendencias_antigas, sheet_pendencias, True))
+        }
+    
+    # No modo em lotes as novas transações são lidas em streaming durante a consolidação
+    if tamanho_lote is None:
+        for indice, arquivo in enumerate(arquivos_rel_sem_tratar):
+            tarefas[f'novas_transacoes_{indice}'] = (extrair_novas_transacoes_rel_sem_tratar, (arquivo, True, True))
+    
+    # O DePara só é lido se não estiver no cache do processo
     try:
-        responsaveis = extrair_responsaveis(caminho_depara)
-        departamentos = extrair_departamentos(caminho_depara)
-        print(f"✅ DePara carregado: {len(responsaveis)} responsáveis, {len(departamentos)} departamentos")
+        depara = obter_depara_em_cache(caminho_depara)
+    except FileNotFoundError:
+        depara = None
+    if depara is None:
+        tarefas['depara'] = (carregar_depara, (caminho_depara,))
+    
+    resultados = _executar_extracoes(tarefas, paralelo)
+    
+    # Avisos da execução (exibidos e devolvidos nas estatísticas)
+    avisos = []
+    
+    # 1.1. Novas transações do(s) Rel_sem_tratar.xlsx, concatenadas na ordem dos arquivos.
+    # Células inválidas ficam vazias e são reportadas, sem interromper o relatório
+    transacoes_por_arquivo = {}
+    celulas_invalidas_por_arquivo = {arquivo: [] for arquivo in arquivos_rel_sem_tratar}
+    if tamanho_lote is None:
+        tabelas = []
+        for indice, arquivo in enumerate(arquivos_rel_sem_tratar):
+            transacoes, celulas_invalidas_por_arquivo[arquivo] = _obter_resultado(resultados, f'novas_transacoes_{indice}')
+            transacoes_por_arquivo[arquivo] = len(transacoes)
+            tabelas.append(transacoes)
+        novas_transacoes = PendenciaTabela.concatenar(tabelas)
+    
+    # 1.2. Pendências antigas do arquivo separado e resumo (opcional, vazio se não houver aba 'Resumo')
+    if ledger_sincronizado:
+        pendencias_existentes = None
+        df_resumo = _obter_resultado(resultados, 'resumo')
+    else:
+        pendencias_existentes, df_resumo = _obter_resultado(resultados, 'pendencias_existentes')
+    
+    # 1.3. DePara (caminho fixo)
+    responsaveis_dict = {}
+    departamentos_dict = {}
+    regras_responsaveis = None
+    
+    try:
+        if depara is None:
+            depara = _obter_resultado(resultados, 'depara')
+            # Guardar no cache deste processo (a leitura pode ter ocorrido em outro)
+            registrar_depara_em_cache(caminho_depara, depara)
+        responsaveis_dict = depara.responsaveis_dict
+        departamentos_dict = depara.departamentos_dict
+        regras_responsaveis = depara.regras_responsaveis
+        print(f"✅ DePara carregado: {len(depara.responsaveis)} responsáveis ({len(regras_responsaveis)} com curinga), "
+              f"{len(depara.departamentos)} departamentos")
+        for regra in regras_responsaveis.regras_ignoradas:
+            avisos.append(f"Regra de responsável ignorada, curinga só é aceito no início ou no fim: "
+                          f"'{regra.INFORMACAO_ADICIONAL}'")
+            print(f"⚠️ Aviso: {avisos[-1]}")
     except (FileNotFoundError, ValueError) as e:
-        print(f"⚠️ Aviso: Não foi possível carregar DePara de '{caminho_depara}' ({e}). Continuando sem enriquecimento de dados.")
+        avisos.append(f"Não foi possível carregar DePara de '{caminho_depara}' ({e}). "
+                      f"Continuando sem enriquecimento de dados.")
+        print(f"⚠️ Aviso: {avisos[-1]}")
     
     # 2. PROCESSAMENTO: Consolidar pendências usando a lógica de negócio
-    pendencias_consolidadas = ConciliacaoService.consolidar_pendencias(
-        pendencias_existentes, 
-        novas_transacoes,
-        responsaveis,
-        departamentos
-    )
+    # Em todos os modos os contadores são coletados durante a própria consolidação (ResultadoConciliacao)
+    correspondencias_tolerantes = []
+    if caminho_ledger is not None:
+        with LedgerPendencias(caminho_ledger) as ledger:
+            if not ledger_sincronizado:
+                # Primeira execução ou arquivo de pendências alterado: carga do ledger com a aba
+                ledger.importar(pendencias_existentes, assinatura_pendencias)
+                if ledger_vazio:
+                    print(f"✅ Ledger de pendências criado: {len(ledger)} pendências")
+                else:
+                    print(f"✅ Ledger de pendências recarregado (arquivo de pendências alterado): "
+                          f"{len(ledger)} pendências")
+            
+            # Apenas as pendências com chave das novas transações são lidas do ledger
+            resultado = ConciliacaoService.consolidar_com_ledger(
+                ledger,
+                novas_transacoes,
+                responsaveis_dict=responsaveis_dict,
+                departamentos_dict=departamentos_dict,
+                motor=motor,
+                calendario=calendario,
+                regras_responsaveis=regras_responsaveis
+            )
+    elif tolerancia_centavos is not None:
+        resultado, correspondencias_tolerantes = ConciliacaoService.consolidar_pendencias_tolerante(
+            pendencias_existentes,
+            novas_transacoes,
+            responsaveis_dict=responsaveis_dict,
+            departamentos_dict=departamentos_dict,
+            tolerancia_centavos=tolerancia_centavos,
+            calendario=calendario,
+            regras_responsaveis=regras_responsaveis
+        )
+        print(f"🔎 Correspondências por tolerância: {len(correspondencias_tolerantes)} transações")
+    elif processos_consolidacao is not None:
+        # Contas diferentes nunca se correspondem: cada processo consolida um grupo de contas
+        resultado = ConciliacaoService.consolidar_pendencias_paralelo(
+            pendencias_existentes,
+            novas_transacoes,
+            responsaveis_dict=responsaveis_dict,
+            departamentos_dict=departamentos_dict,
+            motor=motor,
+            calendario=calendario,
+            regras_responsaveis=regras_responsaveis,
+            processos=processos_consolidacao
+        )
+    elif tamanho_lote is None:
+        resultado = ConciliacaoService.conciliar(
+            pendencias_existentes, 
+            novas_transacoes,
+            responsaveis_dict=responsaveis_dict,
+            departamentos_dict=departamentos_dict,
+            motor=motor,
+            calendario=calendario,
+            regras_responsaveis=regras_responsaveis
+        )
+    else:
+        # Cada lote é consolidado contra o índice de pendências e liberado em seguida;
+        # apenas as pendências consolidadas são acumuladas para a escrita do relatório
+        def lotes_novas_transacoes():
+            for arquivo in arquivos_rel_sem_tratar:
+                transacoes_por_arquivo[arquivo] = 0
+                for lote in iterar_lotes_rel_sem_tratar(arquivo, tamanho_lote,
+                                                        celulas_invalidas_por_arquivo[arquivo]):
+                    transacoes_por_arquivo[arquivo] += len(lote)
+                    yield lote
+        
+        pendencias_lotes = []
+        resultados_lotes = []
+        for resultado_lote in ConciliacaoService.conciliar_em_lotes(
+                pendencias_existentes,
+                lotes_novas_transacoes(),
+                responsaveis_dict=responsaveis_dict,
+                departamentos_dict=departamentos_dict,
+                calendario=calendario,
+                regras_responsaveis=regras_responsaveis):
+            pendencias_lotes.extend(resultado_lote.pendencias)
+            # Dos lotes ficam só os contadores: as pendências já estão na lista acumulada
+            resultado_lote.pendencias = []
+            resultados_lotes.append(resultado_lote)
+        
+        # Os lotes compartilham o índice e as ocorrências das chaves: os contadores se somam
+        resultado = ResultadoConciliacao.combinar(resultados_lotes, pendencias_lotes)
+    
+    pendencias_consolidadas = resultado.pendencias
+    
+    for arquivo, celulas_invalidas in celulas_invalidas_por_arquivo.items():
+        if celulas_invalidas:
+            avisos.append(f"{os.path.basename(arquivo)}: {descrever_celulas_invalidas(celulas_invalidas)} "
+                          f"lida(s) como vazia(s)")
+            print(f"⚠️ Aviso: {avisos[-1]}")
     
     # 2.1. PROCESSAMENTO: Gerar resumo das pendências consolidadas
     resumo_consolidado = ResumoService.gerar_resumo(pendencias_consolidadas)
@@ -78,15 +301,34 @@ def gerar_relatorio_consolidado(caminho_rel_sem_tratar: str,
     ExcelWriter.salvar_relatorio_consolidado(
         pendencias_consolidadas,
         df_resumo,
-        caminho_arquivo_saida
+        caminho_arquivo_saida,
+        calendario=calendario
     )
     
-    # 4. ESTATÍSTICAS: Calcular e retornar estatísticas do processamento
-    estatisticas = ConciliacaoService.obter_estatisticas_consolidacao(
-        pendencias_existentes,
-        novas_transacoes, 
-        pendencias_consolidadas
-    )
+    # O relatório tem as mesmas pendências do ledger: pode ser o arquivo de pendências da próxima execução
+    if caminho_ledger is not None:
+        with LedgerPendencias(caminho_ledger) as ledger:
+            ledger.registrar_relatorio(hash_arquivo(caminho_arquivo_saida))
+    
+    # 4. ESTATÍSTICAS: Contadores coletados durante a consolidação
+    estatisticas = resultado.estatisticas()
+    
+    # Estatísticas por arquivo Rel_sem_tratar (intervalos consecutivos das transações consolidadas).
+    # Cada chave conta no arquivo da sua primeira ocorrência: a soma dos arquivos dá os totais
+    estatisticas_arquivos = []
+    inicio = 0
+    for arquivo in arquivos_rel_sem_tratar:
+        fim = inicio + transacoes_por_arquivo[arquivo]
+        estatisticas_arquivo = resultado.estatisticas_intervalo(inicio, fim)
+        estatisticas_arquivos.append({
+            'arquivo': arquivo,
+            'total_novas_transacoes': estatisticas_arquivo['total_novas_transacoes'],
+            'total_consolidadas': estatisticas_arquivo['total_consolidadas'],
+            'pendencias_preservadas': estatisticas_arquivo['pendencias_preservadas'],
+            'novas_pendencias_adicionadas': estatisticas_arquivo['novas_pendencias_adicionadas'],
+            'celulas_invalidas': celulas_invalidas_por_arquivo[arquivo]
+        })
+        inicio = fim
     
     # Adicionar estatísticas do resumo
     estatisticas_resumo = {
@@ -100,10 +342,15 @@ def gerar_relatorio_consolidado(caminho_rel_sem_tratar: str,
     
     # Adicionar informações dos arquivos
     estatisticas.update({
-        'arquivo_rel_sem_tratar': caminho_rel_sem_tratar,
+        'arquivo_rel_sem_tratar': ', '.join(arquivos_rel_sem_tratar),
+        'arquivos_rel_sem_tratar': estatisticas_arquivos,
         'arquivo_pendencias_antigas': caminho_pendencias_antigas,
+        'arquivo_ledger': caminho_ledger,
+        'correspondencias_tolerantes': correspondencias_tolerantes,
+        'avisos': avisos,
         'arquivo_saida': caminho_arquivo_saida,
         'sheet_pendencias': sheet_pendencias,
+        'data_referencia_vencimento': calendario.ultimo_dia_util_anterior.strftime('%d/%m/%Y'),
         'tem_resumo': not df_resumo.empty,
         **estatisticas_resumo
     })
@@ -111,6 +358,111 @@ def gerar_relatorio_consolidado(caminho_rel_sem_tratar: str,
     return estatisticas
 
 
+def _resolver_arquivos_rel_sem_tratar(caminho_rel_sem_tratar: Union[str, List[str]]) -> List[str]:
+    """
+    Expande o(s) caminho(s) de Rel_sem_tratar informados em uma lista de arquivos.
+    
+    Args:
+        caminho_rel_sem_tratar: Caminho, padrão glob ou lista de caminhos/padrões
+        
+    Returns:
+        List[str]: Arquivos na ordem informada (padrões expandidos em ordem alfabética)
+        
+    Raises:
+        FileNotFoundError: Se um padrão não corresponder a nenhum arquivo
+    """
+    if isinstance(caminho_rel_sem_tratar, str):
+        caminho_rel_sem_tratar = [caminho_rel_sem_tratar]
+    
+    arquivos = []
+    for caminho in caminho_rel_sem_tratar:
+        if glob.has_magic(caminho):
+            encontrados = sorted(glob.glob(caminho))
+            if not encontrados:
+                raise FileNotFoundError(f"Nenhum arquivo Rel_sem_tratar encontrado para o padrão: {caminho}")
+            arquivos.extend(encontrados)
+        else:
+            # Caminho simples: a existência é validada na leitura
+            arquivos.append(caminho)
+    
+    return arquivos
+
+
+def _executar_extracoes(tarefas: Dict[str, Tuple[Callable, tuple]],
+                        paralelo: bool) -> Dict[str, Tuple[Any, Exception]]:
+    """
+    Executa as funções de extração, em paralelo (processos) ou em série.
+    
+    As leituras são dominadas pelo parse do XML das planilhas (CPU), por isso
+    são distribuídas em processos: o tempo total passa a ser o do maior arquivo.
+    Com um único núcleo disponível as tarefas são executadas em série.
+    
+    O backend de leitura e a configuração do cache ficam em variáveis de módulo,
+    que os processos criados por spawn (padrão no Windows e no macOS) não
+    herdam: cada processo do pool é configurado com os valores deste processo
+    ao iniciar (_configurar_processo), de forma que a leitura é a mesma em
+    todas as plataformas.
+    
+    Args:
+        tarefas: Dicionário nome -> (função, argumentos)
+        paralelo: Se True, usa um pool de processos
+        
+    Returns:
+        Dict[str, Tuple[Any, Exception]]: nome -> (resultado, erro ou None)
+    """
+    resultados = {}
+    
+    processos = min(len(tarefas), os.cpu_count() or 1)
+    
+    if paralelo and processos > 1:
+        with ProcessPoolExecutor(max_workers=processos, initializer=_configurar_processo,
+                                 initargs=(obter_backend(), obter_configuracao_cache())) as executor:
+            futuros = {
+                nome: executor.submit(funcao, *argumentos)
+                for nome, (funcao, argumentos) in tarefas.items()
+            }
+            for nome, futuro in futuros.items():
+                erro = futuro.exception()
+                resultados[nome] = (None if erro else futuro.result(), erro)
+        return resultados
+    
+    for nome, (funcao, argumentos) in tarefas.items():
+        try:
+            resultados[nome] = (funcao(*argumentos), None)
+        except Exception as e:
+            resultados[nome] = (None, e)
+    
+    return resultados
+
+
+def _configurar_processo(backend: str, configuracao_cache: Dict[str, Any]) -> None:
+    """
+    Aplica o backend de leitura e a configuração do cache em um processo do pool de extração.
+    
+    Args:
+        backend: Backend de leitura do processo principal (obter_backend)
+        configuracao_cache: Configuração do cache do processo principal (obter_configuracao_cache)
+    """
+    configurar_backend(backend)
+    configurar_cache(**configuracao_cache)
+
+
+def _obter_resultado(resultados: Dict[str, Tuple[Any, Exception]], nome: str) -> Any:
+    """
+    Obtém o resultado de uma extração, relançando o erro ocorrido nela.
+    
+    Args:
+        resultados: Resultados de _executar_extracoes
+        nome: Nome da tarefa
+        
+    Returns:
+        Any: Resultado da extração
+    """
+    resultado, erro = resultados[nome]
+    if erro is not None:
+        raise erro
+    return resultado
+
 
 if __name__ == '__main__':
     # Exemplo de uso
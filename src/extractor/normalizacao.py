@@ -0,0 +1,305 @@
+import re
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, List, Tuple
+
+
+# Formatos de data aceitos em células de texto (além das células de data do Excel)
+FORMATO_DATA_ISO = 'ISO8601'
+FORMATO_DATA_BRASILEIRO = '%d/%m/%Y'
+
+# Origem das datas seriais do Excel (número de dias, células sem formato de data)
+ORIGEM_DATA_EXCEL = pd.Timestamp('1899-12-30')
+
+# Separador de milhares da numeração americana usada no Rel_sem_tratar
+SEPARADOR_MILHARES = ','
+
+# Colunas de identificação: números gravados como texto ou como float inteiro
+# (colunas numéricas com células vazias) são convertidos para int
+COLUNAS_IDENTIFICADORES = ('NUMERO_CONTA', 'NUMERO_EXTRATO')
+
+_TEXTO_NUMERICO = re.compile(r'[+-]?\d+(\.\d+)?')
+
+
+@dataclass
+class CelulaInvalida:
+    """
+    Célula que não pôde ser convertida durante a normalização.
+    """
+    linha: int  # Índice da linha no DataFrame
+    coluna: str
+    valor: Any
+
+
+def normalizar_transacoes(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[CelulaInvalida]]:
+    """
+    Normaliza os tipos das colunas DATA_EXTRATO e VALOR das novas transações.
+
+    A conversão é vetorizada, coluna a coluna:
+    - DATA_EXTRATO: datas do Excel são mantidas; números (datas seriais do
+      Excel) e textos em ISO (AAAA-MM-DD) ou no formato brasileiro (DD/MM/AAAA)
+      são convertidos para data
+    - VALOR: números são mantidos; textos em numeração americana
+      (vírgula como separador de milhares, ponto para decimal) são convertidos
+    - NUMERO_CONTA e NUMERO_EXTRATO: números inteiros (gravados como número ou
+      como texto) viram int; os demais textos são mantidos
+
+    Células não vazias que não puderem ser convertidas ficam nulas e são
+    reportadas. Após esta etapa as colunas têm tipo único, e o código seguinte
+    não precisa verificar o tipo de cada valor.
+
+    Args:
+        df: DataFrame com as novas transações
+
+    Returns:
+        Tuple[pd.DataFrame, List[CelulaInvalida]]: DataFrame normalizado e células inválidas
+    """
+    df = df.copy()
+    celulas_invalidas = []
+
+    if 'DATA_EXTRATO' in df.columns:
+        df['DATA_EXTRATO'], invalidas = _normalizar_datas(df['DATA_EXTRATO'])
+        celulas_invalidas.extend(invalidas)
+
+    if 'VALOR' in df.columns:
+        df['VALOR'], invalidas = _normalizar_valores(df['VALOR'])
+        celulas_invalidas.extend(invalidas)
+
+    for coluna in COLUNAS_IDENTIFICADORES:
+        if coluna in df.columns:
+            df[coluna] = _normalizar_identificadores(df[coluna])
+
+    return df, celulas_invalidas
+
+
+def normalizar_data(valor):
+    """
+    Converte um único valor de DATA_EXTRATO (usado na leitura em streaming).
+
+    Aplica as mesmas regras da normalização vetorizada, sem montar uma Series
+    por célula.
+
+    Args:
+        valor: Valor da célula
+
+    Returns:
+        pd.Timestamp (mesmo tipo da leitura via DataFrame) ou None se vazio
+
+    Raises:
+        ValueError: Se o valor não puder ser convertido
+    """
+    if valor is None:
+        return None
+    if isinstance(valor, date):
+        return pd.Timestamp(valor)
+    if _eh_numero(valor):
+        return ORIGEM_DATA_EXCEL + pd.to_timedelta(float(valor), unit='D')
+
+    texto = str(valor).strip()
+    if texto == '':
+        return None
+
+    try:
+        return pd.Timestamp(datetime.fromisoformat(texto))
+    except ValueError:
+        pass
+
+    try:
+        return pd.Timestamp(datetime.strptime(texto, FORMATO_DATA_BRASILEIRO))
+    except ValueError:
+        raise ValueError(f"Data inválida: {valor!r}")
+
+
+def normalizar_valor(valor):
+    """
+    Converte um único valor de VALOR (usado na leitura em streaming).
+
+    Aplica as mesmas regras da normalização vetorizada.
+
+    Args:
+        valor: Valor da célula
+
+    Returns:
+        float ou None se vazio
+
+    Raises:
+        ValueError: Se o valor não puder ser convertido
+    """
+    if valor is None:
+        return None
+    if _eh_numero(valor):
+        return float(valor)
+
+    texto = str(valor).strip().replace(SEPARADOR_MILHARES, '')
+    if texto == '':
+        return None
+    try:
+        return float(texto)
+    except ValueError:
+        raise ValueError(f"Valor inválido: {valor!r}")
+
+
+def normalizar_identificador(valor):
+    """
+    Converte um único valor de NUMERO_CONTA/NUMERO_EXTRATO.
+
+    Números inteiros, gravados como número ou como texto, viram int (mesmo
+    resultado da inferência de tipo do pandas para colunas numéricas); os
+    demais valores são mantidos.
+
+    Args:
+        valor: Valor da célula
+
+    Returns:
+        int, o valor original ou None se vazio
+    """
+    if valor is None or isinstance(valor, bool):
+        return valor
+    if isinstance(valor, str):
+        texto = valor.strip()
+        correspondencia = _TEXTO_NUMERICO.fullmatch(texto)
+        if correspondencia is None:
+            return valor
+        if correspondencia.group(1) is None:
+            return int(texto)
+        valor = float(texto)
+    if isinstance(valor, float) and valor.is_integer():
+        return int(valor)
+    return valor
+
+
+def _normalizar_identificadores(serie: pd.Series) -> pd.Series:
+    """
+    Converte uma coluna de identificação (NUMERO_CONTA/NUMERO_EXTRATO).
+
+    Args:
+        serie: Coluna original
+
+    Returns:
+        pd.Series: Coluna com as mesmas regras de normalizar_identificador
+    """
+    if pd.api.types.is_integer_dtype(serie):
+        return serie
+
+    # Tipo object: colunas com int e None não podem voltar para float
+    valores = serie.astype(object).where(serie.notna(), None)
+    return pd.Series([normalizar_identificador(valor) for valor in valores], index=serie.index, dtype=object)
+
+
+def _normalizar_datas(serie: pd.Series) -> Tuple[pd.Series, List[CelulaInvalida]]:
+    """
+    Converte uma coluna de datas de forma vetorizada.
+
+    Args:
+        serie: Coluna DATA_EXTRATO
+
+    Returns:
+        Tuple[pd.Series, List[CelulaInvalida]]: Coluna datetime e células inválidas
+    """
+    if pd.api.types.is_datetime64_any_dtype(serie):
+        return serie, []
+
+    # Coluna só de números: datas seriais do Excel
+    if pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie):
+        return _datas_seriais_excel(serie), []
+
+    # Textos sem espaços nas pontas; textos vazios são tratados como células vazias
+    if pd.api.types.is_object_dtype(serie) or pd.api.types.is_string_dtype(serie):
+        serie = serie.map(_limpar_texto)
+
+    # Números em coluna mista ficam com a conversão de datas seriais, e não com o ISO8601
+    numeros = serie.map(_eh_numero).astype(bool) & serie.notna()
+
+    # 1ª tentativa: datas do Excel e textos ISO (AAAA-MM-DD)
+    convertida = pd.to_datetime(serie.where(~numeros), errors='coerce', format=FORMATO_DATA_ISO)
+    if numeros.any():
+        convertida[numeros] = _datas_seriais_excel(serie[numeros])
+
+    # 2ª tentativa: textos no formato brasileiro (DD/MM/AAAA)
+    pendentes = convertida.isna() & serie.notna()
+    if pendentes.any():
+        convertida[pendentes] = pd.to_datetime(
+            serie[pendentes].astype(str),
+            errors='coerce',
+            format=FORMATO_DATA_BRASILEIRO
+        )
+
+    invalidas = convertida.isna() & serie.notna()
+    return convertida, _reportar_invalidas(serie, invalidas, 'DATA_EXTRATO')
+
+
+def _datas_seriais_excel(serie: pd.Series) -> pd.Series:
+    """
+    Converte números de dias (datas seriais do Excel) para datas.
+
+    Args:
+        serie: Coluna com números
+
+    Returns:
+        pd.Series: Coluna datetime
+    """
+    return ORIGEM_DATA_EXCEL + pd.to_timedelta(serie.astype(float), unit='D')
+
+
+def _eh_numero(valor) -> bool:
+    """
+    Indica se o valor de uma célula é numérico (bool não conta como número).
+    """
+    return isinstance(valor, (int, float, np.integer, np.floating)) and not isinstance(valor, (bool, np.bool_))
+
+
+def _limpar_texto(valor):
+    """
+    Remove os espaços das pontas de um texto; texto vazio vira None. Outros valores são mantidos.
+    """
+    if isinstance(valor, str):
+        return valor.strip() or None
+    return valor
+
+
+def _normalizar_valores(serie: pd.Series) -> Tuple[pd.Series, List[CelulaInvalida]]:
+    """
+    Converte uma coluna de valores em numeração americana de forma vetorizada.
+
+    Args:
+        serie: Coluna VALOR
+
+    Returns:
+        Tuple[pd.Series, List[CelulaInvalida]]: Coluna float e células inválidas
+    """
+    if pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie):
+        return serie.astype(float), []
+
+    # Remover separador de milhares apenas das células de texto
+    textos = serie.map(lambda valor: isinstance(valor, str))
+    limpa = serie.copy()
+    if textos.any():
+        limpa[textos] = (serie[textos].astype(str)
+                         .str.strip()
+                         .str.replace(SEPARADOR_MILHARES, '', regex=False)
+                         .replace('', None))
+
+    convertida = pd.to_numeric(limpa, errors='coerce').astype(float)
+
+    invalidas = convertida.isna() & limpa.notna()
+    return convertida, _reportar_invalidas(serie, invalidas, 'VALOR')
+
+
+def _reportar_invalidas(serie: pd.Series, invalidas: pd.Series, coluna: str) -> List[CelulaInvalida]:
+    """
+    Monta a lista de células inválidas de uma coluna.
+
+    Args:
+        serie: Coluna original
+        invalidas: Máscara das células inválidas
+        coluna: Nome da coluna
+
+    Returns:
+        List[CelulaInvalida]: Células inválidas
+    """
+    return [
+        CelulaInvalida(linha=indice, coluna=coluna, valor=valor)
+        for indice, valor in serie[invalidas].items()
+    ]
@@ -1,9 +1,47 @@
+import sys
 import pandas as pd
-from typing import List
+from itertools import islice
+from typing import List, Iterator, Optional, Tuple, Union
 from entities.pendencia import Pendencia
+from entities.pendencia_tabela import PendenciaTabela, CAMPOS_CATEGORICOS
+from extractor.cache_leitura import ler_com_cache
+from extractor.leitor_excel import ler_planilha, iterar_linhas, projecao_colunas
+from extractor.normalizacao import (
+    normalizar_transacoes, normalizar_data, normalizar_valor, normalizar_identificador, CelulaInvalida
+)
 
 
-def extrair_novas_transacoes_rel_sem_tratar(caminho: str) -> List[Pendencia]:
+# Colunas do Rel_sem_tratar usadas na conversão para Pendencia
+MAPEAMENTO_COLUNAS_REL_SEM_TRATAR = {
+    campo: campo for campo in [
+        'STATUS', 'UNIDADE_NEGOCIO', 'EMPRESA', 'NOME_BANCO', 'NOME_CONTA',
+        'DATA_EXTRATO', 'NUMERO_CONTA', 'INFORMACAO_ADICIONAL', 'NUMERO_EXTRATO',
+        'TIPO_TRANSACAO', 'VALOR'
+    ]
+}
+
+
+def _limpar_nome_coluna(nome: str) -> str:
+    """
+    Limpa o nome de uma coluna (remove espaços extras, quebras de linha).
+    
+    Args:
+        nome: Nome original da coluna
+        
+    Returns:
+        str: Nome da coluna limpo
+    """
+    return nome.strip().replace('\n', ' ').replace('\r', '')
+
+
+# Projeção de colunas: apenas as colunas usadas são lidas (nomes comparados já limpos)
+_COLUNAS_REL_SEM_TRATAR = projecao_colunas(MAPEAMENTO_COLUNAS_REL_SEM_TRATAR,
+                                           limpar_nome=_limpar_nome_coluna)
+
+
+def extrair_novas_transacoes_rel_sem_tratar(caminho: str,
+                                            como_tabela: bool = False,
+                                            com_celulas_invalidas: bool = False) -> Union[List[Pendencia], PendenciaTabela, Tuple]:
     """
     Extrai novas transações do arquivo Rel_sem_tratar.xlsx.
     
@@ -11,24 +49,33 @@ def extrair_novas_transacoes_rel_sem_tratar(caminho: str) -> List[Pendencia]:
     - Header começa na linha 2 (índice 1)
     - Numeração americana (vírgula como separador de milhares, ponto para decimal)
     
+    Células de DATA_EXTRATO e VALOR que não puderem ser convertidas não
+    interrompem a leitura: ficam vazias (VALOR vazio é considerado 0) e são
+    devolvidas com com_celulas_invalidas=True, para serem reportadas.
+    
     Args:
         caminho: Caminho para o arquivo Rel_sem_tratar.xlsx
+        como_tabela: Se True, retorna PendenciaTabela (colunar) em vez de lista de objetos
+        com_celulas_invalidas: Se True, retorna também as células inválidas
         
     Returns:
-        List[Pendencia]: Lista de objetos Pendencia (novas transações)
+        List[Pendencia] ou PendenciaTabela: Novas transações (com com_celulas_invalidas=True,
+        a tupla (novas transações, células inválidas))
         
     Raises:
         FileNotFoundError: Se o arquivo não for encontrado
         ValueError: Se houver erro de formato
     """
     try:
-        # Ler com header na linha 2 (índice 1)
-        df = pd.read_excel(caminho, header=1, engine='openpyxl')
+        df = ler_com_cache(caminho, None, 'rel_sem_tratar',
+                           lambda: _ler_dataframe_rel_sem_tratar(caminho))
         
-        # Limpar nomes das colunas (remover espaços extras, quebras de linha)
-        df.columns = df.columns.str.strip().str.replace('\n', ' ').str.replace('\r', '')
+        # Converter DATA_EXTRATO, VALOR e identificadores para tipos únicos
+        df, celulas_invalidas = normalizar_transacoes(df)
         
-        return _dataframe_para_pendencias_rel_sem_tratar(df)
+        tabela = _dataframe_para_tabela_rel_sem_tratar(df)
+        transacoes = tabela if como_tabela else tabela.para_pendencias()
+        return (transacoes, celulas_invalidas) if com_celulas_invalidas else transacoes
         
     except FileNotFoundError:
         raise FileNotFoundError(f"Arquivo Rel_sem_tratar não encontrado: {caminho}")
@@ -36,66 +83,221 @@ def extrair_novas_transacoes_rel_sem_tratar(caminho: str) -> List[Pendencia]:
         raise ValueError(f"Erro ao processar arquivo Rel_sem_tratar: {str(e)}")
 
 
-def _dataframe_para_pendencias_rel_sem_tratar(df: pd.DataFrame) -> List[Pendencia]:
+def _ler_dataframe_rel_sem_tratar(caminho: str) -> pd.DataFrame:
     """
-    Converte um DataFrame do Rel_sem_tratar para lista de objetos Pendencia.
+    Lê o arquivo Rel_sem_tratar.xlsx para DataFrame com os nomes de colunas limpos.
     
     Args:
-        df: DataFrame com os dados do Rel_sem_tratar
+        caminho: Caminho para o arquivo Rel_sem_tratar.xlsx
         
     Returns:
-        List[Pendencia]: Lista de objetos Pendencia
-    """
-    pendencias = []
-    
-    for _, row in df.iterrows():
-        # Tratar valor numérico (já vem correto do pandas)
-        valor = row.get('VALOR', 0)
-        if pd.isna(valor):
-            valor = 0
-            
-        # Tratar data do extrato
-        data_extrato = row.get('DATA_EXTRATO')
-        if pd.isna(data_extrato):
-            data_extrato = None
-        
-        # Criar objeto Pendencia
-        pendencia = Pendencia(
-            STATUS=_get_valor_seguro(row, 'STATUS'),
-            UNIDADE_NEGOCIO=_get_valor_seguro(row, 'UNIDADE_NEGOCIO'),
-            EMPRESA=_get_valor_seguro(row, 'EMPRESA'),
-            NOME_BANCO=_get_valor_seguro(row, 'NOME_BANCO'),
-            NOME_CONTA=_get_valor_seguro(row, 'NOME_CONTA'),
-            DATA_EXTRATO=data_extrato,
-            NUMERO_CONTA=_get_valor_seguro(row, 'NUMERO_CONTA'),
-            INFORMACAO_ADICIONAL=_get_valor_seguro(row, 'INFORMACAO_ADICIONAL'),
-            NUMERO_EXTRATO=_get_valor_seguro(row, 'NUMERO_EXTRATO'),
-            TIPO_TRANSACAO=_get_valor_seguro(row, 'TIPO_TRANSACAO'),
-            VALOR=valor,
-            # Campos que serão preenchidos pelas regras de negócio
-            RESPONSAVEL=None,
-            OBSERVACAO=None,
-            DEPARTAMENTO=None,
-            VENCIMENTO=None
-        )
-        
-        pendencias.append(pendencia)
-    
-    return pendencias
-
-
-def _get_valor_seguro(row, nome_coluna):
-    """
-    Obtém valor de uma coluna de forma segura, tratando valores nulos.
+        pd.DataFrame: DataFrame com os dados do Rel_sem_tratar
+    """
+    # Ler com header na linha 2 (índice 1)
+    df = ler_planilha(caminho, header=1, usecols=_COLUNAS_REL_SEM_TRATAR)
+    
+    # Limpar nomes das colunas (remover espaços extras, quebras de linha)
+    df.columns = df.columns.str.strip().str.replace('\n', ' ').str.replace('\r', '')
+    
+    return df
+
+
+def iterar_novas_transacoes_rel_sem_tratar(caminho: str,
+                                           celulas_invalidas: Optional[List[CelulaInvalida]] = None) -> Iterator[Pendencia]:
+    """
+    Extrai novas transações do arquivo Rel_sem_tratar.xlsx em modo streaming.
+    
+    Lê a planilha linha a linha (openpyxl em modo somente leitura ou calamine,
+    conforme o backend configurado), sem montar um DataFrame intermediário.
+    O header (linha 2) e a limpeza dos nomes das colunas são tratados uma
+    única vez antes das linhas de dados, de forma que o consumo de memória
+    não depende do tamanho do arquivo.
+    
+    DATA_EXTRATO, VALOR, NUMERO_CONTA e NUMERO_EXTRATO passam pelas mesmas
+    regras de normalização da leitura via DataFrame, de forma que as duas
+    leituras entregam os mesmos valores. Células inválidas ficam vazias, como
+    na leitura via DataFrame, e a leitura continua.
     
     Args:
-        row: Linha do DataFrame
-        nome_coluna: Nome da coluna
+        caminho: Caminho para o arquivo Rel_sem_tratar.xlsx
+        celulas_invalidas: Lista que recebe as células inválidas encontradas (opcional)
+        
+    Yields:
+        Pendencia: Objetos Pendencia (novas transações), na ordem do arquivo
+        
+    Raises:
+        FileNotFoundError: Se o arquivo não for encontrado
+        ValueError: Se houver erro de formato
+    """
+    try:
+        linhas = iterar_linhas(caminho)
+        
+        # Descartar a primeira linha e ler o header na linha 2 (índice 1)
+        next(linhas, None)
+        header = next(linhas, None)
+        if header is None:
+            return
+        
+        # Mapear cada coluna limpa para sua posição na linha
+        indices = {}
+        for indice, nome in enumerate(header):
+            if nome is None:
+                continue
+            nome = _limpar_nome_coluna(str(nome))
+            if nome in MAPEAMENTO_COLUNAS_REL_SEM_TRATAR and nome not in indices:
+                indices[nome] = indice
+        
+        numero_linha = 0
+        
+        for linha in linhas:
+            # Ignorar linhas totalmente vazias (mesmo comportamento do pandas)
+            if all(valor is None for valor in linha):
+                continue
+            yield _linha_para_pendencia_rel_sem_tratar(linha, indices, numero_linha, celulas_invalidas)
+            numero_linha += 1
+        
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo Rel_sem_tratar não encontrado: {caminho}")
+    except Exception as e:
+        raise ValueError(f"Erro ao processar arquivo Rel_sem_tratar: {str(e)}")
+
+
+def iterar_lotes_rel_sem_tratar(caminho: str, tamanho_lote: int = 50000,
+                                celulas_invalidas: Optional[List[CelulaInvalida]] = None) -> Iterator[List[Pendencia]]:
+    """
+    Extrai novas transações do arquivo Rel_sem_tratar.xlsx em lotes de tamanho fixo.
+    
+    Usa a leitura em streaming, de forma que apenas um lote fica em memória
+    por vez.
+    
+    Args:
+        caminho: Caminho para o arquivo Rel_sem_tratar.xlsx
+        tamanho_lote: Quantidade máxima de transações por lote (padrão: 50000)
+        celulas_invalidas: Lista que recebe as células inválidas encontradas (opcional)
+        
+    Yields:
+        List[Pendencia]: Lotes de objetos Pendencia, na ordem do arquivo
+        
+    Raises:
+        FileNotFoundError: Se o arquivo não for encontrado
+        ValueError: Se houver erro de formato ou tamanho de lote inválido
+    """
+    if tamanho_lote <= 0:
+        raise ValueError(f"Tamanho de lote inválido: {tamanho_lote}")
+    
+    transacoes = iterar_novas_transacoes_rel_sem_tratar(caminho, celulas_invalidas)
+    
+    while True:
+        lote = list(islice(transacoes, tamanho_lote))
+        if not lote:
+            return
+        yield lote
+
+
+def _linha_para_pendencia_rel_sem_tratar(linha: tuple, indices: dict, numero_linha: int,
+                                         celulas_invalidas: Optional[List[CelulaInvalida]] = None) -> Pendencia:
+    """
+    Converte uma linha crua da planilha Rel_sem_tratar para objeto Pendencia.
+    
+    DATA_EXTRATO, VALOR e os identificadores passam pelas mesmas regras de
+    normalização da leitura via DataFrame. Células que não puderem ser
+    convertidas ficam vazias.
+    
+    Args:
+        linha: Valores da linha lidos da planilha
+        indices: Dicionário nome da coluna -> posição na linha
+        numero_linha: Posição da linha entre as linhas de dados (a partir de 0)
+        celulas_invalidas: Lista que recebe as células inválidas (opcional)
         
     Returns:
-        Valor da coluna ou None se não existir/for nulo
+        Pendencia: Objeto Pendencia com os campos de regras de negócio vazios
     """
-    valor = row.get(nome_coluna)
-    if pd.isna(valor):
-        return None
-    return valor 
\ No newline at end of file
+    def valor_coluna(nome_coluna):
+        indice = indices.get(nome_coluna)
+        if indice is None or indice >= len(linha):
+            return None
+        valor = linha[indice]
+        # Strings vazias são lidas como nulas pelo pandas
+        if valor == '':
+            return None
+        # Campos de poucos valores distintos compartilham uma única string por valor
+        if nome_coluna in CAMPOS_CATEGORICOS and isinstance(valor, str):
+            return sys.intern(valor)
+        return valor
+    
+    def valor_normalizado(nome_coluna, normalizar):
+        valor = valor_coluna(nome_coluna)
+        try:
+            return normalizar(valor)
+        except ValueError:
+            if celulas_invalidas is not None:
+                celulas_invalidas.append(CelulaInvalida(linha=numero_linha, coluna=nome_coluna, valor=valor))
+            return None
+    
+    # VALOR numérico é sempre float (células inteiras chegam como int)
+    valor = valor_normalizado('VALOR', normalizar_valor)
+    if valor is None:
+        valor = 0.0
+    
+    return Pendencia(
+        STATUS=valor_coluna('STATUS'),
+        UNIDADE_NEGOCIO=valor_coluna('UNIDADE_NEGOCIO'),
+        EMPRESA=valor_coluna('EMPRESA'),
+        NOME_BANCO=valor_coluna('NOME_BANCO'),
+        NOME_CONTA=valor_coluna('NOME_CONTA'),
+        DATA_EXTRATO=valor_normalizado('DATA_EXTRATO', normalizar_data),
+        NUMERO_CONTA=normalizar_identificador(valor_coluna('NUMERO_CONTA')),
+        INFORMACAO_ADICIONAL=valor_coluna('INFORMACAO_ADICIONAL'),
+        NUMERO_EXTRATO=normalizar_identificador(valor_coluna('NUMERO_EXTRATO')),
+        TIPO_TRANSACAO=valor_coluna('TIPO_TRANSACAO'),
+        VALOR=valor,
+        # Campos que serão preenchidos pelas regras de negócio
+        RESPONSAVEL=None,
+        OBSERVACAO=None,
+        DEPARTAMENTO=None,
+        VENCIMENTO=None
+    )
+
+
+def descrever_celulas_invalidas(celulas_invalidas: List[CelulaInvalida]) -> str:
+    """
+    Monta a mensagem de aviso das células que não puderam ser normalizadas.
+    
+    Args:
+        celulas_invalidas: Células inválidas encontradas na normalização
+        
+    Returns:
+        str: Mensagem com a quantidade e até 5 exemplos de células inválidas
+    """
+    # Linha na planilha: título (1) + header (2) + posição da linha de dados
+    exemplos = ", ".join(
+        f"linha {celula.linha + 3}, {celula.coluna}={celula.valor!r}"
+        for celula in celulas_invalidas[:5]
+    )
+    return f"{len(celulas_invalidas)} célula(s) inválida(s) ({exemplos})"
+
+
+def _dataframe_para_tabela_rel_sem_tratar(df: pd.DataFrame) -> PendenciaTabela:
+    """
+    Converte um DataFrame do Rel_sem_tratar (já normalizado) para PendenciaTabela.
+    
+    A conversão é feita por coluna. VALOR vazio é considerado 0 e os campos
+    preenchidos pelas regras de negócio (RESPONSAVEL, OBSERVACAO, DEPARTAMENTO
+    e VENCIMENTO) ficam vazios.
+    
+    Args:
+        df: DataFrame com os dados do Rel_sem_tratar
+        
+    Returns:
+        PendenciaTabela: Novas transações em formato colunar
+    """
+    # Colunas repetidas após a limpeza dos nomes: vale a primeira
+    df = df.loc[:, ~df.columns.duplicated()]
+    df = df[[coluna for coluna in MAPEAMENTO_COLUNAS_REL_SEM_TRATAR if coluna in df.columns]].copy()
+    
+    if 'VALOR' in df.columns:
+        df['VALOR'] = df['VALOR'].fillna(0.0)
+    else:
+        df['VALOR'] = 0.0
+    
+    return PendenciaTabela(df)
@@ -0,0 +1,112 @@
+import zipfile
+import pandas as pd
+from typing import List, Optional
+from xml.etree import ElementTree
+from extractor.leitor_excel import obter_backend
+
+
+# Namespace do XML principal de pastas de trabalho .xlsx (xl/workbook.xml)
+_NAMESPACE_WORKBOOK = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+
+
+class SessaoPlanilha:
+    """
+    Sessão de leitura de um arquivo Excel que atende várias leituras de abas.
+
+    O arquivo é aberto uma única vez (na primeira leitura de aba) e reaproveitado
+    pelas leituras seguintes. A verificação de existência de abas não exige
+    abrir a pasta de trabalho: os nomes são obtidos do índice do arquivo .xlsx.
+
+    Uso:
+        with SessaoPlanilha(caminho) as sessao:
+            df = sessao.ler_aba('Pendências')
+            if sessao.possui_aba('Resumo'):
+                df_resumo = sessao.ler_aba('Resumo')
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._arquivo: Optional[pd.ExcelFile] = None
+        self._nomes_abas: Optional[List[str]] = None
+
+    def __enter__(self) -> 'SessaoPlanilha':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.fechar()
+
+    @property
+    def nomes_abas(self) -> List[str]:
+        """
+        Nomes das abas do arquivo, sem ler o conteúdo de nenhuma delas.
+
+        Raises:
+            FileNotFoundError: Se o arquivo não for encontrado
+        """
+        if self._nomes_abas is None:
+            if self._arquivo is not None:
+                self._nomes_abas = list(self._arquivo.sheet_names)
+            else:
+                self._nomes_abas = self._ler_nomes_abas()
+        return self._nomes_abas
+
+    def possui_aba(self, aba: str) -> bool:
+        """
+        Verifica se a aba existe no arquivo.
+
+        Args:
+            aba: Nome da aba
+
+        Returns:
+            bool: True se a aba existir
+        """
+        return aba in self.nomes_abas
+
+    def ler_aba(self, aba, **kwargs) -> pd.DataFrame:
+        """
+        Lê uma aba do arquivo para DataFrame, abrindo o arquivo se necessário.
+
+        Args:
+            aba: Nome ou índice da aba
+            **kwargs: Demais parâmetros repassados para ExcelFile.parse (ex.: usecols)
+
+        Returns:
+            pd.DataFrame: Dados da aba
+
+        Raises:
+            FileNotFoundError: Se o arquivo não for encontrado
+            ValueError: Se a aba não existir
+        """
+        if self._arquivo is None:
+            self._arquivo = pd.ExcelFile(self.caminho, engine=obter_backend())
+        return self._arquivo.parse(sheet_name=aba, **kwargs)
+
+    def fechar(self) -> None:
+        """
+        Fecha o arquivo, se tiver sido aberto.
+        """
+        if self._arquivo is not None:
+            self._arquivo.close()
+            self._arquivo = None
+
+    def _ler_nomes_abas(self) -> List[str]:
+        """
+        Obtém os nomes das abas lendo apenas xl/workbook.xml do arquivo .xlsx.
+
+        Para formatos que não sejam .xlsx, abre a pasta de trabalho.
+
+        Returns:
+            List[str]: Nomes das abas na ordem do arquivo
+        """
+        try:
+            with zipfile.ZipFile(self.caminho) as arquivo_zip:
+                with arquivo_zip.open('xl/workbook.xml') as workbook_xml:
+                    raiz = ElementTree.parse(workbook_xml).getroot()
+        except (zipfile.BadZipFile, KeyError, ElementTree.ParseError):
+            self._arquivo = pd.ExcelFile(self.caminho, engine=obter_backend())
+            return list(self._arquivo.sheet_names)
+
+        return [
+            aba.get('name')
+            for aba in raiz.iter(f'{_NAMESPACE_WORKBOOK}sheet')
+        ]
@@ -1,7 +1,9 @@
 import pandas as pd
-from typing import List
+from typing import List, Optional, Union
 from entities.pendencia import Pendencia
+from entities.pendencia_tabela import PendenciaTabela
 from services.resumo_service import ResumoService
+from services.calendario_dias_uteis import CalendarioDiasUteis
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.utils.dataframe import dataframe_to_rows
@@ -9,7 +11,6 @@ from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.table import Table, TableStyleInfo
 import xlsxwriter
 import os
-from datetime import date, timedelta
 
 
 class ExcelWriter:
@@ -18,16 +19,19 @@ class ExcelWriter:
     """
     
     @staticmethod
-    def salvar_relatorio_consolidado(pendencias_consolidadas: List[Pendencia],
+    def salvar_relatorio_consolidado(pendencias_consolidadas: Union[List[Pendencia], PendenciaTabela],
                                    df_resumo: pd.DataFrame,
-                                   caminho_saida: str) -> None:
+                                   caminho_saida: str,
+                                   calendario: Optional[CalendarioDiasUteis] = None) -> None:
         """
         Salva o relatório consolidado em arquivo Excel com formatação profissional.
         
         Args:
-            pendencias_consolidadas: Lista de pendências consolidadas
+            pendencias_consolidadas: Pendências consolidadas (lista ou PendenciaTabela)
             df_resumo: DataFrame com dados do resumo (pode estar vazio)
             caminho_saida: Caminho onde salvar o arquivo
+            calendario: Calendário de dias úteis da execução, para o "Dia útil" da aba
+                Resumo (padrão: calendário da data atual)
             
         Raises:
             PermissionError: Se não conseguir escrever no arquivo
@@ -41,7 +45,9 @@ class ExcelWriter:
             resumo_consolidado = ResumoService.gerar_resumo(pendencias_consolidadas)
             
             # Criar workbook temporário com xlsxwriter para suporte a PivotTable
-            ExcelWriter._criar_arquivo_com_pivot(df_pendencias, resumo_consolidado, caminho_saida)
+            ExcelWriter._criar_arquivo_com_pivot(
+                df_pendencias, resumo_consolidado, caminho_saida, calendario or CalendarioDiasUteis()
+            )
                     
         except PermissionError:
             raise PermissionError(f"Não foi possível salvar o arquivo. "
@@ -50,49 +56,23 @@ class ExcelWriter:
             raise Exception(f"Erro ao salvar arquivo Excel: {str(e)}")
     
     @staticmethod
-    def _pendencias_para_dataframe(pendencias: List[Pendencia]) -> pd.DataFrame:
+    def _pendencias_para_dataframe(pendencias: Union[List[Pendencia], PendenciaTabela]) -> pd.DataFrame:
         """
-        Converte lista de pendências para DataFrame pandas.
+        Converte as pendências para DataFrame pandas.
+        
+        A conversão é feita por coluna (PendenciaTabela), sem montar um
+        dicionário por pendência. Uma PendenciaTabela é exportada diretamente.
         
         Args:
-            pendencias: Lista de objetos Pendencia
+            pendencias: Lista de objetos Pendencia ou PendenciaTabela
             
         Returns:
-            pd.DataFrame: DataFrame com os dados das pendências
+            pd.DataFrame: DataFrame com os dados das pendências, na ordem de colunas do arquivo original
         """
-        if not pendencias:
+        if len(pendencias) == 0:
             return pd.DataFrame()
         
-        # Converter cada pendência para dicionário
-        dados = [pendencia.to_dict() for pendencia in pendencias]
-        
-        # Criar DataFrame
-        df = pd.DataFrame(dados)
-        
-        # Garantir ordem das colunas (mesma do arquivo original)
-        colunas_ordenadas = [
-            'STATUS',
-            'UNIDADE_NEGOCIO', 
-            'EMPRESA',
-            'NOME_BANCO',
-            'NOME_CONTA',
-            'DATA_EXTRATO',
-            'NUMERO_CONTA',
-            'INFORMACAO_ADICIONAL',
-            'NUMERO_EXTRATO',
-            'TIPO_TRANSACAO',
-            'VALOR',
-            'Responsável',
-            'Observação',
-            'Departamento', 
-            'Vencimento'
-        ]
-        
-        # Reordenar colunas, mantendo apenas as que existem
-        colunas_existentes = [col for col in colunas_ordenadas if col in df.columns]
-        df = df[colunas_existentes]
-        
-        return df
+        return PendenciaTabela.de_pendencias(pendencias).para_dataframe()
     
     @staticmethod
     def _resumo_para_dataframe(resumo_consolidado) -> pd.DataFrame:
@@ -150,7 +130,8 @@ class ExcelWriter:
             ws.column_dimensions[col].width = largura
     
     @staticmethod
-    def _criar_arquivo_com_pivot(df_pendencias: pd.DataFrame, resumo_consolidado, caminho_saida: str) -> None:
+    def _criar_arquivo_com_pivot(df_pendencias: pd.DataFrame, resumo_consolidado, caminho_saida: str,
+                                 calendario: CalendarioDiasUteis) -> None:
         """
         Cria o arquivo Excel completo usando pandas + openpyxl para criar tabela dinâmica atualizável.
         Conforme especificação do README_Resumo_Pivot.md
@@ -217,26 +198,11 @@ class ExcelWriter:
             # 2. Criar aba Resumo com tabela calculada dinamicamente
             ws_resumo = workbook.create_sheet('Resumo')
             
-            # Calcular dia útil anterior
-            def _calcular_dia_util_anterior() -> date:
-                """Calcula o último dia útil anterior à data atual."""
-                data_atual = date.today()
-                dia_semana = data_atual.weekday()  # 0=Segunda, 1=Terça, ..., 6=Domingo
-                
-                if dia_semana == 0:  # Segunda-feira
-                    dias_para_voltar = 3  # Voltar para sexta-feira anterior
-                elif dia_semana == 6:  # Domingo
-                    dias_para_voltar = 2  # Voltar para sexta-feira anterior
-                else:  # Terça a Sábado
-                    dias_para_voltar = 1  # Voltar 1 dia (dia útil anterior)
-                
-                return data_atual - timedelta(days=dias_para_voltar)
-            
             # Escrever "Dia útil" e data do dia útil anterior
             ws_resumo['A1'] = 'Dia útil'
             ws_resumo['A1'].font = Font(name='Calibri', size=11, bold=True)
-            dia_util_anterior = _calcular_dia_util_anterior()
-            ws_resumo['B1'] = dia_util_anterior
+            # Último dia útil anterior à execução (mesma referência do VENCIMENTO)
+            ws_resumo['B1'] = calendario.ultimo_dia_util_anterior
             ws_resumo['B1'].number_format = 'DD/MM/YYYY'
             
             # Criar headers da tabela resumo (linha 3, sem texto "Vencimento")
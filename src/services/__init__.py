@@ -1,10 +1,21 @@
 # Pacote de serviços
 
-from .conciliacao_service import ConciliacaoService
+from .conciliacao_service import ConciliacaoService, CorrespondenciaTolerante
+from .resultado_conciliacao import ResultadoConciliacao
+from .conciliacao_vetorizada import ConciliacaoVetorizadaService
+from .ledger_pendencias import LedgerPendencias
+from .calendario_dias_uteis import CalendarioDiasUteis
+from .regras_responsaveis import RegrasResponsaveis
 from .resumo_service import ResumoService, ResumoItem, ResumoConsolidado
 
 __all__ = [
     'ConciliacaoService',
+    'CorrespondenciaTolerante',
+    'ResultadoConciliacao',
+    'ConciliacaoVetorizadaService',
+    'LedgerPendencias',
+    'CalendarioDiasUteis',
+    'RegrasResponsaveis',
     'ResumoService', 
     'ResumoItem',
     'ResumoConsolidado'
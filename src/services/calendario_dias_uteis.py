@@ -0,0 +1,213 @@
+import numpy as np
+import pandas as pd
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Optional
+
+
+# Categorias de VENCIMENTO
+VENCIMENTO_D1 = "D1"
+VENCIMENTO_VENCIDO = ">D+1"
+
+# Feriados nacionais de data fixa (mês, dia) em que não há expediente bancário
+_FERIADOS_FIXOS = (
+    (1, 1),    # Confraternização Universal
+    (4, 21),   # Tiradentes
+    (5, 1),    # Dia do Trabalho
+    (9, 7),    # Independência do Brasil
+    (10, 12),  # Nossa Senhora Aparecida
+    (11, 2),   # Finados
+    (11, 15),  # Proclamação da República
+    (12, 25),  # Natal
+)
+
+# Dia Nacional de Zumbi e da Consciência Negra (20/11), feriado nacional a partir de 2024
+_ANO_INICIO_CONSCIENCIA_NEGRA = 2024
+
+# Feriados móveis, em dias a partir do domingo de Páscoa
+_FERIADOS_MOVEIS = (
+    -48,  # Segunda-feira de Carnaval
+    -47,  # Terça-feira de Carnaval
+    -2,   # Sexta-feira Santa
+    60,   # Corpus Christi
+)
+
+# Dias úteis da semana: Segunda a Sexta
+_SEMANA_UTIL = '1111100'
+
+
+class CalendarioDiasUteis:
+    """
+    Calendário de dias úteis bancários (Segunda a Sexta, exceto feriados nacionais).
+
+    A data de referência da execução (último dia útil anterior à data da execução) é
+    calculada uma única vez, na criação do calendário, e usada em todas as
+    classificações de VENCIMENTO:
+    - DATA_EXTRATO anterior ao último dia útil anterior: ">D+1"
+    - DATA_EXTRATO igual ou posterior: "D1"
+
+    Informar `data_execucao` permite reprocessar uma execução passada com o
+    mesmo resultado.
+
+    Uso:
+        calendario = CalendarioDiasUteis()
+        calendario.ultimo_dia_util_anterior      # ex.: sexta-feira, se hoje for segunda
+        calendario.classificar_vencimento(data_extrato)
+        calendario.classificar_vencimentos(coluna_data_extrato)
+    """
+
+    def __init__(self, data_execucao: Optional[date] = None,
+                 feriados_adicionais: Optional[Iterable[date]] = None):
+        """
+        Args:
+            data_execucao: Data da execução (padrão: data atual)
+            feriados_adicionais: Outros dias sem expediente (ex.: feriados municipais)
+        """
+        if data_execucao is None:
+            data_execucao = date.today()
+        elif isinstance(data_execucao, datetime):
+            data_execucao = data_execucao.date()
+        self.data_execucao = data_execucao
+
+        # Feriados do ano anterior ao seguinte: cobre o recuo até o dia útil anterior
+        feriados = [
+            feriado
+            for ano in range(data_execucao.year - 1, data_execucao.year + 2)
+            for feriado in feriados_nacionais(ano)
+        ]
+        feriados.extend(feriados_adicionais or [])
+        self.feriados = sorted(set(feriados))
+        self._calendario_numpy = np.busdaycalendar(weekmask=_SEMANA_UTIL, holidays=self.feriados)
+
+        # Data da execução (ou o próximo dia útil, em fim de semana/feriado) recuada um dia útil
+        self.ultimo_dia_util_anterior = np.busday_offset(
+            np.datetime64(data_execucao, 'D'), -1, roll='forward', busdaycal=self._calendario_numpy
+        ).astype(date)
+        self._referencia_numpy = np.datetime64(self.ultimo_dia_util_anterior, 'D')
+
+    def __reduce__(self):
+        # np.busdaycalendar não é serializável: o calendário é recriado (ex.: em outro processo)
+        return CalendarioDiasUteis, (self.data_execucao, self.feriados)
+
+    def eh_dia_util(self, data: date) -> bool:
+        """
+        Verifica se a data é dia útil.
+
+        Args:
+            data: Data a verificar
+
+        Returns:
+            bool: True se for dia útil
+        """
+        if isinstance(data, datetime):
+            data = data.date()
+        return bool(np.is_busday(np.datetime64(data, 'D'), busdaycal=self._calendario_numpy))
+
+    def classificar_vencimento(self, data_extrato) -> str:
+        """
+        Classifica o VENCIMENTO de uma DATA_EXTRATO.
+
+        Args:
+            data_extrato: Data do extrato (datetime, date, texto 'AAAA-MM-DD' ou 'DD/MM/AAAA', ou None)
+
+        Returns:
+            str: "D1" ou ">D+1" (sem data ou data inválida conta como vencido)
+        """
+        data_extrato = _converter_data(data_extrato)
+        if data_extrato is None:
+            return VENCIMENTO_VENCIDO
+
+        if data_extrato < self.ultimo_dia_util_anterior:
+            return VENCIMENTO_VENCIDO
+        return VENCIMENTO_D1
+
+    def classificar_vencimentos(self, datas_extrato: pd.Series) -> np.ndarray:
+        """
+        Classifica o VENCIMENTO de uma coluna inteira de DATA_EXTRATO.
+
+        Colunas de datas são comparadas de uma só vez com a data de referência;
+        colunas de tipos misturados são classificadas uma vez por valor distinto.
+
+        Args:
+            datas_extrato: Coluna DATA_EXTRATO
+
+        Returns:
+            np.ndarray: VENCIMENTO de cada linha (tipo object)
+        """
+        if pd.api.types.is_datetime64_any_dtype(datas_extrato):
+            datas = datas_extrato.to_numpy(dtype='datetime64[D]')
+            # NaT (sem data) não é >= à referência: conta como vencido
+            em_dia = datas >= self._referencia_numpy
+            return np.where(em_dia, VENCIMENTO_D1, VENCIMENTO_VENCIDO).astype(object)
+
+        codigos, datas_distintas = pd.factorize(datas_extrato)
+        vencimentos = [self.classificar_vencimento(data) for data in datas_distintas]
+        # Código -1 (data vazia) seleciona o último item: vencimento sem data
+        vencimentos.append(VENCIMENTO_VENCIDO)
+        return np.array(vencimentos, dtype=object)[codigos]
+
+
+def feriados_nacionais(ano: int) -> List[date]:
+    """
+    Lista os feriados nacionais bancários de um ano.
+
+    Args:
+        ano: Ano desejado
+
+    Returns:
+        List[date]: Feriados fixos e móveis (Carnaval, Sexta-feira Santa e Corpus Christi)
+    """
+    feriados = [date(ano, mes, dia) for mes, dia in _FERIADOS_FIXOS]
+    if ano >= _ANO_INICIO_CONSCIENCIA_NEGRA:
+        feriados.append(date(ano, 11, 20))
+
+    pascoa = _domingo_de_pascoa(ano)
+    feriados.extend(pascoa + timedelta(days=dias) for dias in _FERIADOS_MOVEIS)
+
+    return sorted(feriados)
+
+
+def _domingo_de_pascoa(ano: int) -> date:
+    """
+    Calcula o domingo de Páscoa (algoritmo de Meeus/Jones/Butcher, calendário gregoriano).
+
+    Args:
+        ano: Ano desejado
+
+    Returns:
+        date: Domingo de Páscoa
+    """
+    a = ano % 19
+    b, c = divmod(ano, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    mes, dia = divmod(h + l - 7 * m + 114, 31)
+    return date(ano, mes, dia + 1)
+
+
+def _converter_data(data_extrato) -> Optional[date]:
+    """
+    Converte DATA_EXTRATO para date.
+
+    Args:
+        data_extrato: datetime, date, texto ('AAAA-MM-DD' ou 'DD/MM/AAAA') ou None
+
+    Returns:
+        date, ou None se não houver data ou o texto não for uma data
+    """
+    if data_extrato is None or data_extrato is pd.NaT:
+        return None
+    if isinstance(data_extrato, datetime):
+        return data_extrato.date()
+    if isinstance(data_extrato, str):
+        for formato in ('%Y-%m-%d', '%d/%m/%Y'):
+            try:
+                return datetime.strptime(data_extrato, formato).date()
+            except ValueError:
+                continue
+        return None
+    return data_extrato
@@ -1,8 +1,62 @@
-from typing import List, Dict
-from datetime import datetime, date, timedelta
-from entities.pendencia import Pendencia
-from entities.responsavel import Responsavel
-from entities.departamento import Departamento
+import os
+import unicodedata
+import numpy as np
+import pandas as pd
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Callable, List, Dict, Iterable, Iterator, Optional, Tuple, Union
+from entities.pendencia import Pendencia, ChaveReconciliacao
+from entities.pendencia_tabela import PendenciaTabela
+from entities.responsavel import Responsavel, criar_dicionario_responsaveis
+from entities.departamento import Departamento, criar_dicionario_departamentos
+from services.ledger_pendencias import LedgerPendencias
+from services.calendario_dias_uteis import CalendarioDiasUteis
+from services.regras_responsaveis import RegrasResponsaveis
+from services.resultado_conciliacao import (
+    ResultadoConciliacao, CHAVE_REPETIDA, CHAVE_PRESERVADA, CHAVE_ADICIONADA
+)
+from services.conciliacao_vetorizada import ConciliacaoVetorizadaService
+
+
+# Motores de consolidação disponíveis
+MOTOR_OBJETOS = 'objetos'
+MOTOR_VETORIZADO = 'vetorizado'
+MOTORES = (MOTOR_OBJETOS, MOTOR_VETORIZADO)
+
+# Limites da consolidação paralela (medidos com benchmarks/bench_consolidacao_paralela.py):
+# com a divisão feita sobre códigos das contas, dividir as entradas, enviar as fatias e
+# reordenar o resultado custa no processo principal de 45% a 75% da consolidação em série;
+# com ~50 mil linhas (transações + pendências existentes) por processo a estimativa fica
+# abaixo da consolidação em série a partir de 2 a 6 processos (4 na maioria das medições).
+# As fatias já seguem em formato colunar: as colunas são quase todas numéricas ou
+# categóricas, e compactá-las mais (ex.: textos como códigos) reduz os bytes enviados,
+# mas custa mais na restauração do que economiza no envio
+PROCESSOS_MINIMOS_CONSOLIDACAO = 4
+LINHAS_MINIMAS_POR_PROCESSO = 50_000
+
+# Índice das pendências existentes: chave -> pendências com a chave, em ordem inversa
+# (a próxima a ser usada fica no fim da lista e é retirada com pop(), em O(1))
+IndicePendencias = Dict[ChaveReconciliacao, List[Pendencia]]
+
+# Índice da conciliação tolerante: (INFORMACAO_ADICIONAL, NOME_CONTA) normalizados ->
+# (VALORES em centavos ordenados, chaves exatas na mesma ordem). As pendências de cada
+# chave continuam na fila do IndicePendencias, compartilhada com o pareamento exato
+IndiceTolerante = Dict[Tuple[str, str], Tuple[List[int], List[ChaveReconciliacao]]]
+
+
+@dataclass
+class CorrespondenciaTolerante:
+    """
+    Nova transação associada a uma pendência existente pela conciliação tolerante
+    (sem correspondência exata de chave).
+    """
+    indice_transacao: int  # Posição da transação nas novas transações
+    transacao: Pendencia
+    pendencia_existente: Pendencia
+    diferenca_centavos: int  # VALOR da transação - VALOR da pendência, em centavos
 
 
 class ConciliacaoService:
@@ -13,277 +67,904 @@ class ConciliacaoService:
     - Para cada transação nova, verifica se existe pendência com mesma chave
     - Se existe: usa a pendência existente (preserva dados extras como Responsável, etc.)
     - Se não existe: usa a nova transação como nova pendência
+    
+    Chaves repetidas são pareadas uma a uma: a k-ésima transação de uma chave
+    usa a k-ésima pendência existente com a mesma chave. Cada pendência é
+    usada no máximo uma vez; transações além da quantidade de pendências
+    existentes da chave viram novas pendências.
     """
     
     @staticmethod
-    def consolidar_pendencias(pendencias_existentes: List[Pendencia], 
-                            novas_transacoes: List[Pendencia],
+    def consolidar_pendencias(pendencias_existentes: Union[List[Pendencia], PendenciaTabela], 
+                            novas_transacoes: Union[List[Pendencia], PendenciaTabela],
                             responsaveis: List[Responsavel] = None,
-                            departamentos: List[Departamento] = None) -> List[Pendencia]:
+                            departamentos: List[Departamento] = None,
+                            responsaveis_dict: Dict[str, Responsavel] = None,
+                            departamentos_dict: Dict[str, Departamento] = None,
+                            motor: str = MOTOR_OBJETOS,
+                            calendario: Optional[CalendarioDiasUteis] = None,
+                            regras_responsaveis: Optional[RegrasResponsaveis] = None) -> Union[List[Pendencia], PendenciaTabela]:
         """
         Consolida pendências seguindo a lógica de negócio.
         
+        Dois motores aplicam as mesmas regras:
+        - 'objetos': percorre as transações uma a uma (altera os objetos recebidos)
+        - 'vetorizado': junções de DataFrames por coluna (ConciliacaoVetorizadaService),
+          indicado para volumes grandes; não altera as entradas
+        
         Args:
-            pendencias_existentes: Lista de pendências já existentes
-            novas_transacoes: Lista de novas transações a serem processadas
+            pendencias_existentes: Pendências já existentes (lista ou PendenciaTabela)
+            novas_transacoes: Novas transações a serem processadas (lista ou PendenciaTabela)
+            responsaveis: Lista de responsáveis do DePara-CashFlow (opcional)
+            departamentos: Lista de departamentos do DePara-CashFlow (opcional)
+            responsaveis_dict: Dicionário de responsáveis já montado (opcional, evita
+                reconstruí-lo a partir de `responsaveis`)
+            departamentos_dict: Dicionário de departamentos já montado (opcional, evita
+                reconstruí-lo a partir de `departamentos`)
+            motor: Motor de consolidação, 'objetos' ou 'vetorizado' (padrão: 'objetos')
+            calendario: Calendário de dias úteis da execução, usado no VENCIMENTO
+                (padrão: calendário da data atual)
+            regras_responsaveis: Regras de responsável com curinga já compiladas (opcional,
+                evita compilá-las a partir de `responsaveis`)
+            
+        Returns:
+            List[Pendencia] ou PendenciaTabela: Pendências consolidadas
+            (PendenciaTabela no motor vetorizado)
+            
+        Raises:
+            ValueError: Se o motor não for suportado
+        """
+        return ConciliacaoService.conciliar(
+            pendencias_existentes,
+            novas_transacoes,
+            responsaveis=responsaveis,
+            departamentos=departamentos,
+            responsaveis_dict=responsaveis_dict,
+            departamentos_dict=departamentos_dict,
+            motor=motor,
+            calendario=calendario,
+            regras_responsaveis=regras_responsaveis
+        ).pendencias
+    
+    @staticmethod
+    def conciliar(pendencias_existentes: Union[List[Pendencia], PendenciaTabela],
+                  novas_transacoes: Union[List[Pendencia], PendenciaTabela],
+                  responsaveis: List[Responsavel] = None,
+                  departamentos: List[Departamento] = None,
+                  responsaveis_dict: Dict[str, Responsavel] = None,
+                  departamentos_dict: Dict[str, Departamento] = None,
+                  motor: str = MOTOR_OBJETOS,
+                  calendario: Optional[CalendarioDiasUteis] = None,
+                  regras_responsaveis: Optional[RegrasResponsaveis] = None) -> ResultadoConciliacao:
+        """
+        Consolida pendências (como consolidar_pendencias) e coleta as estatísticas durante o processo.
+        
+        Os contadores (chaves preservadas, novas e repetidas, pares transação x
+        pendência e acertos do DePara por regra) são acumulados pelo motor
+        enquanto monta o índice, pareia as chaves e enriquece as pendências:
+        não há nova passagem sobre as entradas, como em obter_estatisticas_consolidacao.
+        
+        Args:
+            pendencias_existentes: Pendências já existentes (lista ou PendenciaTabela)
+            novas_transacoes: Novas transações a serem processadas (lista ou PendenciaTabela)
             responsaveis: Lista de responsáveis do DePara-CashFlow (opcional)
             departamentos: Lista de departamentos do DePara-CashFlow (opcional)
+            responsaveis_dict: Dicionário de responsáveis já montado (opcional)
+            departamentos_dict: Dicionário de departamentos já montado (opcional)
+            motor: Motor de consolidação, 'objetos' ou 'vetorizado' (padrão: 'objetos')
+            calendario: Calendário de dias úteis da execução (padrão: calendário da data atual)
+            regras_responsaveis: Regras de responsável com curinga já compiladas (opcional)
+            
+        Returns:
+            ResultadoConciliacao: Pendências consolidadas (PendenciaTabela no motor
+            vetorizado) e contadores
+            
+        Raises:
+            ValueError: Se o motor não for suportado
+        """
+        if motor not in MOTORES:
+            raise ValueError(f"Motor de consolidação inválido: '{motor}'. Opções: {', '.join(MOTORES)}")
+        
+        # Criar dicionários de lookup para responsáveis e departamentos (se não fornecidos)
+        if responsaveis_dict is None:
+            responsaveis_dict = criar_dicionario_responsaveis(responsaveis or [])
+        if departamentos_dict is None:
+            departamentos_dict = criar_dicionario_departamentos(departamentos or [])
+        if regras_responsaveis is None and responsaveis:
+            regras_responsaveis = RegrasResponsaveis(responsaveis)
+        
+        # Data de referência do VENCIMENTO resolvida uma única vez
+        if calendario is None:
+            calendario = CalendarioDiasUteis()
+        
+        if motor == MOTOR_VETORIZADO:
+            return ConciliacaoVetorizadaService.conciliar(
+                pendencias_existentes, novas_transacoes, responsaveis_dict, departamentos_dict, calendario,
+                regras_responsaveis
+            )
+        
+        # Criar índice de pendências existentes por chave para busca rápida
+        indice_pendencias = ConciliacaoService._criar_indice_pendencias(pendencias_existentes)
+        contadores_existentes = ConciliacaoService._contar_existentes(pendencias_existentes, indice_pendencias)
+        
+        resultado = ConciliacaoService._consolidar_lote(
+            novas_transacoes, indice_pendencias, responsaveis_dict, departamentos_dict, calendario,
+            regras_responsaveis
+        )
+        return replace(resultado, **contadores_existentes)
+    
+    @staticmethod
+    def consolidar_pendencias_em_lotes(pendencias_existentes: Union[List[Pendencia], PendenciaTabela],
+                                       lotes_novas_transacoes: Iterable[List[Pendencia]],
+                                       responsaveis_dict: Dict[str, Responsavel] = None,
+                                       departamentos_dict: Dict[str, Departamento] = None,
+                                       calendario: Optional[CalendarioDiasUteis] = None,
+                                       regras_responsaveis: Optional[RegrasResponsaveis] = None) -> Iterator[List[Pendencia]]:
+        """
+        Consolida pendências lote a lote, para arquivos de novas transações muito grandes.
+        
+        O índice de pendências existentes é montado uma única vez e cada lote de
+        novas transações é consolidado contra ele e entregue assim que fica pronto.
+        Pendências usadas em um lote não são usadas novamente nos lotes seguintes.
+        Desta forma o consumo de memória fica limitado ao tamanho do lote mais o
+        índice, e não ao total de transações.
+        
+        Args:
+            pendencias_existentes: Lista de pendências já existentes
+            lotes_novas_transacoes: Lotes de novas transações (ex.: iterar_lotes_rel_sem_tratar)
+            responsaveis_dict: Dicionário de responsáveis do DePara (opcional)
+            departamentos_dict: Dicionário de departamentos do DePara (opcional)
+            calendario: Calendário de dias úteis da execução (padrão: calendário da data atual)
+            regras_responsaveis: Regras de responsável com curinga do DePara (opcional)
+            
+        Yields:
+            List[Pendencia]: Pendências consolidadas de cada lote, na ordem de entrada
+            (sem lotes, uma única lista vazia)
+        """
+        for resultado in ConciliacaoService.conciliar_em_lotes(
+                pendencias_existentes, lotes_novas_transacoes, responsaveis_dict, departamentos_dict,
+                calendario, regras_responsaveis):
+            yield resultado.pendencias
+    
+    @staticmethod
+    def conciliar_em_lotes(pendencias_existentes: Union[List[Pendencia], PendenciaTabela],
+                           lotes_novas_transacoes: Iterable[List[Pendencia]],
+                           responsaveis_dict: Dict[str, Responsavel] = None,
+                           departamentos_dict: Dict[str, Departamento] = None,
+                           calendario: Optional[CalendarioDiasUteis] = None,
+                           regras_responsaveis: Optional[RegrasResponsaveis] = None) -> Iterator[ResultadoConciliacao]:
+        """
+        Consolida pendências lote a lote (como consolidar_pendencias_em_lotes) e coleta os contadores de cada lote.
+        
+        Os lotes compartilham o índice de pendências e as ocorrências das chaves
+        já vistas: cada chave é contada no lote da sua primeira ocorrência, e os
+        contadores dos lotes somados (ResultadoConciliacao.combinar) são os da
+        consolidação de todas as transações de uma vez. Os contadores das
+        pendências existentes vão no resultado do primeiro lote.
+        
+        Args:
+            pendencias_existentes: Lista de pendências já existentes
+            lotes_novas_transacoes: Lotes de novas transações (ex.: iterar_lotes_rel_sem_tratar)
+            responsaveis_dict: Dicionário de responsáveis do DePara (opcional)
+            departamentos_dict: Dicionário de departamentos do DePara (opcional)
+            calendario: Calendário de dias úteis da execução (padrão: calendário da data atual)
+            regras_responsaveis: Regras de responsável com curinga do DePara (opcional)
+            
+        Yields:
+            ResultadoConciliacao: Pendências consolidadas e contadores de cada lote (sem
+            lotes, um único resultado vazio com os contadores das pendências existentes)
+        """
+        indice_pendencias = ConciliacaoService._criar_indice_pendencias(pendencias_existentes)
+        contadores_existentes = ConciliacaoService._contar_existentes(pendencias_existentes, indice_pendencias)
+        responsaveis_dict = responsaveis_dict or {}
+        departamentos_dict = departamentos_dict or {}
+        calendario = calendario or CalendarioDiasUteis()
+        ocorrencias_novas = {}
+        
+        for lote in lotes_novas_transacoes:
+            resultado = ConciliacaoService._consolidar_lote(
+                lote, indice_pendencias, responsaveis_dict, departamentos_dict, calendario,
+                regras_responsaveis, ocorrencias_novas
+            )
+            yield replace(resultado, **contadores_existentes)
+            contadores_existentes = {}
+        
+        if contadores_existentes:
+            yield ResultadoConciliacao(**contadores_existentes)
+    
+    @staticmethod
+    def consolidar_com_ledger(ledger: LedgerPendencias,
+                              novas_transacoes: Union[List[Pendencia], PendenciaTabela],
+                              responsaveis_dict: Dict[str, Responsavel] = None,
+                              departamentos_dict: Dict[str, Departamento] = None,
+                              motor: str = MOTOR_OBJETOS,
+                              calendario: Optional[CalendarioDiasUteis] = None,
+                              regras_responsaveis: Optional[RegrasResponsaveis] = None) -> ResultadoConciliacao:
+        """
+        Consolida novas transações contra o ledger persistente de pendências.
+    
+        Em vez de carregar todas as pendências existentes, busca no ledger apenas
+        as que têm a mesma chave das novas transações (pelo índice da chave),
+        consolida com as mesmas regras de consolidar_pendencias e grava o
+        resultado no ledger (LedgerPendencias.gravar), que passa a conter apenas
+        as pendências consolidadas: as pendências sem correspondência são removidas.
+    
+        Os contadores das pendências existentes são os do ledger inteiro antes
+        da gravação (equivalentes aos da planilha de pendências), e não apenas
+        os das pendências lidas.
+    
+        Args:
+            ledger: Ledger de pendências já carregado
+            novas_transacoes: Novas transações do dia (lista ou PendenciaTabela)
+            responsaveis_dict: Dicionário de responsáveis do DePara (opcional)
+            departamentos_dict: Dicionário de departamentos do DePara (opcional)
+            motor: Motor de consolidação, 'objetos' ou 'vetorizado' (padrão: 'objetos')
+            calendario: Calendário de dias úteis da execução (padrão: calendário da data atual)
+            regras_responsaveis: Regras de responsável com curinga do DePara (opcional)
+    
+        Returns:
+            ResultadoConciliacao: Pendências consolidadas (PendenciaTabela no motor
+            vetorizado) e contadores
+        """
+        pendencias_existentes = ledger.buscar_por_chaves(novas_transacoes)
+    
+        resultado = ConciliacaoService.conciliar(
+            pendencias_existentes, novas_transacoes,
+            responsaveis_dict=responsaveis_dict or {},
+            departamentos_dict=departamentos_dict or {},
+            motor=motor,
+            calendario=calendario,
+            regras_responsaveis=regras_responsaveis
+        )
+        resultado.total_pendencias_existentes = len(ledger)
+        resultado.chaves_unicas_existentes = ledger.contar_chaves()
+        resultado.chaves_duplicadas_existentes = ledger.contar_chaves_repetidas()
+    
+        ledger.gravar(resultado.pendencias)
+    
+        return resultado
+    
+    @staticmethod
+    def consolidar_pendencias_paralelo(pendencias_existentes: Union[List[Pendencia], PendenciaTabela],
+                                       novas_transacoes: Union[List[Pendencia], PendenciaTabela],
+                                       responsaveis_dict: Dict[str, Responsavel] = None,
+                                       departamentos_dict: Dict[str, Departamento] = None,
+                                       motor: str = MOTOR_OBJETOS,
+                                       calendario: Optional[CalendarioDiasUteis] = None,
+                                       regras_responsaveis: Optional[RegrasResponsaveis] = None,
+                                       processos: Optional[int] = None) -> ResultadoConciliacao:
+        """
+        Consolida pendências em paralelo, com as entradas divididas por NOME_CONTA.
+        
+        NOME_CONTA faz parte da chave de reconciliação: pendências e transações
+        de contas diferentes nunca se correspondem. Cada conta vai inteira para
+        uma fatia (as contas maiores primeiro, sempre para a fatia menos
+        carregada) e cada fatia é consolidada em um processo, com o mesmo
+        resultado de consolidar_pendencias. As pendências consolidadas voltam
+        na ordem original das transações e os contadores de cada fatia são
+        somados (ResultadoConciliacao.combinar).
+        
+        Os processos só são usados quando compensam o custo de enviar as
+        fatias e receber os resultados (medido em
+        benchmarks/bench_consolidacao_paralela.py); nos demais casos a
+        consolidação é feita no próprio processo, com o mesmo resultado:
+        - motor 'objetos': serializar os objetos Pendencia custa mais que
+          consolidá-los, e a divisão nunca compensa;
+        - motor 'vetorizado': as fatias são enviadas em formato colunar, com no
+          máximo um processo por núcleo disponível e um processo a cada
+          LINHAS_MINIMAS_POR_PROCESSO linhas (transações + pendências
+          existentes); com menos de PROCESSOS_MINIMOS_CONSOLIDACAO processos
+          a divisão custa mais do que economiza.
+        
+        Args:
+            pendencias_existentes: Pendências já existentes (lista ou PendenciaTabela)
+            novas_transacoes: Novas transações a serem processadas (lista ou PendenciaTabela)
+            responsaveis_dict: Dicionário de responsáveis
+            departamentos_dict: Dicionário de departamentos
+            motor: Motor de consolidação de cada fatia, 'objetos' ou 'vetorizado' (padrão: 'objetos')
+            calendario: Calendário de dias úteis da execução (padrão: calendário da data atual)
+            regras_responsaveis: Regras de responsável com curinga do DePara (opcional)
+            processos: Quantidade máxima de processos (padrão e limite: núcleos disponíveis)
+            
+        Returns:
+            ResultadoConciliacao: Pendências consolidadas e contadores de todas as fatias
+            
+        Raises:
+            ValueError: Se o motor não for suportado ou a quantidade de processos for menor que 1
+        """
+        if motor not in MOTORES:
+            raise ValueError(f"Motor de consolidação inválido: '{motor}'. Opções: {', '.join(MOTORES)}")
+        if processos is None:
+            processos = os.cpu_count() or 1
+        if processos < 1:
+            raise ValueError(f"Quantidade de processos inválida: {processos}. Informe um número >= 1")
+        
+        responsaveis_dict = responsaveis_dict or {}
+        departamentos_dict = departamentos_dict or {}
+        calendario = calendario or CalendarioDiasUteis()
+        parametros = (responsaveis_dict, departamentos_dict, motor, calendario, regras_responsaveis)
+        
+        linhas = len(pendencias_existentes) + len(novas_transacoes)
+        processos = min(processos, os.cpu_count() or 1, linhas // LINHAS_MINIMAS_POR_PROCESSO)
+        if motor != MOTOR_VETORIZADO or processos < PROCESSOS_MINIMOS_CONSOLIDACAO:
+            # A divisão não compensa: consolidação em série, com o mesmo resultado
+            return _consolidar_fatia(pendencias_existentes, novas_transacoes, *parametros)
+        return ConciliacaoService._consolidar_em_processos(
+            pendencias_existentes, novas_transacoes, processos, *parametros
+        )
+    
+    @staticmethod
+    def _consolidar_em_processos(pendencias_existentes: Union[List[Pendencia], PendenciaTabela],
+                                 novas_transacoes: Union[List[Pendencia], PendenciaTabela],
+                                 processos: int,
+                                 responsaveis_dict: Dict[str, Responsavel],
+                                 departamentos_dict: Dict[str, Departamento],
+                                 motor: str,
+                                 calendario: CalendarioDiasUteis,
+                                 regras_responsaveis: Optional[RegrasResponsaveis]) -> ResultadoConciliacao:
+        """
+        Divide as entradas por NOME_CONTA e consolida cada fatia em um processo do pool.
+        
+        As fatias são enviadas em formato colunar (PendenciaTabela), bem mais
+        barato de serializar que os objetos Pendencia.
+        
+        Args:
+            pendencias_existentes: Pendências já existentes (lista ou PendenciaTabela)
+            novas_transacoes: Novas transações a serem processadas (lista ou PendenciaTabela)
+            processos: Quantidade máxima de processos
+            (demais argumentos: os de consolidar_pendencias_paralelo, já preenchidos)
+            
+        Returns:
+            ResultadoConciliacao: Pendências consolidadas e contadores de todas as fatias
+        """
+        parametros = (responsaveis_dict, departamentos_dict, motor, calendario, regras_responsaveis)
+        pendencias_existentes = PendenciaTabela.de_pendencias(pendencias_existentes)
+        novas_transacoes = PendenciaTabela.de_pendencias(novas_transacoes)
+        
+        # NOME_CONTA de cada linha, como entra na chave de reconciliação
+        fatias_novas, fatias_existentes = ConciliacaoService._distribuir_contas(
+            novas_transacoes.textos_chave('NOME_CONTA'),
+            pendencias_existentes.textos_chave('NOME_CONTA'),
+            processos
+        )
+        quantidade_fatias = int(fatias_novas.max()) + 1 if len(fatias_novas) else 0
+        if quantidade_fatias <= 1:
+            return _consolidar_fatia(pendencias_existentes, novas_transacoes, *parametros)
+        
+        posicoes_novas = [np.flatnonzero(fatias_novas == fatia) for fatia in range(quantidade_fatias)]
+        
+        # Pendências de contas sem novas transações não participam da consolidação
+        posicoes_existentes = [np.flatnonzero(fatias_existentes == fatia) for fatia in range(quantidade_fatias)]
+        posicoes_sem_fatia = np.flatnonzero(fatias_existentes < 0)
+        
+        with ProcessPoolExecutor(max_workers=quantidade_fatias) as executor:
+            futuros = [
+                executor.submit(
+                    _consolidar_fatia,
+                    _selecionar(pendencias_existentes, posicoes_existentes[fatia]),
+                    _selecionar(novas_transacoes, posicoes_novas[fatia]),
+                    *parametros
+                )
+                for fatia in range(quantidade_fatias)
+            ]
+            resultados = [futuro.result() for futuro in futuros]
+        
+        # Pendências fora das fatias entram apenas nos totais das pendências existentes
+        contagem_sem_fatia = Counter(pendencias_existentes.linhas(posicoes_sem_fatia).chaves_reconciliacao())
+        sem_fatia = ResultadoConciliacao(
+            total_pendencias_existentes=len(posicoes_sem_fatia),
+            chaves_unicas_existentes=len(contagem_sem_fatia),
+            chaves_duplicadas_existentes=sum(1 for quantidade in contagem_sem_fatia.values() if quantidade > 1)
+        )
+        
+        # As chaves de fatias diferentes são disjuntas: os contadores se somam
+        pendencias_consolidadas = _reordenar(
+            [resultado.pendencias for resultado in resultados], posicoes_novas, len(novas_transacoes)
+        )
+        situacao_chaves = np.zeros(len(novas_transacoes), dtype=np.uint8)
+        for resultado, posicoes in zip(resultados, posicoes_novas):
+            situacao_chaves[posicoes] = resultado.situacao_chaves
+        return ResultadoConciliacao.combinar(resultados + [sem_fatia], pendencias_consolidadas, situacao_chaves)
+    
+    @staticmethod
+    def _distribuir_contas(contas_novas: pd.Series,
+                           contas_existentes: pd.Series,
+                           fatias: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distribui as contas com novas transações entre as fatias, equilibrando o volume.
+        
+        As contas são atribuídas da maior para a menor (transações + pendências
+        existentes da conta), cada uma à fatia com menor volume até então.
+        Cada conta é identificada por um código inteiro (pd.factorize): os
+        volumes e a fatia de cada linha saem de operações sobre os códigos,
+        sem contar nem mapear as linhas texto a texto no processo principal.
+        
+        Args:
+            contas_novas: NOME_CONTA de cada nova transação
+            contas_existentes: NOME_CONTA de cada pendência existente
+            fatias: Quantidade máxima de fatias
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Fatia de cada nova transação e de cada pendência
+            existente (-1 para pendências de contas sem novas transações)
+        """
+        codigos_novos, contas = pd.factorize(contas_novas)
+        if len(contas) == 0:
+            return codigos_novos, np.full(len(contas_existentes), -1, dtype=np.intp)
+        codigos_existentes = pd.Index(contas).get_indexer(contas_existentes)
+        
+        volumes = np.bincount(codigos_novos, minlength=len(contas))
+        volumes += np.bincount(codigos_existentes[codigos_existentes >= 0], minlength=len(contas))
+        
+        cargas = [0] * min(fatias, len(contas))
+        fatia_por_codigo = np.empty(len(contas), dtype=np.intp)
+        # Ordenação estável: em volumes iguais, a conta que aparece primeiro
+        for codigo in np.argsort(-volumes, kind='stable').tolist():
+            fatia = cargas.index(min(cargas))
+            fatia_por_codigo[codigo] = fatia
+            cargas[fatia] += int(volumes[codigo])
+        
+        fatias_existentes = np.where(codigos_existentes >= 0, fatia_por_codigo[codigos_existentes], -1)
+        return fatia_por_codigo[codigos_novos], fatias_existentes
+    
+    @staticmethod
+    def consolidar_pendencias_tolerante(pendencias_existentes: Union[List[Pendencia], PendenciaTabela],
+                                        novas_transacoes: Union[List[Pendencia], PendenciaTabela],
+                                        responsaveis_dict: Dict[str, Responsavel] = None,
+                                        departamentos_dict: Dict[str, Departamento] = None,
+                                        tolerancia_centavos: int = 1,
+                                        calendario: Optional[CalendarioDiasUteis] = None,
+                                        regras_responsaveis: Optional[RegrasResponsaveis] = None) -> Tuple[ResultadoConciliacao, List[CorrespondenciaTolerante]]:
+        """
+        Consolida pendências aceitando pequenas diferenças entre transação e pendência.
+        
+        A chave exata continua tendo prioridade (com o mesmo pareamento um a um
+        de consolidar_pendencias). Transações cuja chave não existe entre as
+        pendências são associadas a uma pendência existente quando:
+        - INFORMACAO_ADICIONAL e NOME_CONTA são iguais após normalização
+          (maiúsculas/minúsculas, acentos e espaços são ignorados)
+        - VALOR difere em no máximo `tolerancia_centavos`
+        
+        As pendências de cada conta + informação normalizadas ficam em uma lista
+        ordenada por VALOR, e os candidatos são localizados por busca binária
+        (bisect) na faixa ±tolerância, sem comparar transação a transação.
+        Havendo mais de um candidato, vale o de VALOR mais próximo. Como no
+        pareamento exato, cada pendência existente é usada uma única vez: a
+        pendência encontrada é retirada da fila da sua chave, e chaves com
+        várias pendências oferecem todas elas, uma por correspondência.
+        
+        Usa sempre o motor por objetos. Os contadores são os de conciliar, com
+        as correspondências tolerantes contadas em pendencias_correspondidas.
+        
+        Args:
+            pendencias_existentes: Pendências já existentes (lista ou PendenciaTabela)
+            novas_transacoes: Novas transações a serem processadas (lista ou PendenciaTabela)
+            responsaveis_dict: Dicionário de responsáveis do DePara (opcional)
+            departamentos_dict: Dicionário de departamentos do DePara (opcional)
+            tolerancia_centavos: Diferença máxima de VALOR aceita, em centavos (padrão: 1)
+            calendario: Calendário de dias úteis da execução (padrão: calendário da data atual)
+            regras_responsaveis: Regras de responsável com curinga do DePara (opcional)
+            
+        Returns:
+            Tuple: (pendências consolidadas e contadores, correspondências tolerantes encontradas)
+            
+        Raises:
+            ValueError: Se a tolerância for negativa
+        """
+        if tolerancia_centavos < 0:
+            raise ValueError(f"Tolerância inválida: {tolerancia_centavos}. Informe um número de centavos >= 0")
+        
+        responsaveis_dict = responsaveis_dict or {}
+        departamentos_dict = departamentos_dict or {}
+        calendario = calendario or CalendarioDiasUteis()
+        
+        indice_pendencias = ConciliacaoService._criar_indice_pendencias(pendencias_existentes)
+        contadores_existentes = ConciliacaoService._contar_existentes(pendencias_existentes, indice_pendencias)
+        # A busca tolerante usa as mesmas filas do pareamento exato
+        indice_tolerante = ConciliacaoService._criar_indice_tolerante(indice_pendencias)
+        
+        correspondencias = []
+        
+        def buscar_correspondencia(indice: int, transacao: Pendencia) -> Optional[Pendencia]:
+            # Chave exata desconhecida: pendência de VALOR mais próximo dentro da tolerância
+            encontrada = ConciliacaoService._buscar_correspondencia_tolerante(
+                transacao.chave_reconciliacao, indice_tolerante, indice_pendencias, tolerancia_centavos
+            )
+            if encontrada is None:
+                return None
+            pendencia_existente, diferenca = encontrada
+            correspondencias.append(CorrespondenciaTolerante(
+                indice_transacao=indice,
+                transacao=transacao,
+                pendencia_existente=pendencia_existente,
+                diferenca_centavos=diferenca
+            ))
+            return pendencia_existente
+        
+        resultado = ConciliacaoService._consolidar_lote(
+            novas_transacoes, indice_pendencias, responsaveis_dict, departamentos_dict, calendario,
+            regras_responsaveis, buscar_correspondencia=buscar_correspondencia
+        )
+        return replace(resultado, **contadores_existentes), correspondencias
+    
+    @staticmethod
+    def _criar_indice_tolerante(indice_pendencias: IndicePendencias) -> IndiceTolerante:
+        """
+        Agrupa as chaves exatas por INFORMACAO_ADICIONAL + NOME_CONTA normalizados, ordenadas por VALOR.
+        
+        Cada chave representa todas as pendências da sua fila no índice de
+        pendências. Chaves com VALOR vazio ou não numérico ficam fora do índice.
+        
+        Args:
+            indice_pendencias: Índice de _criar_indice_pendencias
+            
+        Returns:
+            IndiceTolerante: Chave de texto normalizada -> (centavos ordenados, chaves exatas)
+        """
+        grupos = {}
+        for chave in indice_pendencias:
+            centavos, informacao_adicional, nome_conta = chave
+            if isinstance(centavos, int):
+                chave_texto = (_normalizar_texto(informacao_adicional), _normalizar_texto(nome_conta))
+                grupos.setdefault(chave_texto, []).append((centavos, chave))
+        
+        indice = {}
+        for chave_texto, itens in grupos.items():
+            # Ordenação estável: em VALORES iguais, a chave que aparece primeiro
+            itens.sort(key=lambda item: item[0])
+            indice[chave_texto] = ([centavos for centavos, _ in itens], [chave for _, chave in itens])
+        
+        return indice
+    
+    @staticmethod
+    def _buscar_correspondencia_tolerante(chave: ChaveReconciliacao,
+                                          indice_tolerante: IndiceTolerante,
+                                          indice_pendencias: IndicePendencias,
+                                          tolerancia_centavos: int) -> Optional[Tuple[Pendencia, int]]:
+        """
+        Busca a pendência de VALOR mais próximo dentro da tolerância (busca binária).
+        
+        Apenas chaves com pendências ainda não usadas são candidatas; a
+        pendência encontrada é retirada da fila da sua chave.
+        
+        Args:
+            chave: Chave de reconciliação da transação
+            indice_tolerante: Índice de _criar_indice_tolerante
+            indice_pendencias: Índice de _criar_indice_pendencias (a pendência usada é retirada)
+            tolerancia_centavos: Diferença máxima de VALOR aceita, em centavos
             
         Returns:
-            List[Pendencia]: Lista consolidada de pendências
+            Tuple[Pendencia, int]: Pendência encontrada e diferença de VALOR em centavos,
+            ou None se não houver candidata
+        """
+        centavos, informacao_adicional, nome_conta = chave
+        if not isinstance(centavos, int):
+            return None
+        
+        grupo = indice_tolerante.get((_normalizar_texto(informacao_adicional), _normalizar_texto(nome_conta)))
+        if grupo is None:
+            return None
+        
+        valores, chaves = grupo
+        inicio = bisect_left(valores, centavos - tolerancia_centavos)
+        fim = bisect_right(valores, centavos + tolerancia_centavos)
+        candidatas = [posicao for posicao in range(inicio, fim) if indice_pendencias[chaves[posicao]]]
+        if not candidatas:
+            return None
+        
+        # VALOR mais próximo; em empate, o primeiro da lista
+        posicao = min(candidatas, key=lambda i: abs(valores[i] - centavos))
+        return indice_pendencias[chaves[posicao]].pop(), centavos - valores[posicao]
+    
+    @staticmethod
+    def _consolidar_lote(novas_transacoes: Iterable[Pendencia],
+                         indice_pendencias: IndicePendencias,
+                         responsaveis_dict: Dict[str, Responsavel],
+                         departamentos_dict: Dict[str, Departamento],
+                         calendario: CalendarioDiasUteis,
+                         regras_responsaveis: Optional[RegrasResponsaveis] = None,
+                         ocorrencias_novas: Optional[Dict[ChaveReconciliacao, int]] = None,
+                         buscar_correspondencia: Optional[Callable[[int, Pendencia], Optional[Pendencia]]] = None) -> ResultadoConciliacao:
         """
-        # Criar dicionário de pendências existentes por chave para busca rápida
-        pendencias_dict = ConciliacaoService._criar_dicionario_pendencias(pendencias_existentes)
+        Consolida novas transações contra o índice de pendências existentes.
         
-        # Criar dicionários de lookup para responsáveis e departamentos
-        responsaveis_dict = ConciliacaoService._criar_dicionario_responsaveis(responsaveis or [])
-        departamentos_dict = ConciliacaoService._criar_dicionario_departamentos(departamentos or [])
+        Os contadores das novas transações e do enriquecimento são coletados no
+        mesmo laço; os das pendências existentes ficam a cargo de quem montou o índice.
         
-        # Lista resultado
+        Args:
+            novas_transacoes: Novas transações a serem processadas
+            indice_pendencias: Índice de _criar_indice_pendencias (as pendências usadas são retiradas)
+            responsaveis_dict: Dicionário de responsáveis
+            departamentos_dict: Dicionário de departamentos
+            calendario: Calendário de dias úteis da execução
+            regras_responsaveis: Regras de responsável com curinga (opcional)
+            ocorrencias_novas: Ocorrências de cada chave nas transações de lotes anteriores
+                (atualizado; padrão: nenhum lote anterior). Chaves já vistas não são
+                contadas novamente
+            buscar_correspondencia: Busca de pendência para as transações cuja chave não
+                existe no índice: (posição da transação, transação) -> pendência ou None
+                (opcional, ex.: conciliação tolerante)
+            
+        Returns:
+            ResultadoConciliacao: Pendências consolidadas, na ordem das transações, e contadores
+        """
+        # Lista resultado e situação da chave de cada transação
         pendencias_consolidadas = []
+        situacao_chaves = bytearray()
+        
+        # Ocorrências de cada chave nas novas transações e pares com pendências existentes
+        if ocorrencias_novas is None:
+            ocorrencias_novas = {}
+        chaves_unicas_novas = 0
+        chaves_duplicadas_novas = 0
+        pendencias_preservadas = 0
+        pendencias_correspondidas = 0
         
         # Para cada nova transação, decidir se usar pendência existente ou nova
-        for transacao in novas_transacoes:
-            chave = transacao.get_chave_reconciliacao()
+        for posicao, transacao in enumerate(novas_transacoes):
+            chave = transacao.chave_reconciliacao
+            
+            fila = indice_pendencias.get(chave)
+            ocorrencia = ocorrencias_novas.get(chave, 0)
+            ocorrencias_novas[chave] = ocorrencia + 1
+            if ocorrencia == 0:
+                chaves_unicas_novas += 1
+                pendencias_preservadas += fila is not None
+                situacao_chaves.append(CHAVE_PRESERVADA if fila is not None else CHAVE_ADICIONADA)
+            else:
+                chaves_duplicadas_novas += ocorrencia == 1
+                situacao_chaves.append(CHAVE_REPETIDA)
             
-            if chave in pendencias_dict:
-                # Se existe pendência com a mesma chave, usar a pendência existente
-                pendencia_existente = pendencias_dict[chave]
-                pendencia_final = pendencia_existente
+            if fila:
+                # Se existe pendência com a mesma chave ainda não usada, usar a pendência existente
+                pendencia_final = fila.pop()
+                pendencias_correspondidas += 1
+            elif fila is None and buscar_correspondencia is not None:
+                # Chave sem pendência existente: busca alternativa (ex.: tolerância de VALOR)
+                pendencia_final = buscar_correspondencia(posicao, transacao)
+                if pendencia_final is None:
+                    pendencia_final = transacao
+                else:
+                    pendencias_correspondidas += 1
             else:
                 # Se não existe, usar a nova transação como nova pendência
                 pendencia_final = transacao
             
-            # Aplicar regras de negócio para preencher RESPONSAVEL, DEPARTAMENTO e VENCIMENTO
-            pendencia_final = ConciliacaoService._aplicar_regras_negocio(
-                pendencia_final, responsaveis_dict, departamentos_dict
-            )
-            
             pendencias_consolidadas.append(pendencia_final)
         
-        return pendencias_consolidadas
+        # Aplicar regras de negócio para preencher RESPONSAVEL, DEPARTAMENTO e VENCIMENTO
+        contadores_enriquecimento = ConciliacaoService._enriquecer_pendencias(
+            pendencias_consolidadas, responsaveis_dict, departamentos_dict, calendario, regras_responsaveis
+        )
+        
+        return ResultadoConciliacao(
+            pendencias=pendencias_consolidadas,
+            situacao_chaves=np.frombuffer(situacao_chaves, dtype=np.uint8),
+            total_novas_transacoes=len(pendencias_consolidadas),
+            chaves_unicas_novas=chaves_unicas_novas,
+            chaves_duplicadas_novas=chaves_duplicadas_novas,
+            pendencias_preservadas=pendencias_preservadas,
+            novas_pendencias_adicionadas=chaves_unicas_novas - pendencias_preservadas,
+            pendencias_correspondidas=pendencias_correspondidas,
+            **contadores_enriquecimento
+        )
     
     @staticmethod
-    def _criar_dicionario_pendencias(pendencias: List[Pendencia]) -> Dict[str, Pendencia]:
+    def _criar_indice_pendencias(pendencias: Union[Iterable[Pendencia], PendenciaTabela]) -> IndicePendencias:
         """
-        Cria um dicionário de pendências indexado pela chave de reconciliação.
+        Cria o índice (multiconjunto) de pendências pela chave de reconciliação.
+        
+        Todas as pendências de cada chave são mantidas, em ordem inversa: a
+        primeira pendência da chave fica no fim da lista e é a primeira a ser
+        retirada (pop), sem deslocar as demais.
+        
+        Para uma PendenciaTabela o índice guarda as posições das linhas
+        (_FilaTabela), com as chaves montadas por coluna: só as pendências
+        retiradas do índice (as que têm correspondência) viram objetos Pendencia.
         
         Args:
-            pendencias: Lista de pendências
+            pendencias: Lista de pendências ou PendenciaTabela
             
         Returns:
-            Dict[str, Pendencia]: Dicionário chave -> pendência
+            IndicePendencias: Dicionário chave -> pendências com a chave
         """
-        pendencias_dict = {}
+        if isinstance(pendencias, PendenciaTabela):
+            return ConciliacaoService._criar_indice_tabela(pendencias)
+        
+        indice_pendencias = {}
         
         for pendencia in pendencias:
-            chave = pendencia.get_chave_reconciliacao()
-            # Se houver chaves duplicadas, manter a primeira
-            if chave not in pendencias_dict:
-                pendencias_dict[chave] = pendencia
+            chave = pendencia.chave_reconciliacao
+            fila = indice_pendencias.get(chave)
+            if fila is None:
+                indice_pendencias[chave] = [pendencia]
+            else:
+                fila.append(pendencia)
         
-        return pendencias_dict
+        for fila in indice_pendencias.values():
+            if len(fila) > 1:
+                fila.reverse()
+        
+        return indice_pendencias
     
     @staticmethod
-    def _criar_dicionario_responsaveis(responsaveis: List[Responsavel]) -> Dict[str, Responsavel]:
+    def _criar_indice_tabela(tabela: PendenciaTabela) -> IndicePendencias:
         """
-        Cria um dicionário de responsáveis indexado pela chave de identificação.
-        Chave: NOME_BANCO + INFORMACAO_ADICIONAL + TIPO_TRANSACAO
+        Cria o índice de _criar_indice_pendencias com as posições das linhas da tabela.
         
         Args:
-            responsaveis: Lista de responsáveis
+            tabela: Pendências existentes
             
         Returns:
-            Dict[str, Responsavel]: Dicionário chave -> responsável
+            IndicePendencias: Dicionário chave -> fila (_FilaTabela) com as posições da chave
         """
-        responsaveis_dict = {}
+        indice_pendencias = {}
+        
+        for posicao, chave in enumerate(tabela.chaves_reconciliacao()):
+            fila = indice_pendencias.get(chave)
+            if fila is None:
+                indice_pendencias[chave] = _FilaTabela(tabela, posicao)
+            else:
+                fila.append(posicao)
         
-        for responsavel in responsaveis:
-            chave = responsavel.get_chave_identificacao()
-            # Se houver chaves duplicadas, manter a primeira
-            if chave not in responsaveis_dict:
-                responsaveis_dict[chave] = responsavel
+        for fila in indice_pendencias.values():
+            if len(fila) > 1:
+                fila.reverse()
         
-        return responsaveis_dict
+        return indice_pendencias
     
     @staticmethod
-    def _criar_dicionario_departamentos(departamentos: List[Departamento]) -> Dict[str, Departamento]:
+    def _contar_existentes(pendencias_existentes: Union[List[Pendencia], PendenciaTabela],
+                           indice_pendencias: IndicePendencias) -> Dict[str, int]:
         """
-        Cria um dicionário de departamentos indexado pelo responsável.
+        Contadores das pendências existentes, a partir do índice ainda não consumido.
         
         Args:
-            departamentos: Lista de departamentos
+            pendencias_existentes: Pendências existentes
+            indice_pendencias: Índice de _criar_indice_pendencias das mesmas pendências
             
         Returns:
-            Dict[str, Departamento]: Dicionário responsável -> departamento
+            Dict[str, int]: Contadores das pendências existentes (campos de ResultadoConciliacao)
         """
-        departamentos_dict = {}
-        
-        for departamento in departamentos:
-            responsavel = departamento.RESPONSAVEL
-            if responsavel and responsavel not in departamentos_dict:
-                departamentos_dict[responsavel] = departamento
-        
-        return departamentos_dict
+        return {
+            'total_pendencias_existentes': len(pendencias_existentes),
+            'chaves_unicas_existentes': len(indice_pendencias),
+            'chaves_duplicadas_existentes': sum(1 for fila in indice_pendencias.values() if len(fila) > 1)
+        }
     
     @staticmethod
-    def _aplicar_regras_negocio(pendencia: Pendencia, 
+    def _enriquecer_pendencias(pendencias: List[Pendencia],
                                responsaveis_dict: Dict[str, Responsavel],
-                               departamentos_dict: Dict[str, Departamento]) -> Pendencia:
+                               departamentos_dict: Dict[str, Departamento],
+                               calendario: CalendarioDiasUteis,
+                               regras_responsaveis: Optional[RegrasResponsaveis] = None) -> Dict[str, int]:
         """
-        Aplica as regras de negócio para preencher RESPONSAVEL, DEPARTAMENTO e VENCIMENTO da pendência.
+        Aplica as regras de negócio para preencher RESPONSAVEL, DEPARTAMENTO e VENCIMENTO das pendências.
         
         Regras:
         1. RESPONSAVEL: baseado na combinação NOME_BANCO + INFORMACAO_ADICIONAL + TIPO_TRANSACAO
            - Só preenche se o campo RESPONSAVEL estiver vazio
            - Preserva valores já preenchidos
+           - Sem regra exata, usa a primeira regra com curinga em INFORMACAO_ADICIONAL
+             (RegrasResponsaveis) do mesmo NOME_BANCO + TIPO_TRANSACAO
         2. DEPARTAMENTO: baseado no RESPONSAVEL encontrado
            - Só preenche se o campo DEPARTAMENTO estiver vazio
            - Preserva valores já preenchidos
         3. VENCIMENTO: baseado na comparação entre DATA_EXTRATO e último dia útil anterior
            - Se DATA_EXTRATO < último dia útil anterior: VENCIMENTO = ">D+1"
            - Se DATA_EXTRATO >= último dia útil anterior: VENCIMENTO = "D1"
-           - Considera apenas dias úteis (Segunda a Sexta)
+           - Considera apenas dias úteis (Segunda a Sexta, exceto feriados nacionais)
            - Sempre atualiza o campo VENCIMENTO
         
+        Cada regra é resolvida uma única vez por valor distinto (combinação de
+        NOME_BANCO + INFORMACAO_ADICIONAL + TIPO_TRANSACAO, RESPONSAVEL ou
+        DATA_EXTRATO) e o resultado é distribuído às pendências por um vetor
+        de códigos: um dia tem poucas centenas de combinações distintas.
+        
         Args:
-            pendencia: Pendência a ser processada
+            pendencias: Pendências a serem processadas (alteradas no próprio objeto)
             responsaveis_dict: Dicionário de responsáveis
             departamentos_dict: Dicionário de departamentos
+            calendario: Calendário de dias úteis da execução
+            regras_responsaveis: Regras de responsável com curinga (opcional)
             
         Returns:
-            Pendencia: Pendência com campos atualizados
+            Dict[str, int]: Contadores do enriquecimento (campos de ResultadoConciliacao):
+            linhas preenchidas por regra exata ou com curinga, linhas sem regra, etc.
         """
+        contadores = {
+            'responsaveis_regra_exata': 0,
+            'responsaveis_regra_curinga': 0,
+            'responsaveis_sem_regra': 0,
+            'departamentos_encontrados': 0,
+            'departamentos_sem_regra': 0
+        }
+        
         # 1ª Regra: Definir RESPONSAVEL
         # Só preenche se não houver RESPONSAVEL já definido
-        if not pendencia.RESPONSAVEL:
-            # Criar chave de busca baseada nos campos da pendência
-            nome_banco = str(pendencia.NOME_BANCO) if pendencia.NOME_BANCO is not None else ""
-            info_adicional = str(pendencia.INFORMACAO_ADICIONAL) if pendencia.INFORMACAO_ADICIONAL is not None else ""
-            tipo_transacao = str(pendencia.TIPO_TRANSACAO) if pendencia.TIPO_TRANSACAO is not None else ""
+        sem_responsavel = [pendencia for pendencia in pendencias if not pendencia.RESPONSAVEL]
+        contadores['responsaveis_sem_regra'] = len(sem_responsavel)
+        if sem_responsavel and (responsaveis_dict or regras_responsaveis):
+            codigos, combinacoes = _codificar(
+                (_texto(pendencia.NOME_BANCO), _texto(pendencia.INFORMACAO_ADICIONAL), _texto(pendencia.TIPO_TRANSACAO))
+                for pendencia in sem_responsavel
+            )
+            linhas_por_combinacao = np.bincount(codigos, minlength=len(combinacoes))
             
-            chave_responsavel = f"{nome_banco}{info_adicional}{tipo_transacao}"
+            responsaveis_encontrados = []
+            for (nome_banco, info_adicional, tipo_transacao), linhas in zip(combinacoes, linhas_por_combinacao):
+                responsavel_encontrado = responsaveis_dict.get(f"{nome_banco}{info_adicional}{tipo_transacao}")
+                if responsavel_encontrado is not None:
+                    contadores['responsaveis_regra_exata'] += int(linhas)
+                elif regras_responsaveis:
+                    # Regra exata tem prioridade; sem ela, regras com curinga
+                    responsavel_encontrado = regras_responsaveis.buscar(nome_banco, info_adicional, tipo_transacao)
+                    if responsavel_encontrado is not None:
+                        contadores['responsaveis_regra_curinga'] += int(linhas)
+                responsaveis_encontrados.append(responsavel_encontrado)
+            contadores['responsaveis_sem_regra'] -= (
+                contadores['responsaveis_regra_exata'] + contadores['responsaveis_regra_curinga']
+            )
             
-            if chave_responsavel in responsaveis_dict:
-                responsavel_encontrado = responsaveis_dict[chave_responsavel]
-                pendencia.RESPONSAVEL = responsavel_encontrado.RESPONSAVEL
+            for pendencia, responsavel_encontrado in zip(sem_responsavel, _distribuir(responsaveis_encontrados, codigos)):
+                if responsavel_encontrado is not None:
+                    pendencia.RESPONSAVEL = responsavel_encontrado.RESPONSAVEL
         
         # 2ª Regra: Definir DEPARTAMENTO
         # Só preenche se não houver DEPARTAMENTO já definido e se o RESPONSAVEL foi definido
-        if not pendencia.DEPARTAMENTO and pendencia.RESPONSAVEL and pendencia.RESPONSAVEL in departamentos_dict:
-            departamento_encontrado = departamentos_dict[pendencia.RESPONSAVEL]
-            pendencia.DEPARTAMENTO = departamento_encontrado.AREA
+        sem_departamento = [
+            pendencia for pendencia in pendencias
+            if not pendencia.DEPARTAMENTO and pendencia.RESPONSAVEL
+        ]
+        contadores['departamentos_sem_regra'] = len(sem_departamento)
+        if sem_departamento and departamentos_dict:
+            codigos, responsaveis_distintos = _codificar(pendencia.RESPONSAVEL for pendencia in sem_departamento)
+            departamentos_encontrados = [departamentos_dict.get(responsavel) for responsavel in responsaveis_distintos]
+            for pendencia, departamento_encontrado in zip(sem_departamento, _distribuir(departamentos_encontrados, codigos)):
+                if departamento_encontrado is not None:
+                    pendencia.DEPARTAMENTO = departamento_encontrado.AREA
+                    contadores['departamentos_encontrados'] += 1
+            contadores['departamentos_sem_regra'] -= contadores['departamentos_encontrados']
         
         # 3ª Regra: Definir VENCIMENTO
-        # Baseado na comparação entre DATA_EXTRATO e data atual
-        pendencia.VENCIMENTO = ConciliacaoService._calcular_vencimento(pendencia.DATA_EXTRATO)
-        
-        return pendencia
-    
-    @staticmethod
-    def _calcular_vencimento(data_extrato) -> str:
-        """
-        Calcula o vencimento baseado na comparação entre DATA_EXTRATO e (último dia útil anterior).
-        
-        Regras:
-        - Se DATA_EXTRATO < (último dia útil anterior): VENCIMENTO = ">D+1"
-        - Se DATA_EXTRATO >= (último dia útil anterior): VENCIMENTO = "D1"
-        
-        Dias úteis: Segunda a Sexta (exclui sábados e domingos)
-        Exemplos:
-        - Se executado na Segunda: compara com Sexta anterior
-        - Se executado na Terça: compara com Segunda anterior
-        - Se executado no Sábado: compara com Sexta anterior
-        
-        Args:
-            data_extrato: Data do extrato (pode ser datetime, date ou None)
-            
-        Returns:
-            str: String do vencimento ("D1" ou ">D+1")
-        """
-        if data_extrato is None:
-            # Se não há data do extrato, considera como vencido
-            return ">D+1"
-        
-        # Obter data de referência (último dia útil anterior)
-        data_referencia = ConciliacaoService._obter_ultimo_dia_util_anterior()
-        
-        # Converter data_extrato para date se necessário
-        if isinstance(data_extrato, datetime):
-            data_extrato = data_extrato.date()
-        elif isinstance(data_extrato, str):
-            try:
-                # Tentar converter string para date (formato comum: YYYY-MM-DD)
-                data_extrato = datetime.strptime(data_extrato, '%Y-%m-%d').date()
-            except ValueError:
-                try:
-                    # Tentar formato brasileiro: DD/MM/YYYY
-                    data_extrato = datetime.strptime(data_extrato, '%d/%m/%Y').date()
-                except ValueError:
-                    # Se não conseguir converter, considera como vencido
-                    return ">D+1"
-        
-        # Aplicar regra de negócio
-        if data_extrato < data_referencia:
-            return ">D+1"  # Data do extrato é anterior ao último dia útil anterior
-        else:
-            return "D1"    # Data do extrato é igual ou posterior ao último dia útil anterior
-    
-    @staticmethod
-    def _obter_ultimo_dia_util_anterior() -> date:
-        """
-        Obtém o último dia útil anterior à data atual.
-        
-        Lógica:
-        - Segunda-feira (0): retorna Sexta anterior (3 dias atrás)
-        - Terça-feira (1): retorna Segunda anterior (1 dia atrás)
-        - Quarta-feira (2): retorna Terça anterior (1 dia atrás)
-        - Quinta-feira (3): retorna Quarta anterior (1 dia atrás)
-        - Sexta-feira (4): retorna Quinta anterior (1 dia atrás)
-        - Sábado (5): retorna Sexta anterior (1 dia atrás)
-        - Domingo (6): retorna Sexta anterior (2 dias atrás)
-        
-        Returns:
-            date: Data do último dia útil anterior
-        """
-        data_atual = date.today()
-        dia_semana = data_atual.weekday()  # 0=Segunda, 1=Terça, ..., 6=Domingo
-        
-        if dia_semana == 0:  # Segunda-feira
-            # Voltar para sexta-feira anterior (3 dias atrás)
-            dias_para_voltar = 3
-        elif dia_semana == 6:  # Domingo
-            # Voltar para sexta-feira anterior (2 dias atrás)
-            dias_para_voltar = 2
-        else:  # Terça a Sábado
-            # Voltar 1 dia (dia útil anterior)
-            dias_para_voltar = 1
+        # Baseado na comparação entre DATA_EXTRATO e o último dia útil anterior à execução
+        if pendencias:
+            vencimentos = calendario.classificar_vencimentos(
+                pd.Series([pendencia.DATA_EXTRATO for pendencia in pendencias], dtype=object)
+            )
+            for pendencia, vencimento in zip(pendencias, vencimentos):
+                pendencia.VENCIMENTO = vencimento
         
-        return data_atual - timedelta(days=dias_para_voltar)
+        return contadores
     
     @staticmethod
-    def obter_estatisticas_consolidacao(pendencias_existentes: List[Pendencia],
-                                      novas_transacoes: List[Pendencia],
-                                      pendencias_consolidadas: List[Pendencia]) -> Dict[str, int]:
+    def obter_estatisticas_consolidacao(pendencias_existentes: Union[List[Pendencia], PendenciaTabela],
+                                      novas_transacoes: Union[List[Pendencia], PendenciaTabela],
+                                      pendencias_consolidadas: Union[List[Pendencia], PendenciaTabela]) -> Dict[str, int]:
         """
         Calcula estatísticas do processo de consolidação.
         
         Args:
-            pendencias_existentes: Lista de pendências existentes
-            novas_transacoes: Lista de novas transações
-            pendencias_consolidadas: Lista consolidada resultado
+            pendencias_existentes: Pendências existentes (lista ou PendenciaTabela)
+            novas_transacoes: Novas transações (lista ou PendenciaTabela)
+            pendencias_consolidadas: Resultado consolidado (lista ou PendenciaTabela)
             
         Returns:
             Dict[str, int]: Estatísticas do processo
         """
-        # Criar sets de chaves para análise
-        chaves_existentes = {p.get_chave_reconciliacao() for p in pendencias_existentes}
-        chaves_novas = {t.get_chave_reconciliacao() for t in novas_transacoes}
+        # Contagem de pendências/transações por chave (multiconjuntos)
+        contagem_existentes = Counter(ConciliacaoService._obter_chaves(pendencias_existentes))
+        contagem_novas = Counter(ConciliacaoService._obter_chaves(novas_transacoes))
         
         # Calcular intersecções
+        chaves_existentes = contagem_existentes.keys()
+        chaves_novas = contagem_novas.keys()
         chaves_comuns = chaves_existentes & chaves_novas
         chaves_apenas_novas = chaves_novas - chaves_existentes
         
+        # Pareamento um a um: por chave, o menor entre pendências existentes e transações
+        pendencias_correspondidas = sum((contagem_existentes & contagem_novas).values())
+        
         return {
             'total_pendencias_existentes': len(pendencias_existentes),
             'total_novas_transacoes': len(novas_transacoes),
@@ -291,5 +972,162 @@ class ConciliacaoService:
             'pendencias_preservadas': len(chaves_comuns),
             'novas_pendencias_adicionadas': len(chaves_apenas_novas),
             'chaves_unicas_existentes': len(chaves_existentes),
-            'chaves_unicas_novas': len(chaves_novas)
-        } 
\ No newline at end of file
+            'chaves_unicas_novas': len(chaves_novas),
+            'pendencias_correspondidas': pendencias_correspondidas,
+            'transacoes_sem_correspondencia': len(novas_transacoes) - pendencias_correspondidas,
+            'pendencias_existentes_sem_correspondencia': len(pendencias_existentes) - pendencias_correspondidas
+        }
+    
+    @staticmethod
+    def _obter_chaves(pendencias: Union[List[Pendencia], PendenciaTabela]) -> List[ChaveReconciliacao]:
+        """
+        Obtém as chaves de reconciliação das pendências.
+        
+        Em uma PendenciaTabela as chaves são montadas por coluna, sem criar
+        objetos Pendencia.
+        
+        Args:
+            pendencias: Lista de pendências ou PendenciaTabela
+            
+        Returns:
+            List[ChaveReconciliacao]: Chaves de reconciliação, na ordem das pendências
+        """
+        if isinstance(pendencias, PendenciaTabela):
+            return pendencias.chaves_reconciliacao()
+        return [pendencia.chave_reconciliacao for pendencia in pendencias]
+
+
+@lru_cache(maxsize=65536)
+def _normalizar_texto(texto: str) -> str:
+    """
+    Normaliza um texto da chave para a conciliação tolerante.
+    
+    Remove acentos, ignora maiúsculas/minúsculas (casefold) e reduz
+    sequências de espaços a um único espaço. Textos repetidos são
+    normalizados uma única vez (cache).
+    
+    Args:
+        texto: Texto da chave de reconciliação
+        
+    Returns:
+        str: Texto normalizado
+    """
+    if not texto.isascii():
+        decomposto = unicodedata.normalize('NFKD', texto)
+        texto = ''.join(caractere for caractere in decomposto if not unicodedata.combining(caractere))
+    return ' '.join(texto.casefold().split())
+
+
+def _texto(valor) -> str:
+    """
+    Converte um campo para texto, com "" para vazio (mesma conversão da chave de responsável).
+    """
+    return str(valor) if valor is not None else ""
+
+
+def _codificar(valores: Iterable) -> Tuple[np.ndarray, List]:
+    """
+    Codifica valores pela ordem de primeira ocorrência.
+    
+    Args:
+        valores: Valores hasheáveis
+        
+    Returns:
+        Tuple[np.ndarray, List]: (código de cada valor, valores distintos)
+    """
+    distintos = {}
+    codigos = [distintos.setdefault(valor, len(distintos)) for valor in valores]
+    return np.array(codigos, dtype=np.intp), list(distintos)
+
+
+def _distribuir(resultados: List, codigos: np.ndarray) -> np.ndarray:
+    """
+    Distribui o resultado de cada valor distinto às linhas pelo vetor de códigos.
+    
+    Args:
+        resultados: Um resultado por valor distinto (ordem de _codificar)
+        codigos: Código de cada linha (de _codificar)
+        
+    Returns:
+        np.ndarray: Resultado de cada linha (tipo object)
+    """
+    distintos = np.empty(len(resultados), dtype=object)
+    distintos[:] = resultados
+    return distintos[codigos]
+
+
+class _FilaTabela(list):
+    """
+    Fila do IndicePendencias com posições de linhas de uma PendenciaTabela.
+    
+    Comporta-se como a lista de pendências da chave (len, ordem inversa), mas
+    guarda apenas as posições: pop() monta a Pendencia da linha retirada.
+    """
+    __slots__ = ('_tabela',)
+    
+    def __init__(self, tabela: PendenciaTabela, posicao: int):
+        super().__init__((posicao,))
+        self._tabela = tabela
+    
+    def pop(self) -> Pendencia:
+        return self._tabela[super().pop()]
+
+
+def _consolidar_fatia(pendencias_existentes: Union[List[Pendencia], PendenciaTabela],
+                      novas_transacoes: Union[List[Pendencia], PendenciaTabela],
+                      responsaveis_dict: Dict[str, Responsavel],
+                      departamentos_dict: Dict[str, Departamento],
+                      motor: str,
+                      calendario: CalendarioDiasUteis,
+                      regras_responsaveis: Optional[RegrasResponsaveis]) -> ResultadoConciliacao:
+    """
+    Consolida uma fatia e coleta os seus contadores (executada nos processos do pool).
+    
+    Returns:
+        ResultadoConciliacao: Pendências consolidadas e contadores da fatia
+    """
+    return ConciliacaoService.conciliar(
+        pendencias_existentes,
+        novas_transacoes,
+        responsaveis_dict=responsaveis_dict,
+        departamentos_dict=departamentos_dict,
+        motor=motor,
+        calendario=calendario,
+        regras_responsaveis=regras_responsaveis
+    )
+
+
+def _selecionar(pendencias: Union[List[Pendencia], PendenciaTabela],
+                posicoes: List[int]) -> Union[List[Pendencia], PendenciaTabela]:
+    """
+    Seleciona pendências pela posição, mantendo o tipo da entrada.
+    """
+    if isinstance(pendencias, PendenciaTabela):
+        return pendencias.linhas(posicoes)
+    return [pendencias[posicao] for posicao in posicoes]
+
+
+def _reordenar(resultados: List[Union[List[Pendencia], PendenciaTabela]],
+               posicoes: List[List[int]],
+               total: int) -> Union[List[Pendencia], PendenciaTabela]:
+    """
+    Junta os resultados das fatias na ordem original das transações.
+    
+    Args:
+        resultados: Pendências consolidadas de cada fatia
+        posicoes: Posições originais das transações de cada fatia
+        total: Quantidade total de transações
+        
+    Returns:
+        List[Pendencia] ou PendenciaTabela: Pendências consolidadas (PendenciaTabela
+        se as fatias devolverem PendenciaTabela)
+    """
+    if all(isinstance(resultado, PendenciaTabela) for resultado in resultados):
+        ordem = np.argsort(np.concatenate([np.asarray(p, dtype=np.intp) for p in posicoes]), kind='stable')
+        return PendenciaTabela.concatenar(resultados).linhas(ordem)
+    
+    pendencias_consolidadas = [None] * total
+    for resultado, posicoes_fatia in zip(resultados, posicoes):
+        for posicao, pendencia in zip(posicoes_fatia, resultado):
+            pendencias_consolidadas[posicao] = pendencia
+    return pendencias_consolidadas
@@ -0,0 +1,245 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple, Union
+from entities.pendencia import Pendencia
+from entities.pendencia_tabela import PendenciaTabela, CAMPOS_PENDENCIA
+from entities.responsavel import Responsavel
+from entities.departamento import Departamento
+from services.calendario_dias_uteis import CalendarioDiasUteis
+from services.regras_responsaveis import RegrasResponsaveis
+from services.resultado_conciliacao import (
+    ResultadoConciliacao, CHAVE_REPETIDA, CHAVE_PRESERVADA, CHAVE_ADICIONADA
+)
+
+
+class ConciliacaoVetorizadaService:
+    """
+    Motor de conciliação por colunas, alternativo ao laço por transação do ConciliacaoService.
+
+    Aplica exatamente as mesmas regras, mas sobre colunas inteiras:
+    - Pendência existente x nova transação: junção (merge) pela chave de
+      reconciliação e pela ocorrência da chave, de forma que a k-ésima transação
+      de uma chave usa a k-ésima pendência existente com a mesma chave
+    - RESPONSAVEL: junção com o DePara pela chave NOME_BANCO + INFORMACAO_ADICIONAL
+      + TIPO_TRANSACAO, apenas nas linhas com RESPONSAVEL vazio
+    - DEPARTAMENTO: mapeamento pelo RESPONSAVEL, apenas nas linhas com DEPARTAMENTO vazio
+    - VENCIMENTO: comparação da coluna DATA_EXTRATO inteira com a data de referência
+      do calendário de dias úteis
+
+    As linhas finais são selecionadas por posição (take) sobre as colunas,
+    sem montar objetos Pendencia.
+
+    Diferente do motor por objetos, as entradas não são alteradas: o resultado
+    é uma nova PendenciaTabela.
+    """
+
+    @staticmethod
+    def consolidar(pendencias_existentes: Union[List[Pendencia], PendenciaTabela],
+                   novas_transacoes: Union[List[Pendencia], PendenciaTabela],
+                   responsaveis_dict: Dict[str, Responsavel],
+                   departamentos_dict: Dict[str, Departamento],
+                   calendario: CalendarioDiasUteis,
+                   regras_responsaveis: Optional[RegrasResponsaveis] = None) -> PendenciaTabela:
+        """
+        Consolida as novas transações contra as pendências existentes.
+
+        Args:
+            pendencias_existentes: Pendências já existentes (lista ou PendenciaTabela)
+            novas_transacoes: Novas transações (lista ou PendenciaTabela)
+            responsaveis_dict: Dicionário de responsáveis (chave -> Responsavel)
+            departamentos_dict: Dicionário de departamentos (responsável -> Departamento)
+            calendario: Calendário de dias úteis da execução (classificação do VENCIMENTO)
+            regras_responsaveis: Regras de responsável com curinga, aplicadas sem regra exata (opcional)
+
+        Returns:
+            PendenciaTabela: Pendências consolidadas, na ordem das transações
+        """
+        return ConciliacaoVetorizadaService.conciliar(
+            pendencias_existentes, novas_transacoes, responsaveis_dict, departamentos_dict, calendario,
+            regras_responsaveis
+        ).pendencias
+
+    @staticmethod
+    def conciliar(pendencias_existentes: Union[List[Pendencia], PendenciaTabela],
+                  novas_transacoes: Union[List[Pendencia], PendenciaTabela],
+                  responsaveis_dict: Dict[str, Responsavel],
+                  departamentos_dict: Dict[str, Departamento],
+                  calendario: CalendarioDiasUteis,
+                  regras_responsaveis: Optional[RegrasResponsaveis] = None) -> ResultadoConciliacao:
+        """
+        Consolida as novas transações e coleta os contadores da conciliação.
+
+        Os contadores de chaves saem da numeração de ocorrências usada na junção
+        (ocorrência 0 = chave distinta, 1 = chave repetida) e os do DePara, das
+        máscaras de preenchimento.
+
+        Args:
+            pendencias_existentes: Pendências já existentes (lista ou PendenciaTabela)
+            novas_transacoes: Novas transações (lista ou PendenciaTabela)
+            responsaveis_dict: Dicionário de responsáveis (chave -> Responsavel)
+            departamentos_dict: Dicionário de departamentos (responsável -> Departamento)
+            calendario: Calendário de dias úteis da execução (classificação do VENCIMENTO)
+            regras_responsaveis: Regras de responsável com curinga, aplicadas sem regra exata (opcional)
+
+        Returns:
+            ResultadoConciliacao: Pendências consolidadas (PendenciaTabela, na ordem das
+            transações) e contadores
+        """
+        existentes = PendenciaTabela.de_pendencias(pendencias_existentes)
+        novas = PendenciaTabela.de_pendencias(novas_transacoes)
+
+        # 1. Linha final de cada transação: a pendência existente de mesma chave, ou a própria transação
+        indices_existentes, ocorrencias_novas, ocorrencias_existentes = (
+            ConciliacaoVetorizadaService._indices_correspondentes(existentes, novas)
+        )
+        correspondida = indices_existentes >= 0
+        resultado = ResultadoConciliacao(
+            total_pendencias_existentes=len(existentes),
+            total_novas_transacoes=len(novas),
+            chaves_unicas_existentes=int((ocorrencias_existentes == 0).sum()),
+            chaves_unicas_novas=int((ocorrencias_novas == 0).sum()),
+            chaves_duplicadas_existentes=int((ocorrencias_existentes == 1).sum()),
+            chaves_duplicadas_novas=int((ocorrencias_novas == 1).sum()),
+            # A primeira ocorrência de uma chave existente sempre encontra a sua pendência
+            pendencias_preservadas=int((correspondida & (ocorrencias_novas == 0)).sum()),
+            novas_pendencias_adicionadas=int((~correspondida & (ocorrencias_novas == 0)).sum()),
+            pendencias_correspondidas=int(correspondida.sum()),
+            situacao_chaves=np.where(
+                ocorrencias_novas == 0, np.where(correspondida, CHAVE_PRESERVADA, CHAVE_ADICIONADA), CHAVE_REPETIDA
+            ).astype(np.uint8)
+        )
+
+        if len(novas) == 0:
+            resultado.pendencias = PendenciaTabela()
+            return resultado
+
+        posicoes = np.where(indices_existentes >= 0, len(novas) + indices_existentes, np.arange(len(novas)))
+        consolidadas = PendenciaTabela.concatenar([novas, existentes]).linhas(posicoes)
+
+        # 2. RESPONSAVEL pelo DePara, preservando valores já preenchidos
+        responsaveis = consolidadas.coluna('RESPONSAVEL').astype(object)
+        responsavel_vazio = ConciliacaoVetorizadaService._vazios(responsaveis)
+        resultado.responsaveis_sem_regra = int(responsavel_vazio.sum())
+        if responsavel_vazio.any() and (responsaveis_dict or regras_responsaveis):
+            bancos = consolidadas.textos('NOME_BANCO')
+            informacoes = consolidadas.textos('INFORMACAO_ADICIONAL')
+            tipos = consolidadas.textos('TIPO_TRANSACAO')
+            regra_exata = np.zeros(len(consolidadas), dtype=bool)
+
+            if responsaveis_dict:
+                # Junção apenas das chaves distintas; o resultado volta às linhas pelos códigos
+                codigos, chaves_distintas = pd.factorize(bancos + informacoes + tipos)
+                depara = pd.DataFrame({
+                    'chave': pd.Series(list(responsaveis_dict.keys()), dtype=object),
+                    'responsavel': pd.Series([responsavel.RESPONSAVEL for responsavel in responsaveis_dict.values()],
+                                             dtype=object)
+                })
+                juncao = pd.DataFrame({'chave': pd.Series(chaves_distintas, dtype=object)}).merge(
+                    depara, on='chave', how='left', indicator=True
+                )
+                regra_exata = (juncao['_merge'] == 'both').to_numpy()[codigos]
+                preencher = responsavel_vazio & regra_exata
+                responsaveis = responsaveis.where(~preencher, juncao['responsavel'].to_numpy(dtype=object)[codigos])
+                resultado.responsaveis_regra_exata = int(preencher.sum())
+
+            if regras_responsaveis:
+                # Regras com curinga só sem regra exata, uma busca por combinação distinta
+                pendentes = np.flatnonzero(responsavel_vazio & ~regra_exata)
+                combinacoes = zip(bancos.to_numpy()[pendentes], informacoes.to_numpy()[pendentes],
+                                  tipos.to_numpy()[pendentes])
+                encontrados = {}
+                linhas, valores = [], []
+                for linha, combinacao in zip(pendentes, combinacoes):
+                    if combinacao not in encontrados:
+                        encontrados[combinacao] = regras_responsaveis.buscar(*combinacao)
+                    responsavel = encontrados[combinacao]
+                    if responsavel is not None:
+                        linhas.append(linha)
+                        valores.append(responsavel.RESPONSAVEL)
+                if linhas:
+                    responsaveis = responsaveis.copy()
+                    responsaveis.iloc[linhas] = pd.Series(valores, dtype=object).to_numpy()
+                resultado.responsaveis_regra_curinga = len(linhas)
+
+            resultado.responsaveis_sem_regra -= resultado.responsaveis_regra_exata + resultado.responsaveis_regra_curinga
+
+        # 3. DEPARTAMENTO pelo RESPONSAVEL, preservando valores já preenchidos
+        departamentos = consolidadas.coluna('DEPARTAMENTO').astype(object)
+        departamento_vazio = ConciliacaoVetorizadaService._vazios(departamentos)
+        # Só as linhas com RESPONSAVEL podem receber DEPARTAMENTO
+        candidatas = departamento_vazio & ~ConciliacaoVetorizadaService._vazios(responsaveis)
+        resultado.departamentos_sem_regra = int(candidatas.sum())
+        if departamento_vazio.any() and departamentos_dict:
+            areas = {responsavel: departamento.AREA for responsavel, departamento in departamentos_dict.items()}
+            preencher = candidatas & responsaveis.isin(list(areas)).to_numpy()
+            departamentos = departamentos.where(~preencher, responsaveis.map(areas))
+            resultado.departamentos_encontrados = int(preencher.sum())
+            resultado.departamentos_sem_regra -= resultado.departamentos_encontrados
+
+        # 4. VENCIMENTO da coluna inteira
+        vencimentos = calendario.classificar_vencimentos(consolidadas.coluna('DATA_EXTRATO'))
+
+        resultado.pendencias = consolidadas.com_colunas(
+            RESPONSAVEL=responsaveis,
+            DEPARTAMENTO=departamentos,
+            VENCIMENTO=vencimentos
+        )
+        return resultado
+
+    @staticmethod
+    def _indices_correspondentes(existentes: PendenciaTabela,
+                                 novas: PendenciaTabela) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Junta as novas transações às pendências existentes pela chave de reconciliação.
+
+        Em chaves repetidas, a ocorrência da chave (0, 1, 2...) entra na junção,
+        pareando as linhas uma a uma, como o índice do motor por objetos.
+
+        Args:
+            existentes: Pendências existentes
+            novas: Novas transações
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Posição da pendência existente de cada
+            transação (-1 se não houver), ocorrência da chave de cada transação e de cada
+            pendência existente
+        """
+        chaves_novas = ConciliacaoVetorizadaService._numerar_ocorrencias(novas.colunas_chave())
+        ocorrencias_novas = chaves_novas['ocorrencia'].to_numpy()
+        if len(existentes) == 0:
+            return np.full(len(novas), -1, dtype=np.int64), ocorrencias_novas, np.empty(0, dtype=np.int64)
+
+        chaves_existentes = ConciliacaoVetorizadaService._numerar_ocorrencias(existentes.colunas_chave())
+        ocorrencias_existentes = chaves_existentes['ocorrencia'].to_numpy()
+        chaves_existentes['indice'] = np.arange(len(existentes))
+
+        juncao = chaves_novas.merge(chaves_existentes, on=list(chaves_novas.columns), how='left')
+
+        return juncao['indice'].fillna(-1).to_numpy(dtype=np.int64), ocorrencias_novas, ocorrencias_existentes
+
+    @staticmethod
+    def _numerar_ocorrencias(chaves: pd.DataFrame) -> pd.DataFrame:
+        """
+        Acrescenta a ocorrência de cada chave (0 na primeira linha da chave, 1 na segunda...).
+
+        Args:
+            chaves: Colunas da chave de reconciliação (PendenciaTabela.colunas_chave)
+
+        Returns:
+            pd.DataFrame: As mesmas colunas mais a coluna 'ocorrencia'
+        """
+        chaves['ocorrencia'] = chaves.groupby(list(chaves.columns), sort=False, dropna=False).cumcount()
+        return chaves
+
+    @staticmethod
+    def _vazios(serie: pd.Series) -> np.ndarray:
+        """
+        Indica as células vazias de uma coluna (mesmo critério de `not valor` no motor por objetos).
+
+        Args:
+            serie: Coluna (tipo object)
+
+        Returns:
+            np.ndarray: Máscara booleana das células vazias (nulo, texto vazio ou zero)
+        """
+        return (serie.isna() | serie.isin(['', 0])).to_numpy()
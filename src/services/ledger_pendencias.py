@@ -0,0 +1,390 @@
+import sqlite3
+import numpy as np
+import pandas as pd
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Union
+from entities.pendencia import Pendencia, ChaveReconciliacao
+from entities.pendencia_tabela import PendenciaTabela, CAMPOS_PENDENCIA
+
+
+# Colunas da chave de reconciliação gravadas junto com cada pendência
+_COLUNAS_CHAVE = ('CHAVE_VALOR', 'CHAVE_INFORMACAO_ADICIONAL', 'CHAVE_NOME_CONTA')
+
+# Junção nula-segura entre a tabela de busca (c) e as pendências (p)
+_CONDICAO_CHAVE = ' AND '.join(f'p.{coluna} IS c.{coluna}' for coluna in _COLUNAS_CHAVE)
+
+# Planilhas de pendências que correspondem ao conteúdo do ledger (tabela planilhas)
+_PLANILHA_IMPORTADA = 'importada'
+_PLANILHA_RELATORIO = 'relatorio'
+
+
+class LedgerPendencias:
+    """
+    Registro local e persistente das pendências (SQLite), indexado pela chave de reconciliação.
+
+    Substitui a releitura diária da planilha de pendências inteira: o ledger é
+    carregado uma vez (importar) e, a cada execução, apenas as chaves das novas
+    transações do dia são buscadas (buscar_por_chaves) e as pendências
+    consolidadas são gravadas de volta (gravar). A leitura passa a depender do
+    volume do dia, e não do total de pendências acumuladas.
+
+    Ciclo de vida: gravar substitui o conteúdo do ledger pelas pendências
+    consolidadas. Pendências gravadas sem correspondência nas novas transações
+    (reconciliadas) são removidas, como acontece com a planilha de pendências
+    ao ser substituída pelo relatório consolidado.
+
+    O ledger guarda a assinatura (hash do conteúdo) da planilha importada e do
+    último relatório gerado a partir dele. Enquanto a planilha de pendências
+    informada for uma dessas, sem alterações, o ledger a substitui; uma
+    planilha editada fora do sistema tem outra assinatura e deve ser importada
+    de novo (planilha_sincronizada).
+
+    As colunas de dados não têm tipo declarado, de forma que números e textos
+    são devolvidos como foram gravados. Datas são gravadas em ISO 8601.
+
+    Uso:
+        with LedgerPendencias('pendencias.db') as ledger:
+            if not ledger.planilha_sincronizada(assinatura):
+                ledger.importar(pendencias, assinatura)
+            existentes = ledger.buscar_por_chaves(novas_transacoes)
+            ...
+            ledger.gravar(pendencias_consolidadas)
+            ledger.registrar_relatorio(assinatura_relatorio)
+    """
+
+    def __init__(self, caminho: str):
+        """
+        Args:
+            caminho: Caminho do arquivo SQLite (criado se não existir)
+        """
+        self.caminho = caminho
+        self._conexao = sqlite3.connect(caminho)
+        self._criar_esquema()
+
+    def __enter__(self) -> 'LedgerPendencias':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.fechar()
+
+    def __len__(self) -> int:
+        return self._conexao.execute('SELECT COUNT(*) FROM pendencias').fetchone()[0]
+
+    def fechar(self) -> None:
+        """
+        Fecha a conexão com o arquivo do ledger.
+        """
+        self._conexao.close()
+
+    def contar_chaves(self) -> int:
+        """
+        Conta as chaves de reconciliação distintas do ledger.
+
+        Returns:
+            int: Quantidade de chaves distintas
+        """
+        colunas = ', '.join(_COLUNAS_CHAVE)
+        return self._conexao.execute(
+            f'SELECT COUNT(*) FROM (SELECT DISTINCT {colunas} FROM pendencias)'
+        ).fetchone()[0]
+
+    def contar_chaves_repetidas(self) -> int:
+        """
+        Conta as chaves de reconciliação com mais de uma pendência no ledger.
+
+        Returns:
+            int: Quantidade de chaves repetidas
+        """
+        colunas = ', '.join(_COLUNAS_CHAVE)
+        return self._conexao.execute(
+            f'SELECT COUNT(*) FROM (SELECT 1 FROM pendencias GROUP BY {colunas} HAVING COUNT(*) > 1)'
+        ).fetchone()[0]
+
+    def planilha_sincronizada(self, assinatura: str) -> bool:
+        """
+        Verifica se uma planilha de pendências corresponde ao conteúdo do ledger.
+
+        Correspondem a planilha importada (importar) e o último relatório gerado
+        a partir do ledger (registrar_relatorio), enquanto não forem alterados.
+
+        Args:
+            assinatura: Hash do conteúdo da planilha
+
+        Returns:
+            bool: True se a planilha não precisa ser importada
+        """
+        return self._conexao.execute(
+            'SELECT 1 FROM planilhas WHERE assinatura = ?', (assinatura,)
+        ).fetchone() is not None
+
+    def importar(self, pendencias: Union[List[Pendencia], PendenciaTabela],
+                 assinatura: Optional[str] = None) -> None:
+        """
+        Substitui todo o conteúdo do ledger pelas pendências informadas (carga inicial).
+
+        A ordem das pendências é preservada: ela define o pareamento das
+        pendências de mesma chave, como na planilha. As assinaturas registradas
+        antes são descartadas.
+
+        Args:
+            pendencias: Pendências existentes (lista ou PendenciaTabela)
+            assinatura: Hash do conteúdo da planilha de origem (opcional)
+        """
+        tabela = PendenciaTabela.de_pendencias(pendencias)
+        with self._conexao:
+            self._conexao.execute('DELETE FROM pendencias')
+            self._conexao.execute('DELETE FROM planilhas')
+            self._inserir(self._linhas_sqlite(tabela))
+            if assinatura is not None:
+                self._conexao.execute('INSERT INTO planilhas VALUES (?, ?)', (_PLANILHA_IMPORTADA, assinatura))
+
+    def registrar_relatorio(self, assinatura: str) -> None:
+        """
+        Registra o relatório gerado com o conteúdo atual do ledger.
+
+        O relatório pode ser informado como planilha de pendências da próxima
+        execução sem ser importado (substitui o relatório registrado antes).
+
+        Args:
+            assinatura: Hash do conteúdo do relatório
+        """
+        with self._conexao:
+            self._conexao.execute(
+                'INSERT OR REPLACE INTO planilhas VALUES (?, ?)', (_PLANILHA_RELATORIO, assinatura)
+            )
+
+    def buscar_por_chaves(self, pendencias: Union[List[Pendencia], PendenciaTabela]) -> PendenciaTabela:
+        """
+        Busca as pendências do ledger com as mesmas chaves das pendências informadas.
+
+        Todas as pendências de cada chave são devolvidas, na ordem de gravação,
+        para o pareamento um a um do ConciliacaoService.
+
+        Args:
+            pendencias: Pendências cujas chaves serão buscadas (ex.: novas transações)
+
+        Returns:
+            PendenciaTabela: Pendências encontradas, na ordem do ledger
+        """
+        tabela = PendenciaTabela.de_pendencias(pendencias)
+        self._preparar_busca(tabela.chaves_reconciliacao())
+
+        colunas = ', '.join(f'p.{campo}' for campo in CAMPOS_PENDENCIA)
+        linhas = self._conexao.execute(f'''
+            SELECT {colunas}
+            FROM chaves_busca c
+            JOIN pendencias p ON {_CONDICAO_CHAVE}
+            ORDER BY p.id
+        ''').fetchall()
+
+        return self._tabela_de_linhas(linhas)
+
+    def gravar(self, pendencias: Union[List[Pendencia], PendenciaTabela]) -> int:
+        """
+        Grava as pendências consolidadas como o novo conteúdo do ledger.
+
+        Em cada chave, a k-ésima pendência consolidada atualiza a k-ésima
+        pendência gravada com a mesma chave (o mesmo pareamento da conciliação)
+        e as pendências além das já gravadas são inseridas. As pendências
+        gravadas que não foram pareadas saem do ledger (foram reconciliadas:
+        não constam mais das novas transações), de forma que, após a gravação,
+        o ledger contém exatamente as pendências do relatório consolidado,
+        como a planilha de pendências da próxima execução.
+
+        Args:
+            pendencias: Pendências consolidadas (lista ou PendenciaTabela)
+
+        Returns:
+            int: Quantidade de pendências removidas do ledger
+        """
+        tabela = PendenciaTabela.de_pendencias(pendencias)
+        linhas = self._linhas_sqlite(tabela)
+        chaves = [tuple(linha[:len(_COLUNAS_CHAVE)]) for linha in linhas]
+
+        with self._conexao:
+            identificadores = self._identificadores_por_chave(chaves)
+
+            atribuicoes = ', '.join(f'{campo} = ?' for campo in CAMPOS_PENDENCIA)
+            atualizacoes = []
+            insercoes = []
+            for chave, linha in zip(chaves, linhas):
+                # Próximo id ainda não atualizado da chave (ids em ordem inversa)
+                ids_chave = identificadores.get(chave)
+                if ids_chave:
+                    atualizacoes.append((*linha[len(_COLUNAS_CHAVE):], ids_chave.pop()))
+                else:
+                    insercoes.append(linha)
+
+            self._conexao.executemany(f'UPDATE pendencias SET {atribuicoes} WHERE id = ?', atualizacoes)
+
+            # Remover as pendências não pareadas (antes da inserção das novas)
+            self._conexao.execute('DELETE FROM ids_pareados')
+            self._conexao.executemany(
+                'INSERT INTO ids_pareados VALUES (?)',
+                [(atualizacao[-1],) for atualizacao in atualizacoes]
+            )
+            removidas = self._conexao.execute(
+                'DELETE FROM pendencias WHERE id NOT IN (SELECT id FROM ids_pareados)'
+            ).rowcount
+
+            self._inserir(insercoes)
+
+        return removidas
+
+    def para_tabela(self) -> PendenciaTabela:
+        """
+        Lê todo o conteúdo do ledger.
+
+        Returns:
+            PendenciaTabela: Todas as pendências, na ordem de gravação
+        """
+        colunas = ', '.join(CAMPOS_PENDENCIA)
+        linhas = self._conexao.execute(f'SELECT {colunas} FROM pendencias ORDER BY id').fetchall()
+        return self._tabela_de_linhas(linhas)
+
+    def _criar_esquema(self) -> None:
+        """
+        Cria as tabelas de pendências e de planilhas, o índice da chave e as tabelas
+        temporárias de busca e de pareamento.
+        """
+        colunas_chave = ', '.join(_COLUNAS_CHAVE)
+        colunas_dados = ', '.join(CAMPOS_PENDENCIA)
+        with self._conexao:
+            self._conexao.execute(f'''
+                CREATE TABLE IF NOT EXISTS pendencias (
+                    id INTEGER PRIMARY KEY,
+                    {colunas_chave},
+                    {colunas_dados}
+                )
+            ''')
+            self._conexao.execute(
+                f'CREATE INDEX IF NOT EXISTS idx_pendencias_chave ON pendencias ({colunas_chave})'
+            )
+            self._conexao.execute(
+                'CREATE TABLE IF NOT EXISTS planilhas (origem TEXT PRIMARY KEY, assinatura TEXT)'
+            )
+        self._conexao.execute(f'CREATE TEMP TABLE IF NOT EXISTS chaves_busca ({colunas_chave})')
+        self._conexao.execute('CREATE TEMP TABLE IF NOT EXISTS ids_pareados (id INTEGER PRIMARY KEY)')
+
+    def _preparar_busca(self, chaves: Iterable[ChaveReconciliacao]) -> None:
+        """
+        Carrega as chaves distintas a buscar na tabela temporária.
+
+        Args:
+            chaves: Chaves de reconciliação
+        """
+        marcadores = ', '.join('?' for _ in _COLUNAS_CHAVE)
+        self._conexao.execute('DELETE FROM chaves_busca')
+        self._conexao.executemany(
+            f'INSERT INTO chaves_busca VALUES ({marcadores})',
+            list(dict.fromkeys(chaves))
+        )
+
+    def _identificadores_por_chave(self, chaves: Iterable[ChaveReconciliacao]) -> Dict[ChaveReconciliacao, List[int]]:
+        """
+        Obtém os ids das pendências gravadas de cada chave.
+
+        Args:
+            chaves: Chaves de reconciliação
+
+        Returns:
+            Dict[ChaveReconciliacao, List[int]]: Chave -> ids em ordem decrescente, de forma
+            que pop() entrega o menor (apenas chaves existentes no ledger)
+        """
+        self._preparar_busca(chaves)
+        colunas = ', '.join(f'c.{coluna}' for coluna in _COLUNAS_CHAVE)
+        linhas = self._conexao.execute(f'''
+            SELECT {colunas}, p.id
+            FROM chaves_busca c
+            JOIN pendencias p ON {_CONDICAO_CHAVE}
+            ORDER BY p.id DESC
+        ''').fetchall()
+
+        identificadores = {}
+        for linha in linhas:
+            identificadores.setdefault(tuple(linha[:-1]), []).append(linha[-1])
+        return identificadores
+
+    def _inserir(self, linhas: List[tuple]) -> None:
+        """
+        Insere linhas (colunas da chave + colunas de dados) na tabela de pendências.
+
+        Args:
+            linhas: Linhas no formato de _linhas_sqlite
+        """
+        colunas = ', '.join(_COLUNAS_CHAVE + CAMPOS_PENDENCIA)
+        marcadores = ', '.join('?' for _ in _COLUNAS_CHAVE + CAMPOS_PENDENCIA)
+        self._conexao.executemany(f'INSERT INTO pendencias ({colunas}) VALUES ({marcadores})', linhas)
+
+    @staticmethod
+    def _linhas_sqlite(tabela: PendenciaTabela) -> List[tuple]:
+        """
+        Converte a tabela em linhas graváveis no SQLite (chave + dados).
+
+        Args:
+            tabela: Pendências
+
+        Returns:
+            List[tuple]: Uma tupla por pendência
+        """
+        colunas = [
+            [_valor_para_sqlite(valor) for valor in tabela.valores(campo)]
+            for campo in CAMPOS_PENDENCIA
+        ]
+        return [
+            (*chave, *valores)
+            for chave, valores in zip(tabela.chaves_reconciliacao(), zip(*colunas))
+        ]
+
+    @staticmethod
+    def _tabela_de_linhas(linhas: List[tuple]) -> PendenciaTabela:
+        """
+        Monta uma PendenciaTabela a partir das linhas lidas do SQLite.
+
+        Args:
+            linhas: Linhas com as colunas de dados, na ordem de CAMPOS_PENDENCIA
+
+        Returns:
+            PendenciaTabela: Pendências lidas
+        """
+        colunas = {campo: list(valores) for campo, valores in zip(CAMPOS_PENDENCIA, zip(*linhas))}
+        if colunas:
+            colunas['DATA_EXTRATO'] = [_data_de_sqlite(valor) for valor in colunas['DATA_EXTRATO']]
+        return PendenciaTabela(pd.DataFrame(colunas, columns=list(CAMPOS_PENDENCIA)))
+
+
+def _valor_para_sqlite(valor):
+    """
+    Converte um valor de pendência para um tipo aceito pelo SQLite.
+
+    Args:
+        valor: Valor da célula
+
+    Returns:
+        Valor equivalente (datas em texto ISO 8601, escalares NumPy como tipos Python)
+    """
+    if isinstance(valor, datetime):
+        return valor.isoformat(sep=' ')
+    if isinstance(valor, date):
+        return valor.isoformat()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    return valor
+
+
+def _data_de_sqlite(valor):
+    """
+    Converte o texto ISO 8601 gravado em DATA_EXTRATO de volta para datetime.
+
+    Args:
+        valor: Valor lido do SQLite
+
+    Returns:
+        datetime, ou o próprio valor se não for uma data ISO
+    """
+    if isinstance(valor, str):
+        try:
+            return datetime.fromisoformat(valor)
+        except ValueError:
+            return valor
+    return valor
@@ -0,0 +1,244 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from entities.responsavel import Responsavel
+
+
+# Curinga aceito em INFORMACAO_ADICIONAL na sheet 'responsaveis'
+CURINGA = '*'
+
+# Posição exigida para o texto da regra dentro de INFORMACAO_ADICIONAL
+ANCORA_CONTEM = 'contem'    # *TEXTO*
+ANCORA_INICIO = 'inicio'    # TEXTO*
+ANCORA_FIM = 'fim'          # *TEXTO
+
+
+class RegrasResponsaveis:
+    """
+    Regras de responsável com curinga ('*') em INFORMACAO_ADICIONAL, compiladas.
+
+    As regras sem curinga continuam no dicionário de chave exata
+    (NOME_BANCO + INFORMACAO_ADICIONAL + TIPO_TRANSACAO), que tem prioridade.
+    As regras com curinga aceitam:
+    - '*TEXTO*': INFORMACAO_ADICIONAL contém TEXTO
+    - 'TEXTO*': INFORMACAO_ADICIONAL começa com TEXTO
+    - '*TEXTO': INFORMACAO_ADICIONAL termina com TEXTO
+    - '*': qualquer INFORMACAO_ADICIONAL do banco/tipo
+
+    As regras de cada NOME_BANCO + TIPO_TRANSACAO são compiladas em um único
+    autômato Aho-Corasick: cada INFORMACAO_ADICIONAL é percorrida uma vez,
+    em tempo proporcional ao seu tamanho, qualquer que seja o número de regras.
+    Se mais de uma regra servir, vale a que aparece primeiro na sheet.
+
+    Regras com curinga no meio do texto não são aceitas: ficam em
+    `regras_ignoradas`, para quem carregou as regras reportá-las.
+
+    Uso:
+        regras = RegrasResponsaveis(responsaveis)
+        responsavel = regras.buscar(nome_banco, informacao_adicional, tipo_transacao)
+    """
+
+    def __init__(self, responsaveis: Iterable[Responsavel]):
+        """
+        Args:
+            responsaveis: Registros da sheet 'responsaveis' (os sem curinga são ignorados)
+        """
+        # (NOME_BANCO, TIPO_TRANSACAO) -> regras na ordem da sheet: (ordem, texto, âncora, responsável)
+        regras_por_grupo: Dict[Tuple[str, str], List[Tuple[int, str, str, Responsavel]]] = {}
+        self._quantidade = 0
+        # Registros com curinga em posição não aceita, na ordem da sheet
+        self.regras_ignoradas: List[Responsavel] = []
+
+        for ordem, responsavel in enumerate(responsaveis):
+            padrao = _texto(responsavel.INFORMACAO_ADICIONAL)
+            if CURINGA not in padrao:
+                continue
+
+            regra = _interpretar_padrao(padrao)
+            if regra is None:
+                self.regras_ignoradas.append(responsavel)
+                continue
+
+            texto, ancora = regra
+            grupo = (_texto(responsavel.NOME_BANCO), _texto(responsavel.TIPO_TRANSACAO))
+            regras_por_grupo.setdefault(grupo, []).append((ordem, texto, ancora, responsavel))
+            self._quantidade += 1
+
+        self._grupos = {grupo: _GrupoRegras(regras) for grupo, regras in regras_por_grupo.items()}
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    def buscar(self, nome_banco: str, informacao_adicional: str, tipo_transacao: str) -> Optional[Responsavel]:
+        """
+        Busca a primeira regra com curinga que atende à transação.
+
+        Args:
+            nome_banco: NOME_BANCO da transação ("" se vazio)
+            informacao_adicional: INFORMACAO_ADICIONAL da transação ("" se vazio)
+            tipo_transacao: TIPO_TRANSACAO da transação ("" se vazio)
+
+        Returns:
+            Optional[Responsavel]: Responsável da regra encontrada, ou None
+        """
+        grupo = self._grupos.get((nome_banco, tipo_transacao))
+        if grupo is None:
+            return None
+        return grupo.buscar(informacao_adicional)
+
+
+class _GrupoRegras:
+    """
+    Regras com curinga de um NOME_BANCO + TIPO_TRANSACAO e o autômato dos seus textos.
+    """
+
+    def __init__(self, regras: List[Tuple[int, str, str, Responsavel]]):
+        """
+        Args:
+            regras: (ordem na sheet, texto, âncora, responsável), em ordem crescente
+        """
+        # Regra '*' de menor ordem: atende a qualquer texto
+        self._regra_geral: Optional[Tuple[int, Responsavel]] = None
+
+        # Textos distintos do autômato e as regras de cada um (em ordem crescente)
+        textos: Dict[str, int] = {}
+        self._regras_por_texto: List[List[Tuple[int, str, Responsavel]]] = []
+        self._tamanhos: List[int] = []
+
+        for ordem, texto, ancora, responsavel in regras:
+            if not texto:
+                if self._regra_geral is None:
+                    self._regra_geral = (ordem, responsavel)
+                continue
+            if texto not in textos:
+                textos[texto] = len(self._regras_por_texto)
+                self._regras_por_texto.append([])
+                self._tamanhos.append(len(texto))
+            self._regras_por_texto[textos[texto]].append((ordem, ancora, responsavel))
+
+        self._automato = _AutomatoAhoCorasick(list(textos))
+
+    def buscar(self, informacao_adicional: str) -> Optional[Responsavel]:
+        """
+        Percorre o texto uma vez e escolhe a regra de menor ordem que o atende.
+
+        Args:
+            informacao_adicional: INFORMACAO_ADICIONAL da transação
+
+        Returns:
+            Optional[Responsavel]: Responsável encontrado, ou None
+        """
+        melhor = self._regra_geral
+        ultima_posicao = len(informacao_adicional) - 1
+
+        for indice_texto, fim in self._automato.buscar(informacao_adicional):
+            inicio = fim - self._tamanhos[indice_texto] + 1
+            for ordem, ancora, responsavel in self._regras_por_texto[indice_texto]:
+                if melhor is not None and ordem >= melhor[0]:
+                    # Regras em ordem crescente: as seguintes também perdem
+                    break
+                if (ancora == ANCORA_CONTEM
+                        or (ancora == ANCORA_INICIO and inicio == 0)
+                        or (ancora == ANCORA_FIM and fim == ultima_posicao)):
+                    melhor = (ordem, responsavel)
+                    break
+
+        return melhor[1] if melhor is not None else None
+
+
+class _AutomatoAhoCorasick:
+    """
+    Autômato de Aho-Corasick: localiza todas as ocorrências de vários textos em uma única passada.
+    """
+
+    def __init__(self, padroes: List[str]):
+        """
+        Args:
+            padroes: Textos a localizar (não vazios e distintos)
+        """
+        # Estado 0 é a raiz. Para cada estado: transições, ligação de falha,
+        # padrão que termina nele (-1 se nenhum) e próximo estado com padrão na cadeia de falhas
+        self._transicoes: List[Dict[str, int]] = [{}]
+        self._falha: List[int] = [0]
+        self._padrao: List[int] = [-1]
+        self._saida: List[int] = [-1]
+
+        for indice, padrao in enumerate(padroes):
+            estado = 0
+            for caractere in padrao:
+                proximo = self._transicoes[estado].get(caractere)
+                if proximo is None:
+                    proximo = len(self._transicoes)
+                    self._transicoes[estado][caractere] = proximo
+                    self._transicoes.append({})
+                    self._falha.append(0)
+                    self._padrao.append(-1)
+                    self._saida.append(-1)
+                estado = proximo
+            self._padrao[estado] = indice
+
+        # Ligações de falha em largura (estados mais rasos primeiro)
+        fila = deque(self._transicoes[0].values())
+        while fila:
+            estado = fila.popleft()
+            for caractere, proximo in self._transicoes[estado].items():
+                falha = self._falha[estado]
+                while falha and caractere not in self._transicoes[falha]:
+                    falha = self._falha[falha]
+                destino = self._transicoes[falha].get(caractere, 0)
+                self._falha[proximo] = destino if destino != proximo else 0
+                alvo = self._falha[proximo]
+                self._saida[proximo] = alvo if self._padrao[alvo] >= 0 else self._saida[alvo]
+                fila.append(proximo)
+
+    def buscar(self, texto: str) -> Iterator[Tuple[int, int]]:
+        """
+        Localiza as ocorrências dos padrões no texto.
+
+        Args:
+            texto: Texto a percorrer
+
+        Yields:
+            Tuple[int, int]: (índice do padrão, posição do último caractere da ocorrência)
+        """
+        transicoes = self._transicoes
+        falhas = self._falha
+        estado = 0
+        for posicao, caractere in enumerate(texto):
+            while estado and caractere not in transicoes[estado]:
+                estado = falhas[estado]
+            estado = transicoes[estado].get(caractere, 0)
+
+            encontrado = estado if self._padrao[estado] >= 0 else self._saida[estado]
+            while encontrado > 0:
+                yield self._padrao[encontrado], posicao
+                encontrado = self._saida[encontrado]
+
+
+def _interpretar_padrao(padrao: str) -> Optional[Tuple[str, str]]:
+    """
+    Separa o texto e a âncora de um padrão com curinga.
+
+    Args:
+        padrao: INFORMACAO_ADICIONAL da regra (contém '*')
+
+    Returns:
+        Tuple[str, str]: (texto sem curingas, âncora), ou None se houver curinga no meio do texto
+    """
+    inicio_livre = padrao.startswith(CURINGA)
+    fim_livre = padrao.endswith(CURINGA)
+    texto = padrao.strip(CURINGA)
+
+    if CURINGA in texto:
+        return None
+    if inicio_livre and fim_livre:
+        return texto, ANCORA_CONTEM
+    if fim_livre:
+        return texto, ANCORA_INICIO
+    return texto, ANCORA_FIM
+
+
+def _texto(valor) -> str:
+    """
+    Converte um campo para texto, com "" para vazio (mesma conversão da chave exata).
+    """
+    return str(valor) if valor is not None else ""
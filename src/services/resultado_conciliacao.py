@@ -0,0 +1,132 @@
+import numpy as np
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterable, List, Optional, Union
+from entities.pendencia import Pendencia
+from entities.pendencia_tabela import PendenciaTabela
+
+
+# Situação da chave de cada nova transação (ResultadoConciliacao.situacao_chaves)
+CHAVE_REPETIDA = 0  # Chave já vista em uma transação anterior
+CHAVE_PRESERVADA = 1  # Primeira ocorrência de chave com pendência existente
+CHAVE_ADICIONADA = 2  # Primeira ocorrência de chave sem pendência existente
+
+
+@dataclass
+class ResultadoConciliacao:
+    """
+    Resultado de uma conciliação: pendências consolidadas e contadores coletados durante o processo.
+
+    Os contadores são acumulados pelos motores de conciliação enquanto percorrem
+    os dados (índice de pendências, pareamento das chaves e enriquecimento pelo
+    DePara), sem nova passagem sobre as entradas ao final.
+
+    A situação da chave de cada transação (situacao_chaves) também é guardada,
+    um byte por transação, para as estatísticas de intervalos de transações
+    (ex.: por arquivo de entrada) sem reprocessar as chaves.
+    """
+    pendencias: Union[List[Pendencia], PendenciaTabela] = field(default_factory=list)
+    # CHAVE_REPETIDA, CHAVE_PRESERVADA ou CHAVE_ADICIONADA, na ordem das transações
+    situacao_chaves: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.uint8))
+
+    # Chaves de reconciliação
+    total_pendencias_existentes: int = 0
+    total_novas_transacoes: int = 0
+    chaves_unicas_existentes: int = 0
+    chaves_unicas_novas: int = 0
+    chaves_duplicadas_existentes: int = 0  # Chaves com mais de uma pendência existente
+    chaves_duplicadas_novas: int = 0  # Chaves com mais de uma nova transação
+    pendencias_preservadas: int = 0  # Chaves das novas transações com pendência existente
+    novas_pendencias_adicionadas: int = 0  # Chaves das novas transações sem pendência existente
+    pendencias_correspondidas: int = 0  # Pares transação x pendência existente
+
+    # Enriquecimento pelo DePara (linhas com o campo vazio)
+    responsaveis_regra_exata: int = 0
+    responsaveis_regra_curinga: int = 0
+    responsaveis_sem_regra: int = 0
+    departamentos_encontrados: int = 0
+    departamentos_sem_regra: int = 0
+
+    @classmethod
+    def combinar(cls, resultados: Iterable['ResultadoConciliacao'],
+                 pendencias: Union[List[Pendencia], PendenciaTabela],
+                 situacao_chaves: Optional[np.ndarray] = None) -> 'ResultadoConciliacao':
+        """
+        Soma os contadores de conciliações parciais.
+
+        Os contadores se somam quando as partes têm conjuntos de chaves
+        disjuntos (ex.: fatias por conta) ou foram consolidadas em sequência
+        com o mesmo índice e as mesmas ocorrências de chaves (ex.: lotes).
+
+        Args:
+            resultados: Resultados a combinar
+            pendencias: Pendências consolidadas do resultado combinado
+            situacao_chaves: Situação da chave de cada transação do resultado combinado
+                (padrão: a dos resultados, concatenada na ordem recebida)
+
+        Returns:
+            ResultadoConciliacao: Resultado com os contadores somados
+        """
+        resultados = list(resultados)
+        if situacao_chaves is None:
+            situacao_chaves = np.concatenate(
+                [np.zeros(0, dtype=np.uint8)] + [resultado.situacao_chaves for resultado in resultados]
+            )
+        contadores = {
+            campo.name: sum(getattr(resultado, campo.name) for resultado in resultados)
+            for campo in fields(cls)
+            if campo.name not in ('pendencias', 'situacao_chaves')
+        }
+        return cls(pendencias=pendencias, situacao_chaves=situacao_chaves, **contadores)
+
+    def estatisticas(self) -> Dict[str, int]:
+        """
+        Estatísticas da consolidação, com as mesmas chaves de
+        ConciliacaoService.obter_estatisticas_consolidacao e os contadores adicionais.
+
+        Returns:
+            Dict[str, int]: Estatísticas do processo
+        """
+        return {
+            'total_pendencias_existentes': self.total_pendencias_existentes,
+            'total_novas_transacoes': self.total_novas_transacoes,
+            'total_consolidadas': len(self.pendencias),
+            'pendencias_preservadas': self.pendencias_preservadas,
+            'novas_pendencias_adicionadas': self.novas_pendencias_adicionadas,
+            'chaves_unicas_existentes': self.chaves_unicas_existentes,
+            'chaves_unicas_novas': self.chaves_unicas_novas,
+            'pendencias_correspondidas': self.pendencias_correspondidas,
+            'transacoes_sem_correspondencia': self.total_novas_transacoes - self.pendencias_correspondidas,
+            'pendencias_existentes_sem_correspondencia': (
+                self.total_pendencias_existentes - self.pendencias_correspondidas
+            ),
+            'chaves_duplicadas_existentes': self.chaves_duplicadas_existentes,
+            'chaves_duplicadas_novas': self.chaves_duplicadas_novas,
+            'responsaveis_regra_exata': self.responsaveis_regra_exata,
+            'responsaveis_regra_curinga': self.responsaveis_regra_curinga,
+            'responsaveis_sem_regra': self.responsaveis_sem_regra,
+            'departamentos_encontrados': self.departamentos_encontrados,
+            'departamentos_sem_regra': self.departamentos_sem_regra
+        }
+
+    def estatisticas_intervalo(self, inicio: int, fim: int) -> Dict[str, int]:
+        """
+        Estatísticas das novas transações de um intervalo (ex.: um dos arquivos de entrada).
+
+        Cada chave conta no intervalo da sua primeira ocorrência, de forma que
+        a soma dos intervalos dá os totais de estatisticas().
+
+        Args:
+            inicio: Posição da primeira transação do intervalo
+            fim: Posição seguinte à última transação do intervalo
+
+        Returns:
+            Dict[str, int]: Transações, pendências consolidadas e chaves do intervalo
+        """
+        situacoes = np.bincount(self.situacao_chaves[inicio:fim], minlength=3)
+        return {
+            'total_novas_transacoes': fim - inicio,
+            'total_consolidadas': fim - inicio,
+            'pendencias_preservadas': int(situacoes[CHAVE_PRESERVADA]),
+            'novas_pendencias_adicionadas': int(situacoes[CHAVE_ADICIONADA]),
+            'chaves_unicas_novas': int(situacoes[CHAVE_PRESERVADA] + situacoes[CHAVE_ADICIONADA])
+        }